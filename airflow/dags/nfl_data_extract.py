@@ -1,12 +1,23 @@
 from airflow import DAG
+from airflow.datasets import Dataset
 from datetime import datetime, timedelta
-from airflow.operators.python import PythonOperator
+from airflow.operators.empty import EmptyOperator
+from airflow.operators.python import PythonOperator, ShortCircuitOperator
 from airflow.utils.task_group import TaskGroup
 import sys
 
+sys.path.insert(0, '/opt/airflow/nfl_v3')
 sys.path.insert(0, '/opt/airflow/nfl_v3/airflow')
 
-from utils.nfl_tasks import extract_nfl_data, scrape_fines
+from ingestion.catalog import groups
+from utils.nfl_tasks import (
+    check_upstream,
+    ensure_pools,
+    extract_nfl_data,
+    extract_nfl_season,
+    extract_pbp_incremental,
+    scrape_fines,
+)
 
 default_args = {
     'owner': 'airflow',
@@ -24,195 +35,70 @@ dag = DAG(
     description='Extracting NFL data from various sources and storing in GCS. From GCS - data goes to BigQuery and transformed '
                 'via dbt.',
     schedule_interval='0 5 * * 5',  # for now, setting to Friday at 5am after prior week fines assessed.
-    # TODO: evaluate frequency of updates for injuries + roster moves, that may warrant more frequent runs
+    # injuries, depth charts and weekly rosters are also refreshed every few hours
+    # in season by nfl_in_season_refresh
     catchup=False,
     tags=['nfl', 'data-pipeline'],
     doc_md=""
 )
 
-season_selection = [2015, 2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025]
-recent_seasons = [2020, 2021, 2022, 2023, 2024, 2025]
-limited_seasons = [2020, 2021, 2022, 2023, 2024] # For functions that don't have 2025 yet.
-
-# Game Data
-with TaskGroup(group_id='core_game_data', dag=dag) as core_game_group:
-    extract_schedules = PythonOperator(
-        task_id='extract_schedules',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'schedules',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_pbp = PythonOperator(
-        task_id='extract_pbp',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'pbp',
-            'seasons': recent_seasons},
-        dag=dag
-    )
-
-# Roster & Team Data
-with TaskGroup(group_id='roster_team_data', dag=dag) as roster_team_group:
-    extract_rosters = PythonOperator(
-        task_id='extract_rosters',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'rosters',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_rosters_weekly = PythonOperator(
-        task_id='extract_rosters_weekly',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'rosters_weekly',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_depth_charts = PythonOperator(
-        task_id='extract_depth_charts',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'depth_charts',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_trades = PythonOperator(
-        task_id='extract_trades',
-        python_callable=extract_nfl_data,
-        op_kwargs={'data_type': 'trades', 'seasons': None},
-        dag=dag
-    )
-
-    extract_players = PythonOperator(
-        task_id='extract_players',
-        python_callable=extract_nfl_data,
-        op_kwargs={'data_type': 'players', 'seasons': None},
-        dag=dag
-    )
-
-    extract_teams = PythonOperator(
-        task_id='extract_teams',
-        python_callable=extract_nfl_data,
-        op_kwargs={'data_type': 'teams', 'seasons': None},
-        dag=dag
-    )
-
-# Player Performance Deets
-
-with TaskGroup(group_id='player_performance_data', dag=dag) as player_performance_group:
-    extract_player_stats = PythonOperator(
-        task_id='extract_player_stats',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'player_stats',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_snap_counts = PythonOperator(
-        task_id='extract_snap_counts',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'snap_counts',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_nextgen_stats = PythonOperator(
-        task_id='extract_nextgen_stats',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'nextgen_stats',
-            'seasons': limited_seasons},
-        dag=dag
-    )
-
-    extract_participation = PythonOperator(
-        task_id='extract_participation',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'participation',
-            'seasons': limited_seasons},
-        dag=dag
-    )
-
-# additional data
-with TaskGroup(group_id='additional_context', dag=dag) as additional_context_group:
-    extract_officials = PythonOperator(
-        task_id='extract_officials',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'officials',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_combine = PythonOperator(
-        task_id='extract_combine',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'combine',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_draft_picks = PythonOperator(
-        task_id='extract_draft_picks',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'draft_picks',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_contracts = PythonOperator(
-        task_id='extract_contracts',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'contracts',
-            'seasons': None},
-        dag=dag
-    )
-
-# Fantasy Data
-with TaskGroup(group_id='fantasy_data', dag=dag) as fantasy_group:
-    extract_ff_playerids = PythonOperator(
-        task_id='extract_ff_playerids',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'ff_playerids',
-            'seasons': None},
-        dag=dag
-    )
-
-    extract_ff_opportunity = PythonOperator(
-        task_id='extract_ff_opportunity',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'ff_opportunity',
-            'seasons': season_selection},
-        dag=dag
-    )
-
-    extract_ff_rankings = PythonOperator(
-        task_id='extract_ff_rankings',
-        python_callable=extract_nfl_data,
-        op_kwargs={
-            'data_type': 'ff_rankings',
-            'seasons': None},
-        dag=dag
-    )
-
-# Fines Scraper
-scrape_fines_task = PythonOperator(
-    task_id='scrape_fines',
-    python_callable=scrape_fines,
+# run before anything that uses the pools
+create_pools = PythonOperator(
+    task_id='ensure_pools',
+    python_callable=ensure_pools,
     dag=dag
 )
+
+# one task group per catalog group. Each nflreadpy dataset first checks which
+# of its seasons changed upstream; the check short-circuits the extract when
+# nothing did, and otherwise the extract is mapped over the changed seasons
+# (one instance for datasets extracted whole).
+# Each dataset's raw Dataset is published once all of its files and manifests
+# are written, which starts that dataset's load DAG (see nfl_data_load.py). It's
+# published after a skipped extract too, so dbt isn't left waiting on it; the
+# load then finds nothing new and runs no job.
+for group_id, specs in groups().items():
+    with TaskGroup(group_id=group_id, dag=dag) as group:
+        for spec in specs:
+            if spec.source == 'fines_scraper':
+                if spec.name != 'fines':
+                    continue  # written by the same scrape as fines
+                task = PythonOperator(
+                    task_id='scrape_fines',
+                    python_callable=scrape_fines,
+                    outlets=[Dataset(s.raw_uri) for s in specs if s.source == 'fines_scraper'],
+                    dag=dag
+                )
+                create_pools >> task
+                continue
+
+            if spec.incremental:
+                # weekly runs only pull new/changed games; full backfills go through
+                # scripts/nfl_data_ingest.py
+                extract_callable = extract_pbp_incremental
+            elif spec.by_season:
+                extract_callable = extract_nfl_season
+            else:
+                extract_callable = extract_nfl_data
+
+            check = ShortCircuitOperator(
+                task_id=f'check_{spec.name}',
+                python_callable=check_upstream,
+                op_kwargs={'data_type': spec.name},
+                ignore_downstream_trigger_rules=False,  # only skip the extract
+                dag=dag
+            )
+            extract = PythonOperator.partial(
+                task_id=f'extract_{spec.name}',
+                python_callable=extract_callable,
+                pool=spec.pool,
+                dag=dag
+            ).expand(op_kwargs=check.output)
+            # one event once every season is written, rather than one per season
+            publish = EmptyOperator(
+                task_id=f'publish_{spec.name}',
+                outlets=[Dataset(spec.raw_uri)],
+                trigger_rule='none_failed',
+                dag=dag
+            )
+            create_pools >> check >> extract >> publish
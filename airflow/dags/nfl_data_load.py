@@ -1,24 +1,23 @@
 from airflow import DAG
+from airflow.datasets import Dataset
 from datetime import datetime, timedelta
 from airflow.operators.python import PythonOperator
-from airflow.sensors.external_task import ExternalTaskSensor
+import logging
 import sys
 
 sys.path.insert(0, '/opt/airflow/nfl_v3')
 sys.path.insert(0, '/opt/airflow/nfl_v3/airflow')
 
-from utils.nfl_tasks import load_to_bigquery
-
-# Map dataset types to their file extensions
-EXTENSION_BY_DATASET = {
-    'fines': '.ndjson',
-    # All other datasets use .parquet (default)
-}
+from ingestion.catalog import CATALOG, get_dataset
+from utils.nfl_tasks import load_to_bigquery, load_partitions_to_bigquery, load_pbp_incremental
 
 def find_latest_gcs_uri(source: str, data_type: str, season: int | None = None) -> str:
     """
     Find the latest GCS file for a given data type.
 
+    Reads the prefix's manifest (written by GCSWriter on every write) and only
+    falls back to listing every blob under the prefix when there isn't one.
+
     Args:
         source: Data source name (e.g., 'nfl')
         data_type: Type of data (e.g., 'fines', 'schedules', 'pbp')
@@ -29,19 +28,25 @@ def find_latest_gcs_uri(source: str, data_type: str, season: int | None = None)
     """
     # Late import to avoid module path issues in scheduler
     from ingestion.config import get_gcs_config
-    from google.cloud import storage
+    from ingestion.storage.gcs_writer import get_storage_client
+    from ingestion.storage.manifest import ManifestStore
 
     config = get_gcs_config()
     prefix_kwargs = {'season': season} if season is not None else {}
     prefix = config.get_raw_path(source, data_type, **prefix_kwargs)
 
-    client = storage.Client(project=config.project_id)
+    client = get_storage_client(config.project_id)
     bucket = client.bucket(config.bucket_name)
 
     # Get expected file extension for this dataset
-    expected_ext = EXTENSION_BY_DATASET.get(data_type, '.parquet')
+    expected_ext = get_dataset(data_type).extension
+
+    latest_uri = ManifestStore(bucket).latest_uri(prefix)
+    if latest_uri and latest_uri.endswith(expected_ext):
+        return latest_uri
 
-    # List blobs under prefix and pick the newest file with correct extension
+    # No manifest yet (files written before manifests existed), so list blobs
+    # under prefix and pick the newest file with correct extension
     newest = None
     for blob in client.list_blobs(bucket, prefix=prefix):
         if not blob.name.endswith(expected_ext):
@@ -57,8 +62,65 @@ def find_latest_gcs_uri(source: str, data_type: str, season: int | None = None)
     return f"gs://{config.bucket_name}/{newest.name}"
 
 def load_latest(data_type: str, season: int | None = None, **context):
+    """
+    Load the latest raw file(s) for a dataset.
+
+    Datasets written as season= partitions (or season=/week=, for fines) are
+    found via the dataset manifest.
+    Only seasons that changed are rewritten, each into its own table partition.
+    When season isn't already a column in the files, every partition is loaded
+    in one replace job with hive partitioning adding the column.
+    """
+    from ingestion.config import get_gcs_config
+    from ingestion.storage.gcs_writer import get_storage_client
+    from ingestion.storage.manifest import ManifestStore
+
+    spec = get_dataset(data_type)
+
+    if season is None:
+        config = get_gcs_config()
+        bucket = get_storage_client(config.project_id).bucket(config.bucket_name)
+        dataset_path = config.get_raw_path('nfl', data_type)
+        manifests = ManifestStore(bucket)
+
+        # small datasets are loaded by the extract task itself
+        if not spec.partition_keys and manifests.loaded_directly(dataset_path):
+            logging.info(f"{data_type} was loaded directly at extract time, skipping")
+            return False
+
+        keys = spec.partition_keys or ('season',)
+        partitions = manifests.partitions(dataset_path, keys=keys)
+
+        if partitions and keys != ('season',):
+            # finer partitions (e.g. fines weeks) carry their keys in the records;
+            # skip files left over from before the dataset was written as parquet
+            return load_to_bigquery(
+                gcs_uri=[entry['uri'] for entry in partitions.values() if entry['uri'].endswith(spec.extension)],
+                table_name=spec.raw_table,
+                data_type=data_type,
+                **context
+            )
+
+        if partitions:
+            if all('season' in entry['keys_in_data'] for entry in partitions.values()):
+                # only seasons that changed are rewritten, into their table partitions
+                return load_partitions_to_bigquery(
+                    partitions=partitions,
+                    table_name=spec.raw_table,
+                    data_type=data_type,
+                    **context
+                )
+
+            return load_to_bigquery(
+                gcs_uri=[entry['uri'] for entry in partitions.values()],
+                table_name=spec.raw_table,
+                hive_partition_prefix=f"gs://{config.bucket_name}/{dataset_path}/",
+                data_type=data_type,
+                **context
+            )
+
     gcs_uri = find_latest_gcs_uri(source='nfl', data_type=data_type, season=season)
-    return load_to_bigquery(gcs_uri=gcs_uri, table_name=data_type, **context)
+    return load_to_bigquery(gcs_uri=gcs_uri, table_name=spec.raw_table, data_type=data_type, **context)
 
 default_args = {
     'owner': 'airflow',
@@ -70,39 +132,39 @@ default_args = {
     'retry_delay': timedelta(minutes=5),
 }
 
-dag = DAG(
-    'nfl_data_load',
-    default_args=default_args,
-    description='Load latest raw files from GCS into BigQuery',
-    schedule_interval='0 6 * * 5',  # run after extract; adjust as needed
-    catchup=False,
-    tags=['nfl', 'load'],
-)
-
-# wait_for_extract = ExternalTaskSensor(
-#     task_id='wait_for_extract',
-#     external_dag_id='nfl_data_pipeline',
-#     allowed_states=['success'],
-#     mode='reschedule',
-#     poke_interval=60,
-#     timeout=6 * 60 * 60,
-#     dag=dag,
-# )
-
-DATASETS = [
-    'schedules', 'pbp',
-    'rosters', 'rosters_weekly', 'depth_charts', 'trades', 'players', 'teams',
-    'player_stats', 'snap_counts', 'nextgen_stats', 'participation',
-    'officials', 'combine', 'draft_picks', 'contracts',
-    'ff_playerids', 'ff_opportunity', 'ff_rankings',
-    'fines',
-]
-
-for name in DATASETS:
-    t = PythonOperator(
-        task_id=f'load_{name}',
-        python_callable=load_latest,
-        op_kwargs={'data_type': name},
-        dag=dag,
+# one DAG per dataset, triggered by the extract publishing the dataset's raw
+# Dataset (after its files and manifests are written), so each load starts as
+# soon as its own extract finishes. The load publishes the raw table's Dataset,
+# which dbt waits on (see nfl_dbt_transform.py).
+for spec in CATALOG:
+    dag = DAG(
+        f'nfl_data_load_{spec.name}',
+        default_args=default_args,
+        description=f'Load {spec.name} from GCS into BigQuery when its extract publishes new files',
+        schedule=[Dataset(spec.raw_uri)],
+        max_active_runs=1,  # queued events fold into the next run
+        catchup=False,
+        tags=['nfl', 'load'],
     )
-    # wait_for_extract >> t
+
+    if spec.incremental:
+        # pbp is extracted incrementally, so append new/changed games rather than reloading
+        PythonOperator(
+            task_id=f'load_{spec.name}',
+            python_callable=load_pbp_incremental,
+            op_kwargs={'table_name': spec.raw_table},
+            outlets=[Dataset(spec.table_uri)],
+            dag=dag,
+        )
+    else:
+        # changed seasons are loaded in parallel inside the task, and a retry
+        # only reloads seasons that aren't marked loaded yet
+        PythonOperator(
+            task_id=f'load_{spec.name}',
+            python_callable=load_latest,
+            op_kwargs={'data_type': spec.name},
+            outlets=[Dataset(spec.table_uri)],
+            dag=dag,
+        )
+
+    globals()[dag.dag_id] = dag
@@ -1,39 +1,32 @@
 import sys
 from datetime import datetime, timedelta
 
+import yaml
 from airflow import DAG
+from airflow.datasets import Dataset
 from airflow.operators.python import PythonOperator
-from airflow.sensors.external_task import ExternalTaskSensor
 
+sys.path.insert(0, '/opt/airflow/nfl_v3')
 sys.path.insert(0, '/opt/airflow/nfl_v3/airflow')
 
+from ingestion.catalog import CATALOG
 from utils.nfl_tasks import run_dbt
 
 
-def get_latest_external_dag_run_date(logical_date, **kwargs):
-    """Returns the execution_date of the most recent successful load DAG run"""
-    from airflow.models import DagRun
-    from airflow.utils.db import create_session
+DBT_SOURCES_PATH = '/opt/airflow/dbt_project/models/staging/nfl/sources.yml'
 
-    external_dag_id = 'nfl_data_load'
 
-    with create_session() as session:
-        latest_run = (
-            session.query(DagRun)
-            .filter(
-                DagRun.dag_id == external_dag_id,
-                DagRun.state == 'success'
-            )
-            .order_by(DagRun.execution_date.desc())
-            .first()
-        )
+def source_table_datasets(path: str = DBT_SOURCES_PATH) -> list[Dataset]:
+    """Datasets of the raw tables the staging models read (nfl_raw in sources.yml)."""
+    with open(path) as f:
+        sources = yaml.safe_load(f)['sources']
+    tables = {
+        table['name']
+        for source in sources if source['name'] == 'nfl_raw'
+        for table in source.get('tables', [])
+    }
+    return [Dataset(spec.table_uri) for spec in CATALOG if spec.raw_table in tables]
 
-        if latest_run:
-            print(f"Found latest successful {external_dag_id} run at {latest_run.execution_date}")
-            return latest_run.execution_date
-
-    print(f"No successful {external_dag_id} run found, using logical_date {logical_date}")
-    return logical_date
 
 default_args = {
     'owner': 'airflow',
@@ -48,28 +41,15 @@ default_args = {
 dag = DAG(
     'nfl_dbt_transform',
     default_args=default_args,
-    description='Transform raw NFL data in BigQuery using dbt after load DAG completes',
-    schedule_interval='0 7 * * 5',
+    description='Transform raw NFL data in BigQuery using dbt once its source tables are loaded',
+    # runs once every raw table the staging models read has been loaded since
+    # the last run
+    schedule=source_table_datasets(),
     catchup=False,
     tags=['nfl', 'dbt', 'transform'],
 )
 
 
-wait_for_load = ExternalTaskSensor(
-    task_id='wait_for_load',
-    external_dag_id='nfl_data_load',
-    external_task_id=None,
-    allowed_states=['success'],
-    failed_states=None,
-    check_existence=True,
-    mode='reschedule',
-    poke_interval=60,
-    timeout=6 * 60 * 60,
-    execution_date_fn=get_latest_external_dag_run_date,
-    dag=dag,
-)
-
-
 run_dbt_staging = PythonOperator(
     task_id='run_dbt_staging',
     python_callable=run_dbt,
@@ -102,5 +82,5 @@ run_dbt_tests = PythonOperator(
 )
 
 
-wait_for_load >> run_dbt_staging >> run_dbt_marts >> run_dbt_tests
+run_dbt_staging >> run_dbt_marts >> run_dbt_tests
 
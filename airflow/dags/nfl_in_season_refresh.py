@@ -0,0 +1,54 @@
+import sys
+from datetime import datetime, timedelta
+
+from airflow import DAG
+from airflow.operators.python import PythonOperator
+
+sys.path.insert(0, '/opt/airflow/nfl_v3')
+sys.path.insert(0, '/opt/airflow/nfl_v3/airflow')
+
+from ingestion.catalog import in_season_datasets
+from utils.nfl_tasks import refresh_in_season, run_dbt_changed
+
+
+default_args = {
+    'owner': 'airflow',
+    'depends_on_past': False,
+    'start_date': datetime(2025, 1, 1),
+    'email_on_failure': False,
+    'email_on_retry': False,
+    'retries': 1,
+    'retry_delay': timedelta(minutes=5),
+}
+
+dag = DAG(
+    'nfl_in_season_refresh',
+    default_args=default_args,
+    description='Refresh the current week of injuries, depth charts and weekly rosters between weekly runs, '
+                'logging changed rows and rebuilding only the affected staging models',
+    # every 3 hours, September through February
+    schedule_interval='0 */3 * 1,2,9-12 *',
+    max_active_runs=1,
+    catchup=False,
+    tags=['nfl', 'in-season'],
+)
+
+# one mapped instance per in_season dataset in the catalog. Each loads its own
+# changes straight into BigQuery rather than publishing its raw Dataset, so the
+# weekly load DAGs and the full dbt run aren't triggered; the weekly run finds
+# the files already loaded.
+refresh = PythonOperator.partial(
+    task_id='refresh',
+    python_callable=refresh_in_season,
+    dag=dag,
+).expand(op_kwargs=[{'data_type': spec.name} for spec in in_season_datasets()])
+
+# rebuild only the staging models of datasets that changed (skipped if none)
+run_dbt_staging = PythonOperator(
+    task_id='run_dbt_changed_staging',
+    python_callable=run_dbt_changed,
+    op_kwargs={'models': refresh.output},
+    dag=dag,
+)
+
+refresh >> run_dbt_staging
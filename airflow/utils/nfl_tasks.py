@@ -1,6 +1,7 @@
 """
 Airflow task functions for NFL data pipeline.
 """
+import logging
 import sys
 sys.path.insert(0, '/opt/airflow/nfl_v3')
 
@@ -8,19 +9,30 @@ from ingestion.nfl.extractor import NFLExtractor
 from ingestion.scrapers.nfl_fines_scraper import NFLFinesScraper
 from ingestion.storage.gcs_writer import GCSWriter
 from ingestion.config import get_gcs_config
+from ingestion.catalog import raw_table
 
+logger = logging.getLogger(__name__)
 
-def extract_nfl_data(data_type, seasons=None, **context):
+
+def extract_nfl_data(data_type, seasons=None, partition_by_season=False, upstream=None, **context):
     """
     Extract NFL data from various sources identified in ~/docs/source-data and write to GCS
 
     Args:
         data_type: Type of NFL data to extract (e.g., 'pbp', 'player_stats', 'rosters')
         seasons: List of season years. If None, uses the default season selection.
+        partition_by_season: If True, extract seasons in parallel and write each to its
+            own season= partition
+        upstream: Upstream release fingerprints from check_upstream, recorded
+            once the data is written
         **context: Airflow context dictionary
 
+    Otherwise, small frames are loaded straight into the raw table here (and
+    archived to GCS), so the load DAG skips them; see NFLExtractor.extract_load.
+
     Returns:
-        str: GCS URI where the data was written
+        str | list[str]: GCS URI where the data was written, or one URI per season
+            when partition_by_season is set
     """
     config = get_gcs_config()
     extractor = NFLExtractor()
@@ -29,50 +41,433 @@ def extract_nfl_data(data_type, seasons=None, **context):
         project_id=config.project_id
     )
 
-    nfl_df, gcs_uri = extractor.extract_write_gcs(
+    extractor.invalidate_changed(data_type, upstream)
+
+    if partition_by_season:
+        uris = extractor.extract_write_gcs_by_season(
+            data_type=data_type,
+            gcs_writer=gcs_writer,
+            seasons=seasons
+        )
+        extractor.record_upstream(data_type, gcs_writer, upstream)
+        return list(uris.values())
+
+    from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
+    from ingestion.config import get_bigquery_config
+
+    bq_config = get_bigquery_config()
+    nfl_df, gcs_uri, loaded = extractor.extract_load(
         data_type=data_type,
         gcs_writer=gcs_writer,
+        bq_loader=GCSToBigQueryLoader(project_id=bq_config.project_id),
+        table_id=f"{config.project_id}.{bq_config.raw_dataset}.{raw_table(data_type)}",
         seasons=seasons
     )
+    if loaded:
+        logger.info(f"{data_type}: loaded {len(nfl_df)} rows directly into BigQuery")
+    extractor.record_upstream(data_type, gcs_writer, upstream)
     return gcs_uri
 
 
-def scrape_fines(**context):
+def extract_nfl_season(data_type, season, upstream=None, **context):
     """
-    Run NFL.com fines scraper
+    Extract a single season and write it to its own season= partition. Mapped
+    over a dataset's seasons by the extract DAG, so a failed season is retried
+    on its own.
 
     Args:
+        data_type: Type of NFL data to extract
+        season: Season year
+        upstream: Upstream release fingerprint from check_upstream, recorded
+            once the season is written
         **context: Airflow context dictionary
 
     Returns:
-        str: GCS URI where the data was written
+        str: GCS URI of the season's partition ("" if the season had no data)
     """
     config = get_gcs_config()
+    extractor = NFLExtractor()
     gcs_writer = GCSWriter(
         bucket_name=config.bucket_name,
         project_id=config.project_id
     )
 
-    scraper = NFLFinesScraper()
-    gcs_uri = scraper.scrape_and_write(gcs_writer=gcs_writer)
+    extractor.invalidate_changed(data_type, upstream)
+    df, gcs_uri = extractor.extract_write_gcs(
+        data_type=data_type,
+        gcs_writer=gcs_writer,
+        seasons=[season]
+    )
+    logger.info(f"{data_type} season {season}: wrote {len(df)} rows to {gcs_uri or 'nothing'}")
+    extractor.record_upstream(data_type, gcs_writer, upstream)
     return gcs_uri
 
-def load_to_bigquery(gcs_uri, table_name, **context):
 
+def check_upstream(data_type, **context):
+    """
+    Short-circuit callable: which seasons of a dataset changed upstream since
+    they were last extracted (see ingestion/nfl/freshness.py).
+
+    Args:
+        data_type: Dataset in ingestion.catalog
+        **context: Airflow context dictionary
+
+    Returns:
+        list[dict]: op_kwargs for the dataset's extract task, one per changed
+            season for season-partitioned (and incremental) datasets, else a
+            single entry. Empty when nothing changed, which skips the extract.
+    """
+    from ingestion.catalog import get_dataset
+
+    config = get_gcs_config()
+    extractor = NFLExtractor()
+    gcs_writer = GCSWriter(
+        bucket_name=config.bucket_name,
+        project_id=config.project_id
+    )
+
+    spec = get_dataset(data_type)
+    seasons = [extractor.current_season] if spec.incremental else spec.seasons()
+
+    changed = extractor.changed_upstream(data_type, gcs_writer, seasons)
+    if spec.incremental:
+        return [{'season': int(key), 'upstream': {key: fp}} for key, fp in changed.items()]
+    if spec.by_season:
+        return [
+            {'data_type': data_type, 'season': int(key), 'upstream': {key: fp}}
+            for key, fp in changed.items()
+        ]
+    return [{'data_type': data_type, 'seasons': seasons, 'upstream': changed}] if changed else []
+
+
+def ensure_pools(**context):
+    """
+    Create or resize the Airflow pools the extract tasks run in (see
+    ingestion.catalog.POOLS).
+    """
+    from airflow.models.pool import Pool
+    from ingestion.catalog import POOLS
+
+    for name, (slots, description) in POOLS.items():
+        Pool.create_or_update_pool(name=name, slots=slots, description=description, include_deferred=False)
+        logger.info(f"Pool {name}: {slots} slots")
+
+
+def extract_pbp_incremental(season=None, upstream=None, **context):
+    """
+    Extract only new or changed completed pbp games for the current season and
+    write them to season=/week= partitions in GCS.
+
+    Args:
+        season: Season to extract. If None, uses the current season.
+        upstream: Upstream release fingerprint from check_upstream, recorded
+            once the games are written
+        **context: Airflow context dictionary
+
+    Returns:
+        list[str]: GCS URIs written (empty when nothing changed)
+    """
+    from ingestion.nfl import incremental
+
+    config = get_gcs_config()
+    extractor = NFLExtractor()
+    gcs_writer = GCSWriter(
+        bucket_name=config.bucket_name,
+        project_id=config.project_id
+    )
+
+    extractor.invalidate_changed('pbp', upstream)
+    uris = incremental.extract_pbp_incremental(
+        extractor=extractor,
+        gcs_writer=gcs_writer,
+        season=season
+    )
+    extractor.record_upstream('pbp', gcs_writer, upstream)
+    return uris
+
+
+def refresh_in_season(data_type, **context):
+    """
+    Refresh the current week of an in-season dataset (see
+    ingestion/nfl/in_season.py): when rows changed since the last refresh,
+    reload the current season into the raw table and append the changed rows
+    to its change log table.
+
+    Args:
+        data_type: Dataset in ingestion.catalog marked in_season
+        **context: Airflow context dictionary
+
+    Returns:
+        str | None: Staging model to rebuild, or None if nothing changed
+    """
+    from ingestion.catalog import get_dataset
+    from ingestion.nfl.in_season import WeekRefresh
     from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
     from ingestion.config import get_bigquery_config
 
     config = get_gcs_config()
     bq_config = get_bigquery_config()
+    spec = get_dataset(data_type)
+
+    extractor = NFLExtractor()
+    extractor.cache = None  # the current season's cache TTL outlasts the refresh interval
+    gcs_writer = GCSWriter(
+        bucket_name=config.bucket_name,
+        project_id=config.project_id
+    )
+
+    refresh = WeekRefresh(extractor, gcs_writer, data_type)
+    result = refresh.run()
+    if not result.changed:
+        return None
+
+    dataset_path = config.get_raw_path('nfl', data_type)
+    if spec.by_season:
+        # only the refreshed season changed; the other seasons' partitions are left alone
+        season_partition = f"season={result.season}"
+        load_partitions_to_bigquery(
+            partitions={season_partition: gcs_writer.manifests.partitions(dataset_path)[season_partition]},
+            table_name=spec.raw_table,
+            data_type=data_type,
+            **context
+        )
+    else:
+        load_to_bigquery(gcs_uri=result.uri, table_name=spec.raw_table, data_type=data_type, **context)
+
+    bq_loader = GCSToBigQueryLoader(project_id=bq_config.project_id)
+    bq_loader.load_from_gcs(
+        gcs_uri=result.changelog_uri,
+        table_id=f"{config.project_id}.{bq_config.raw_dataset}.{spec.changelog_table}",
+        write_mode='append',
+        schema=gcs_writer.schemas.bigquery_schema(config.get_raw_path('nfl', spec.changelog_table)),
+    )
+
+    # only after both loads, so a failed run is diffed (and loaded) again next time
+    refresh.commit()
+    logger.info(
+        f"{data_type} week {result.week}: loaded {result.added} added and "
+        f"{result.removed} removed rows into {spec.changelog_table}"
+    )
+    return f"stg_{spec.raw_table}"
+
+
+def run_dbt_changed(models, command='run', **context):
+    """
+    Run dbt on just the given models, e.g. the staging models of the datasets
+    an in-season refresh changed. Skipped when there are none.
+
+    Args:
+        models: Model names; None entries (datasets that didn't change) are ignored
+        command: dbt command to run (default: 'run')
+        **context: Airflow context dictionary
+
+    Returns:
+        int: Exit code (0 for success)
+    """
+    from airflow.exceptions import AirflowSkipException
+
+    models = sorted({model for model in models if model})
+    if not models:
+        raise AirflowSkipException("No dataset changed, nothing to rebuild")
+    return run_dbt(command=command, select=' '.join(models), **context)
+
+
+def scrape_fines(**context):
+    """
+    Run NFL.com fines scraper, writing only new or changed weeks
+
+    Args:
+        **context: Airflow context dictionary
+
+    Returns:
+        list[str]: GCS URIs written, fines and week summary per changed week (empty if none changed)
+    """
+    config = get_gcs_config()
+    gcs_writer = GCSWriter(
+        bucket_name=config.bucket_name,
+        project_id=config.project_id
+    )
+
+    scraper = NFLFinesScraper()
+    gcs_uris = scraper.scrape_and_write(gcs_writer=gcs_writer)
+    return gcs_uris
+
+def load_to_bigquery(gcs_uri, table_name, skip_unchanged=True, hive_partition_prefix=None, data_type=None, **context):
+    """
+    Load one or more GCS files into a raw BigQuery table, replacing its contents.
+
+    Args:
+        gcs_uri: GCS URI, or list of URIs (e.g. one per season partition)
+        table_name: BigQuery table name in the raw dataset
+        skip_unchanged: Skip the load when every file's content is already loaded,
+            according to the GCS manifests
+        hive_partition_prefix: gs:// prefix above the partition folders, to load
+            partition keys as columns
+        data_type: NFL data type the files hold. If set (and not hive loading),
+            the table gets the registered schema and the type's partitioning and
+            clustering instead of autodetect
+        **context: Airflow context dictionary
+
+    Returns:
+        bool: True if a load job ran, False if it was skipped
+    """
+    from ingestion.storage.gcs_writer import get_storage_client
+    from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
+    from ingestion.storage.manifest import ManifestStore, path_from_uri
+    from ingestion.schema_registry import SchemaRegistry
+    from ingestion.config import get_bigquery_config, get_table_layout
+
+    config = get_gcs_config()
+    bq_config = get_bigquery_config()
+
+    uris = [gcs_uri] if isinstance(gcs_uri, str) else list(gcs_uri)
+    bucket = get_storage_client(config.project_id).bucket(config.bucket_name)
+    manifests = ManifestStore(bucket)
 
     bq_loader = GCSToBigQueryLoader(project_id=bq_config.project_id)
 
     table_id = f"{config.project_id}.{bq_config.raw_dataset}.{table_name}"
 
+    if skip_unchanged and all(manifests.is_loaded(path_from_uri(uri), uri) for uri in uris):
+        logger.info(f"{table_name}: content unchanged since last load, skipping")
+        bq_loader.record_skip(table_id, uris)
+        return False
+
+    schema = layout = None
+    if data_type and not hive_partition_prefix:
+        schema = SchemaRegistry(manifests).bigquery_schema(config.get_raw_path('nfl', data_type))
+        layout = get_table_layout(data_type)
+
     bq_loader.load_from_gcs(
-        gcs_uri=gcs_uri,
+        gcs_uri=uris,
         table_id=table_id,
-        write_mode='replace'
+        write_mode='replace',
+        hive_partition_prefix=hive_partition_prefix,
+        schema=schema,
+        layout=layout
+    )
+
+    for uri in uris:
+        manifests.mark_loaded(path_from_uri(uri), uri)
+    return True
+
+
+def load_partitions_to_bigquery(partitions, table_name, data_type, **context):
+    """
+    Load season partitions into a season-partitioned raw table, rewriting only
+    the seasons whose content changed since they were last loaded.
+
+    Each changed season is loaded into its table partition (table$2025) with
+    WRITE_TRUNCATE, so other seasons are untouched. If the table doesn't exist
+    yet, or isn't partitioned on season, every season is loaded with a full
+    replace instead, which creates it with the configured layout.
+
+    Args:
+        partitions: Dict of partition suffix (e.g. "season=2025") -> manifest
+            entry with the partition's latest uri, as from ManifestStore.partitions().
+            May be a subset of the dataset's seasons; the full-replace fallback
+            always loads all of them.
+        table_name: BigQuery table name in the raw dataset
+        data_type: NFL data type the files hold
+        **context: Airflow context dictionary
+
+    Returns:
+        bool: True if any load job ran, False if every season was unchanged
+    """
+    from ingestion.storage.gcs_writer import get_storage_client
+    from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader, LoadRequest
+    from ingestion.storage.manifest import ManifestStore, path_from_uri
+    from ingestion.schema_registry import SchemaRegistry
+    from ingestion.config import get_bigquery_config, get_table_layout
+
+    config = get_gcs_config()
+    bq_config = get_bigquery_config()
+
+    bucket = get_storage_client(config.project_id).bucket(config.bucket_name)
+    manifests = ManifestStore(bucket)
+
+    changed = {
+        int(partition.split("=", 1)[1]): entry['uri']
+        for partition, entry in partitions.items()
+        if not manifests.is_loaded(path_from_uri(entry['uri']), entry['uri'])
+    }
+    bq_loader = GCSToBigQueryLoader(project_id=bq_config.project_id)
+    table_id = f"{config.project_id}.{bq_config.raw_dataset}.{table_name}"
+
+    if not changed:
+        logger.info(f"{table_name}: no season changed since last load, skipping")
+        bq_loader.record_skip(table_id, [entry['uri'] for entry in partitions.values()])
+        return False
+    schema = SchemaRegistry(manifests).bigquery_schema(config.get_raw_path('nfl', data_type))
+    layout = get_table_layout(data_type)
+
+    if schema is None or not layout.partition_field or not bq_loader.is_partitioned_on(table_id, layout.partition_field):
+        # a full replace has to include every season, not just the ones passed in
+        logger.info(f"{table_name}: not partitioned on season yet, loading every season")
+        all_partitions = manifests.partitions(config.get_raw_path('nfl', data_type))
+        return load_to_bigquery(
+            gcs_uri=[entry['uri'] for entry in all_partitions.values()],
+            table_name=table_name,
+            skip_unchanged=False,
+            data_type=data_type,
+            **context
+        )
+
+    logger.info(f"{table_name}: replacing partitions for seasons {sorted(changed)}")
+    results = bq_loader.load_many([
+        LoadRequest(
+            gcs_uri=uri,
+            table_id=table_id,
+            write_mode='replace_partition',
+            schema=schema,
+            layout=layout,
+            partition=season,
+        )
+        for season, uri in sorted(changed.items())
+    ])
+
+    failed = []
+    for season, result in zip(sorted(changed), results, strict=True):
+        if not result.ok:
+            failed.append(season)
+            continue
+        manifests.mark_loaded(path_from_uri(result.uris[0]), result.uris[0])
+
+    if failed:
+        raise RuntimeError(f"Failed to load {table_name} partitions for seasons {failed}")
+    return True
+
+
+def load_pbp_incremental(table_name='play_by_play', **context):
+    """
+    Load pending incremental pbp batches, replacing any rows for the same games.
+
+    Args:
+        table_name: BigQuery table name in the raw dataset
+        **context: Airflow context dictionary
+
+    Returns:
+        int: Number of batches loaded
+    """
+    from ingestion.nfl import incremental
+    from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
+    from ingestion.config import get_bigquery_config
+
+    config = get_gcs_config()
+    bq_config = get_bigquery_config()
+
+    gcs_writer = GCSWriter(
+        bucket_name=config.bucket_name,
+        project_id=config.project_id
+    )
+    bq_loader = GCSToBigQueryLoader(project_id=bq_config.project_id)
+
+    table_id = f"{config.project_id}.{bq_config.raw_dataset}.{table_name}"
+
+    return incremental.load_pbp_incremental(
+        bq_loader=bq_loader,
+        gcs_writer=gcs_writer,
+        table_id=table_id
     )
 
 
@@ -4,17 +4,17 @@ with source as (
 
 renamed as (
     select
-          Club as club
-        , Player as player_name
-        , Quarter as quarter
-        , Time as game_time
-        , Fine_Category as fine_category
-        , Description as description
-        , Amount as fine_amount
+          club
+        , player as player_name
+        , quarter
+        , quarter_label
+        , game_time
+        , fine_category
+        , description
+        , amount as fine_amount
+        , season
         , week
-        , JSON_EXTRACT_SCALAR(weekSummary, '$["Total Plays"]') as total_plays
-        , JSON_EXTRACT_SCALAR(weekSummary, '$["Resulting in Fines"]') as resulting_in_fines
-        , JSON_EXTRACT_SCALAR(weekSummary, '$["% of All Plays"]') as pct_of_all_plays
+        , week_label
         , scraped_at
         , source_url
 
@@ -0,0 +1,19 @@
+with source as (
+    select * from {{ source('nfl_raw', 'fines_week_summary') }}
+),
+
+renamed as (
+    select
+          season
+        , week
+        , week_label
+        , total_plays
+        , plays_resulting_in_fines
+        , pct_of_all_plays
+        , scraped_at
+        , source_url
+
+    from source
+)
+
+select * from renamed
@@ -0,0 +1,13 @@
+with source as (
+    select * from {{ source('nfl_raw', 'injuries') }}
+),
+
+final_data as (
+    select 
+      *
+    , current_timestamp() as dbt_loaded_at
+    , '{{ run_started_at }}' as dbt_run_started_at
+    from source
+)
+
+select * from final_data
\ No newline at end of file
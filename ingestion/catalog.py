@@ -0,0 +1,187 @@
+"""
+Catalog of the raw NFL datasets we ingest.
+
+One entry per dataset says where it comes from, which seasons it covers, how
+it's written to GCS and how big it is. The extract and load DAGs and
+scripts/nfl_data_ingest.py are all generated from it, so adding a dataset is a
+one-line change here.
+
+Datasets partitioned by season are extracted one task per (dataset, season)
+with Airflow dynamic task mapping, so seasons run in parallel and a retry only
+re-runs the failed season. Large and medium datasets run in pools that cap how
+many of their seasons are extracted at once (see POOLS).
+
+Availability datasets marked in_season are also refreshed every few hours
+during the season, for the current week only (see ingestion/nfl/in_season.py
+and the nfl_in_season_refresh DAG).
+
+Each dataset's raw_uri and table_uri double as Airflow Dataset URIs: extract
+publishes raw_uri once its files and manifests are written, which triggers
+that dataset's load DAG, and the load publishes table_uri, which triggers dbt.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from ingestion.config import get_bigquery_config, get_gcs_config, get_ingestion_config
+
+DEFAULT_FIRST_SEASON = 2015
+
+# Airflow pool -> (slots, description); small datasets use default_pool
+POOLS = {
+    'nfl_large': (2, "Seasons of large NFL datasets (pbp, participation) extracted at once"),
+    'nfl_medium': (4, "Seasons of medium NFL datasets extracted at once"),
+}
+
+POOL_BY_SIZE = {
+    'large': 'nfl_large',
+    'medium': 'nfl_medium',
+}
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    A raw dataset.
+
+    Attributes:
+        name: Data type, as passed to NFLExtractor and used for the GCS path
+            (raw/nfl/<name>)
+        group: Extract DAG task group
+        table: Raw BigQuery table, if it differs from name
+        source: "nflreadpy", or "fines_scraper" for the NFL.com fines page
+        first_season: First season to extract; None if the source takes no
+            seasons (it always returns everything, or the current season)
+        season_lag: How many seasons behind the current one the source is
+            published (1 = the current season isn't available yet)
+        partition_keys: GCS partition keys, in path order. ('season',) datasets
+            are extracted per season; () datasets as one frame, loaded
+            directly when small
+        format: File format written to GCS
+        size: "small", "medium" or "large"; picks the extract pool
+        incremental: Extracted weekly as new/changed games only (pbp); the
+            full per-season extract is for backfills
+        in_season: Also refreshed every few hours during the season, with the
+            current week's changed rows appended to a change log
+    """
+    name: str
+    group: str
+    table: Optional[str] = None
+    source: str = "nflreadpy"
+    first_season: Optional[int] = DEFAULT_FIRST_SEASON
+    season_lag: int = 0
+    partition_keys: tuple[str, ...] = ()
+    format: str = "parquet"
+    size: str = "small"
+    incremental: bool = False
+    in_season: bool = False
+
+    @property
+    def raw_table(self) -> str:
+        return self.table or self.name
+
+    @property
+    def extension(self) -> str:
+        return f".{self.format}"
+
+    @property
+    def by_season(self) -> bool:
+        return self.partition_keys == ('season',)
+
+    @property
+    def changelog_table(self) -> str:
+        """Raw BigQuery table (and GCS dataset) of the in-season change log."""
+        return f"{self.raw_table}_changelog"
+
+    @property
+    def pool(self) -> str:
+        return POOL_BY_SIZE.get(self.size, 'default_pool')
+
+    @property
+    def raw_uri(self) -> str:
+        """GCS prefix the dataset is written under; its Airflow Dataset URI."""
+        config = get_gcs_config()
+        return f"gs://{config.bucket_name}/{config.get_raw_path('nfl', self.name)}"
+
+    @property
+    def table_uri(self) -> str:
+        """Raw BigQuery table the dataset is loaded into; its Airflow Dataset URI."""
+        config = get_bigquery_config()
+        return f"bigquery://{config.project_id}/{config.raw_dataset}/{self.raw_table}"
+
+    def seasons(self, current_season: Optional[int] = None) -> Optional[list[int]]:
+        """Seasons to extract, or None if the source takes no seasons."""
+        if self.first_season is None:
+            return None
+        current_season = current_season or get_ingestion_config().current_season
+        return list(range(self.first_season, current_season - self.season_lag + 1))
+
+
+CATALOG = [
+    # core game data
+    DatasetSpec('pbp', 'core_game_data', table='play_by_play', partition_keys=('season',),
+                size='large', incremental=True),
+    DatasetSpec('schedules', 'core_game_data', partition_keys=('season',), size='medium'),
+
+    # roster data, including context re: injuries, trades, starter changes, etc.
+    DatasetSpec('rosters', 'roster_team_data', partition_keys=('season',), size='medium'),
+    DatasetSpec('rosters_weekly', 'roster_team_data', partition_keys=('season',), size='medium',
+                in_season=True),
+    DatasetSpec('depth_charts', 'roster_team_data', partition_keys=('season',), size='medium',
+                in_season=True),
+    DatasetSpec('injuries', 'roster_team_data', first_season=None, in_season=True),
+    DatasetSpec('trades', 'roster_team_data', first_season=None),
+    DatasetSpec('players', 'roster_team_data', first_season=None),
+    DatasetSpec('teams', 'roster_team_data', first_season=None),
+
+    # player performance data
+    DatasetSpec('player_stats', 'player_performance_data', partition_keys=('season',), size='medium'),
+    DatasetSpec('snap_counts', 'player_performance_data', partition_keys=('season',), size='medium'),
+    DatasetSpec('nextgen_stats', 'player_performance_data', first_season=2020, season_lag=1,
+                partition_keys=('season',), size='medium'),
+    DatasetSpec('participation', 'player_performance_data', first_season=2020, season_lag=1,
+                partition_keys=('season',), size='large'),
+
+    # other stuff
+    DatasetSpec('officials', 'additional_context'),
+    DatasetSpec('combine', 'additional_context'),
+    DatasetSpec('draft_picks', 'additional_context'),
+    DatasetSpec('contracts', 'additional_context', first_season=None),
+
+    # fantasy
+    DatasetSpec('ff_playerids', 'fantasy_data', first_season=None),
+    DatasetSpec('ff_opportunity', 'fantasy_data', partition_keys=('season',), size='medium'),
+    DatasetSpec('ff_rankings', 'fantasy_data', first_season=None),
+
+    # NFL.com fines page (current season only; see scripts/backfill_fines.py)
+    DatasetSpec('fines', 'fines', source='fines_scraper', first_season=None,
+                partition_keys=('season', 'week')),
+    DatasetSpec('fines_week_summary', 'fines', source='fines_scraper', first_season=None,
+                partition_keys=('season', 'week')),
+]
+
+DATASETS = {spec.name: spec for spec in CATALOG}
+
+
+def get_dataset(name: str) -> DatasetSpec:
+    if name not in DATASETS:
+        raise ValueError(f"Unknown dataset '{name}'. Available: {list(DATASETS)}")
+    return DATASETS[name]
+
+
+def raw_table(data_type: str) -> str:
+    """Raw BigQuery table for a data type (the data type itself if it isn't cataloged)."""
+    spec = DATASETS.get(data_type)
+    return spec.raw_table if spec else data_type
+
+
+def groups() -> dict[str, list[DatasetSpec]]:
+    """Datasets by extract DAG task group, in catalog order."""
+    by_group: dict[str, list[DatasetSpec]] = {}
+    for spec in CATALOG:
+        by_group.setdefault(spec.group, []).append(spec)
+    return by_group
+
+
+def in_season_datasets() -> list[DatasetSpec]:
+    """Datasets refreshed every few hours during the season, in catalog order."""
+    return [spec for spec in CATALOG if spec.in_season]
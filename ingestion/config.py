@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +15,32 @@ DEFAULT_ML_DATASET = "nfl_ml"
 DEFAULT_BATCH_SIZE = 10000
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 5
+DEFAULT_CURRENT_SEASON = 2025
+DEFAULT_MAX_WORKERS = 4
+
+# resumable upload chunks must be a multiple of 256 KiB
+DEFAULT_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_UPLOAD_RETRY_DEADLINE = 600
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nfl_v3", "extract")
+DEFAULT_CACHE_MAX_BYTES = 5 * 1024**3
+DEFAULT_CACHE_CURRENT_SEASON_TTL = 6 * 60 * 60
+DEFAULT_CACHE_UNSEASONED_TTL = 24 * 60 * 60
+
+# frames up to this in-memory size load straight into BigQuery, skipping GCS
+DEFAULT_DIRECT_LOAD_MAX_BYTES = 32 * 1024 * 1024
+
+DEFAULT_LOAD_METRICS_PATH = os.path.join(os.path.expanduser("~"), ".cache", "nfl_v3", "load_metrics.jsonl")
+
+DEFAULT_SCRAPER_TIMEOUT = 30
+DEFAULT_FINES_URL = 'https://operations.nfl.com/inside-football-ops/rules-enforcement/gameday-accountability/'
+DEFAULT_FINES_ARCHIVE_URL = 'https://web.archive.org/web'
+
+# fines backfill: requests in flight, requests per second, retries per page
+DEFAULT_BACKFILL_CONCURRENCY = 4
+DEFAULT_BACKFILL_RATE = 1.0
+DEFAULT_BACKFILL_RETRIES = 4
 
 
 @dataclass
@@ -24,6 +51,11 @@ class BigQueryConfig:
     analytics_dataset: str
     ml_dataset: str
     location: str = "US"
+    # point the client at a local stand-in (e.g. a BigQuery emulator) instead of GCP
+    api_endpoint: Optional[str] = None
+    # where load-job metrics go: a JSON-lines file and/or a table ("" disables)
+    load_metrics_path: str = DEFAULT_LOAD_METRICS_PATH
+    load_metrics_table: str = ""
 
     @classmethod
     def from_env(cls) -> "BigQueryConfig":
@@ -33,6 +65,9 @@ class BigQueryConfig:
             staging_dataset=DEFAULT_STAGING_DATASET,
             analytics_dataset=DEFAULT_ANALYTICS_DATASET,
             ml_dataset=DEFAULT_ML_DATASET,
+            api_endpoint=os.getenv("BIGQUERY_API_ENDPOINT") or None,
+            load_metrics_path=os.getenv("LOAD_METRICS_PATH", DEFAULT_LOAD_METRICS_PATH),
+            load_metrics_table=os.getenv("LOAD_METRICS_TABLE", ""),
         )
 
 
@@ -41,6 +76,22 @@ class IngestionConfig:
     batch_size: int = DEFAULT_BATCH_SIZE
     max_retries: int = DEFAULT_MAX_RETRIES
     retry_delay: int = DEFAULT_RETRY_DELAY
+    current_season: int = DEFAULT_CURRENT_SEASON
+    max_workers: int = DEFAULT_MAX_WORKERS
+    # drop raw columns no dbt staging model reads before writing parquet
+    project_columns: bool = True
+    # downcast/categorise/sort frames before writing parquet
+    optimize_dtypes: bool = True
+    measure_file_sizes: bool = False
+    # small frames load straight into BigQuery; 0 disables
+    direct_load_max_bytes: int = DEFAULT_DIRECT_LOAD_MAX_BYTES
+    # also archive directly loaded frames to GCS (in the background)
+    archive_direct_loads: bool = True
+    # skip datasets whose upstream release files haven't changed since last extract
+    check_upstream: bool = True
+    # serve release files from <url>/<repository>/<path> instead of nflreadpy's
+    # URLs, e.g. a local stand-in; "" uses nflreadpy's
+    upstream_base_url: str = ""
 
     @classmethod
     def from_env(cls) -> "IngestionConfig":
@@ -48,6 +99,68 @@ class IngestionConfig:
             batch_size=int(os.getenv("INGESTION_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))),
             max_retries=int(os.getenv("INGESTION_MAX_RETRIES", str(DEFAULT_MAX_RETRIES))),
             retry_delay=int(os.getenv("INGESTION_RETRY_DELAY", str(DEFAULT_RETRY_DELAY))),
+            current_season=int(os.getenv("NFL_CURRENT_SEASON", str(DEFAULT_CURRENT_SEASON))),
+            max_workers=int(os.getenv("INGESTION_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+            project_columns=os.getenv("INGESTION_PROJECT_COLUMNS", "true").lower() == "true",
+            optimize_dtypes=os.getenv("INGESTION_OPTIMIZE_DTYPES", "true").lower() == "true",
+            measure_file_sizes=os.getenv("INGESTION_MEASURE_FILE_SIZES", "false").lower() == "true",
+            direct_load_max_bytes=int(
+                os.getenv("INGESTION_DIRECT_LOAD_MAX_BYTES", str(DEFAULT_DIRECT_LOAD_MAX_BYTES))
+            ),
+            archive_direct_loads=os.getenv("INGESTION_ARCHIVE_DIRECT_LOADS", "true").lower() == "true",
+            check_upstream=os.getenv("INGESTION_CHECK_UPSTREAM", "true").lower() == "true",
+            upstream_base_url=os.getenv("NFL_UPSTREAM_BASE_URL", ""),
+        )
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = True
+    cache_dir: str = DEFAULT_CACHE_DIR
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    # closed seasons never expire; these cover data that can still change
+    current_season_ttl: int = DEFAULT_CACHE_CURRENT_SEASON_TTL
+    unseasoned_ttl: int = DEFAULT_CACHE_UNSEASONED_TTL
+
+    @classmethod
+    def from_env(cls) -> "CacheConfig":
+        return cls(
+            enabled=os.getenv("NFL_CACHE_ENABLED", "true").lower() == "true",
+            cache_dir=os.getenv("NFL_CACHE_DIR", DEFAULT_CACHE_DIR),
+            max_bytes=int(os.getenv("NFL_CACHE_MAX_BYTES", str(DEFAULT_CACHE_MAX_BYTES))),
+            current_season_ttl=int(
+                os.getenv("NFL_CACHE_CURRENT_SEASON_TTL", str(DEFAULT_CACHE_CURRENT_SEASON_TTL))
+            ),
+            unseasoned_ttl=int(
+                os.getenv("NFL_CACHE_UNSEASONED_TTL", str(DEFAULT_CACHE_UNSEASONED_TTL))
+            ),
+        )
+
+
+@dataclass
+class ScraperConfig:
+    timeout: int = DEFAULT_SCRAPER_TIMEOUT
+    # backend in ingestion/scrapers/fines_parser.py
+    fines_parser: str = "lxml"
+    fines_url: str = DEFAULT_FINES_URL
+    # Wayback Machine (or a local stand-in) serving past copies of fines_url
+    fines_archive_url: str = DEFAULT_FINES_ARCHIVE_URL
+    backfill_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY
+    backfill_rate: float = DEFAULT_BACKFILL_RATE
+    backfill_retries: int = DEFAULT_BACKFILL_RETRIES
+
+    @classmethod
+    def from_env(cls) -> "ScraperConfig":
+        return cls(
+            timeout=int(os.getenv("NFL_SCRAPER_TIMEOUT", str(DEFAULT_SCRAPER_TIMEOUT))),
+            fines_parser=os.getenv("NFL_FINES_PARSER", "lxml"),
+            fines_url=os.getenv("NFL_FINES_URL", DEFAULT_FINES_URL),
+            fines_archive_url=os.getenv("NFL_FINES_ARCHIVE_URL", DEFAULT_FINES_ARCHIVE_URL),
+            backfill_concurrency=int(
+                os.getenv("NFL_FINES_BACKFILL_CONCURRENCY", str(DEFAULT_BACKFILL_CONCURRENCY))
+            ),
+            backfill_rate=float(os.getenv("NFL_FINES_BACKFILL_RATE", str(DEFAULT_BACKFILL_RATE))),
+            backfill_retries=int(os.getenv("NFL_FINES_BACKFILL_RETRIES", str(DEFAULT_BACKFILL_RETRIES))),
         )
 
 
@@ -59,12 +172,21 @@ def get_bigquery_config() -> BigQueryConfig:
 class GCSConfig:
     project_id: str
     bucket_name: str
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
+    # parquet is serialised in memory up to this size, then spills to a temp file
+    spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES
+    upload_retry_deadline: int = DEFAULT_UPLOAD_RETRY_DEADLINE
 
     @classmethod
     def from_env(cls) -> "GCSConfig":
         return cls(
             project_id=os.getenv("GCP_PROJECT_ID", ""),
             bucket_name=os.getenv("GCS_RAW_BUCKET", ""),
+            upload_chunk_size=int(os.getenv("GCS_UPLOAD_CHUNK_SIZE", str(DEFAULT_UPLOAD_CHUNK_SIZE))),
+            spool_max_bytes=int(os.getenv("GCS_SPOOL_MAX_BYTES", str(DEFAULT_SPOOL_MAX_BYTES))),
+            upload_retry_deadline=int(
+                os.getenv("GCS_UPLOAD_RETRY_DEADLINE", str(DEFAULT_UPLOAD_RETRY_DEADLINE))
+            ),
         )
 
     def get_raw_path(self, source: str, data_type: str, **partition_keys) -> str:
@@ -74,9 +196,95 @@ class GCSConfig:
         return "/".join(path_parts)
 
 
+@dataclass(frozen=True)
+class ParquetProfile:
+    """How a dataset is serialised to parquet. See scripts/benchmark_parquet_profiles.py."""
+    compression: str = "snappy"  # snappy, zstd, lz4, gzip, uncompressed
+    compression_level: Optional[int] = None
+    row_group_size: Optional[int] = None  # rows; None = writer default
+    use_dictionary: bool = True
+    statistics: bool = True
+
+
+DEFAULT_PARQUET_PROFILE = ParquetProfile()
+
+# large, repetitive datasets trade a little encode time for much smaller files;
+# tiny reference tables keep snappy with a single row group and no statistics
+PARQUET_PROFILES = {
+    'pbp': ParquetProfile(compression="zstd", compression_level=3, row_group_size=250_000),
+    'participation': ParquetProfile(compression="zstd", compression_level=3, row_group_size=250_000),
+    'player_stats': ParquetProfile(compression="zstd", compression_level=3, row_group_size=100_000),
+    'rosters_weekly': ParquetProfile(compression="zstd", compression_level=3, row_group_size=100_000),
+    'depth_charts': ParquetProfile(compression="zstd", compression_level=3, row_group_size=100_000),
+    'ff_opportunity': ParquetProfile(compression="zstd", compression_level=3, row_group_size=100_000),
+    'snap_counts': ParquetProfile(compression="zstd", compression_level=3, row_group_size=100_000),
+    'teams': ParquetProfile(statistics=False),
+    'trades': ParquetProfile(statistics=False),
+    'officials': ParquetProfile(statistics=False),
+    'ff_playerids': ParquetProfile(statistics=False),
+    'fines': ParquetProfile(statistics=False),
+    'fines_week_summary': ParquetProfile(statistics=False),
+}
+
+
+def get_parquet_profile(data_type: str) -> ParquetProfile:
+    return PARQUET_PROFILES.get(data_type, DEFAULT_PARQUET_PROFILE)
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """
+    Partitioning and clustering for a raw BigQuery table. Tables are
+    integer-range partitioned on partition_field (one partition per season)
+    when the field is in the table's schema.
+    """
+    partition_field: Optional[str] = "season"
+    partition_start: int = 1999
+    partition_end: int = 2100
+    partition_interval: int = 1
+    clustering_fields: tuple[str, ...] = ()
+
+
+DEFAULT_TABLE_LAYOUT = TableLayout()
+
+# cluster on the keys staging models filter and join on; fields missing from a
+# table's schema are ignored. Keyed by catalog dataset (ingestion.catalog) -
+# only cataloged datasets are loaded, so other keys would never be used.
+TABLE_LAYOUTS = {
+    'pbp': TableLayout(clustering_fields=('game_id', 'posteam', 'play_id')),
+    'participation': TableLayout(clustering_fields=('nflverse_game_id', 'play_id')),
+    'schedules': TableLayout(clustering_fields=('game_id',)),
+    'player_stats': TableLayout(clustering_fields=('player_id', 'week')),
+    'snap_counts': TableLayout(clustering_fields=('game_id', 'pfr_player_id')),
+    'rosters': TableLayout(clustering_fields=('team', 'gsis_id')),
+    'rosters_weekly': TableLayout(clustering_fields=('week', 'team', 'gsis_id')),
+    'depth_charts': TableLayout(clustering_fields=('club_code', 'gsis_id')),
+    'injuries': TableLayout(clustering_fields=('week', 'team', 'gsis_id')),
+    'nextgen_stats': TableLayout(clustering_fields=('player_gsis_id', 'week')),
+    'officials': TableLayout(clustering_fields=('game_id',)),
+    'ff_opportunity': TableLayout(clustering_fields=('player_id', 'week')),
+    'fines': TableLayout(clustering_fields=('week', 'club')),
+    'players': TableLayout(partition_field=None, clustering_fields=('gsis_id',)),
+    'teams': TableLayout(partition_field=None),
+    'ff_playerids': TableLayout(partition_field=None, clustering_fields=('gsis_id',)),
+}
+
+
+def get_table_layout(data_type: str) -> TableLayout:
+    return TABLE_LAYOUTS.get(data_type, DEFAULT_TABLE_LAYOUT)
+
+
 def get_gcs_config() -> GCSConfig:
     return GCSConfig.from_env()
 
 
 def get_ingestion_config() -> IngestionConfig:
     return IngestionConfig.from_env()
+
+
+def get_cache_config() -> CacheConfig:
+    return CacheConfig.from_env()
+
+
+def get_scraper_config() -> ScraperConfig:
+    return ScraperConfig.from_env()
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+import polars as pl
+
+from ingestion.config import CacheConfig, get_cache_config
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractCache:
+    """
+    Local on-disk cache of nflreadpy extractions.
+
+    Each (data_type, season, kwargs) entry is stored as a parquet file with a small
+    JSON sidecar holding its write time and TTL. Closed seasons never expire, the
+    current season and season-less datasets expire after a short TTL, and the
+    least recently used entries are evicted once the cache exceeds its byte budget.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        current_season: int,
+        max_bytes: int,
+        current_season_ttl: int,
+        unseasoned_ttl: int,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.current_season = current_season
+        self.max_bytes = max_bytes
+        self.current_season_ttl = current_season_ttl
+        self.unseasoned_ttl = unseasoned_ttl
+
+    @classmethod
+    def from_config(cls, config: CacheConfig, current_season: int) -> "ExtractCache":
+        return cls(
+            cache_dir=config.cache_dir,
+            current_season=current_season,
+            max_bytes=config.max_bytes,
+            current_season_ttl=config.current_season_ttl,
+            unseasoned_ttl=config.unseasoned_ttl,
+        )
+
+    def _key(self, data_type: str, season: Optional[int], kwargs: dict) -> str:
+        payload = json.dumps(
+            {'data_type': data_type, 'season': season, 'kwargs': kwargs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _paths(self, data_type: str, season: Optional[int], kwargs: dict) -> tuple[Path, Path]:
+        key = self._key(data_type, season, kwargs)
+        base = self.cache_dir / data_type
+        return base / f"{key}.parquet", base / f"{key}.json"
+
+    def _ttl(self, season: Optional[int]) -> Optional[int]:
+        """TTL in seconds for a season, or None if the entry never expires."""
+        if season is None:
+            return self.unseasoned_ttl
+        if season < self.current_season:
+            return None
+        return self.current_season_ttl
+
+    def get(self, data_type: str, season: Optional[int] = None, kwargs: Optional[dict] = None) -> Optional[pl.DataFrame]:
+        """
+        Return the cached frame for an entry, or None on a miss or expired entry.
+        """
+        data_path, meta_path = self._paths(data_type, season, kwargs or {})
+        try:
+            meta = json.loads(meta_path.read_text())
+            ttl = meta.get('ttl')
+            if ttl is not None and time.time() - meta['created_at'] > ttl:
+                logger.info(f"Cache entry for {data_type} season {season} expired")
+                self._remove(data_path, meta_path)
+                return None
+
+            df = pl.read_parquet(data_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {data_type} season {season}: {e}")
+            self._remove(data_path, meta_path)
+            return None
+
+        # mtime doubles as last-access time for LRU eviction
+        os.utime(data_path)
+        logger.info(f"Cache hit for {data_type} season {season} ({len(df)} rows)")
+        return df
+
+    def put(self, df: pl.DataFrame, data_type: str, season: Optional[int] = None, kwargs: Optional[dict] = None) -> None:
+        """Store a frame in the cache, then evict down to the byte budget."""
+        data_path, meta_path = self._paths(data_type, season, kwargs or {})
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write-then-rename so concurrent readers (e.g. season workers) never see partial files
+        tmp_path = data_path.with_suffix(f".{os.getpid()}.tmp")
+        df.write_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, data_path)
+
+        meta = {
+            'data_type': data_type,
+            'season': season,
+            'kwargs': kwargs or {},
+            'created_at': time.time(),
+            'ttl': self._ttl(season),
+        }
+        tmp_meta = meta_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_meta.write_text(json.dumps(meta, default=str))
+        os.replace(tmp_meta, meta_path)
+
+        self.evict()
+
+    def invalidate(self, data_type: str, season: Optional[int] = None) -> int:
+        """
+        Drop every entry for a data type and season (whatever its kwargs), e.g.
+        when the season's release file changed upstream. Closed seasons never
+        expire, so this is the only way a correction to one reaches the cache.
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        for meta_path in (self.cache_dir / data_type).glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (FileNotFoundError, ValueError):
+                continue
+            if meta.get('season') == season:
+                self._remove(meta_path.with_suffix(".parquet"), meta_path)
+                dropped += 1
+
+        if dropped:
+            logger.info(f"Invalidated {dropped} cache entries for {data_type} season {season}")
+        return dropped
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of bytes freed
+        """
+        entries = []
+        for data_path in self.cache_dir.glob("*/*.parquet"):
+            try:
+                stat = data_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, data_path))
+
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        for _, size, data_path in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            self._remove(data_path, data_path.with_suffix(".json"))
+            freed += size
+
+        if freed:
+            logger.info(f"Evicted {freed} bytes from extract cache at {self.cache_dir}")
+        return freed
+
+    def _remove(self, *paths: Path) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+def get_extract_cache(current_season: int) -> Optional[ExtractCache]:
+    """Build the extract cache from env config, or None if caching is disabled."""
+    config = get_cache_config()
+    if not config.enabled:
+        return None
+    return ExtractCache.from_config(config, current_season=current_season)
@@ -1,20 +1,84 @@
 import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Optional
 import polars as pl
 import nflreadpy as nfl
 
+from ingestion.config import (
+    IngestionConfig,
+    get_gcs_config,
+    get_ingestion_config,
+    get_parquet_profile,
+    get_table_layout,
+)
+from ingestion.nfl.cache import ExtractCache, get_extract_cache
+from ingestion.nfl.freshness import ALL_SEASONS, UpstreamFreshness
+from ingestion.nfl.optimize import optimize_frame
+from ingestion.nfl.projection import ColumnProjector
+from ingestion.schema_registry import drop_untyped
+from ingestion.utils.hashing import frame_hash
+
 logger = logging.getLogger(__name__)
 
 
+def _extract_write_season(
+    data_type: str,
+    season: int,
+    bucket_name: str,
+    project_id: Optional[str],
+    kwargs: dict,
+) -> tuple[int, int, str]:
+    """
+    Extract a single season and write it to its own season= partition.
+
+    Runs inside a worker process, so it builds its own extractor and GCS client
+    rather than sharing the parent's (clients aren't picklable).
+
+    Returns:
+        Tuple of (season, row count, GCS URI)
+    """
+    from ingestion.storage.gcs_writer import GCSWriter
+
+    extractor = NFLExtractor()
+    gcs_writer = GCSWriter(bucket_name=bucket_name, project_id=project_id)
+    config = extractor.config
+
+    for attempt in range(1, config.max_retries + 1):
+        try:
+            df, gcs_uri = extractor.extract_write_gcs(
+                data_type, gcs_writer, seasons=[season], **kwargs
+            )
+            return season, len(df), gcs_uri
+        except Exception as e:
+            if attempt == config.max_retries:
+                raise
+            logger.warning(
+                f"Attempt {attempt}/{config.max_retries} for {data_type} season {season} "
+                f"failed: {e}. Retrying in {config.retry_delay}s"
+            )
+            time.sleep(config.retry_delay)
+
+
 class NFLExtractor:
     """Extract NFL data from nflreadpy."""
     
     # these calls will error if we try to include season
     NO_SEASONS_PARAM = {'teams', 'trades', 'contracts', 'injuries', 'players', 'ff_rankings', 'ff_playerids'}
     
-    def __init__(self):
-        """Initialize the NFL extractor."""
-        self.current_season = 2025
+    def __init__(self, config: Optional[IngestionConfig] = None, cache: Optional[ExtractCache] = None):
+        """
+        Initialize the NFL extractor.
+
+        Args:
+            config: Ingestion config. Defaults to env config.
+            cache: Local extract cache. Defaults to the env-configured cache (None if disabled).
+        """
+        self.config = config or get_ingestion_config()
+        self.current_season = self.config.current_season
+        self.cache = cache if cache is not None else get_extract_cache(self.current_season)
+        self.projector = ColumnProjector() if self.config.project_columns else None
     
     def extract(
         self,
@@ -75,7 +139,9 @@ class NFLExtractor:
         
         try:
             
-            if data_type in self.NO_SEASONS_PARAM:
+            if self.cache is not None:
+                df = self._extract_cached(data_type, load_func, seasons, kwargs)
+            elif data_type in self.NO_SEASONS_PARAM:
                 df = load_func(**kwargs)
             else:
                 df = load_func(seasons=seasons, **kwargs)
@@ -86,6 +152,94 @@ class NFLExtractor:
             logger.error(f"Error extracting {data_type}: {e}")
             raise
     
+    def changed_upstream(
+        self,
+        data_type: str,
+        gcs_writer, # GCSWriter instance
+        seasons: Optional[list[int]] = None,
+    ) -> dict[str, Optional[dict]]:
+        """
+        Seasons of data_type whose nflverse release files changed since they were
+        last extracted (see ingestion/nfl/freshness.py). Everything counts as
+        changed when check_upstream is disabled.
+
+        Args:
+            data_type: Type of data to check
+            gcs_writer: GCSWriter instance (its manifests hold the fingerprints)
+            seasons: Seasons to check (None for datasets that take no seasons)
+
+        Returns:
+            Dict of season (as a string, or "all") -> upstream fingerprint to pass
+            to record_upstream once that season is written
+        """
+        if not self.config.check_upstream:
+            return {str(season): None for season in seasons} if seasons else {ALL_SEASONS: None}
+        return UpstreamFreshness(gcs_writer.manifests).changed(data_type, seasons)
+
+    def invalidate_changed(self, data_type: str, fingerprints: Optional[dict]) -> None:
+        """
+        Drop cache entries for seasons changed_upstream found changed, so the
+        extract re-downloads them instead of writing (and then recording the
+        new fingerprint against) a stale cached frame.
+        """
+        if self.cache is None or not fingerprints:
+            return
+        for key, fingerprint in fingerprints.items():
+            if fingerprint is None:
+                continue  # check disabled or not probed; nothing says the cache is stale
+            season = None if key == ALL_SEASONS or data_type in self.NO_SEASONS_PARAM else int(key)
+            self.cache.invalidate(data_type, season)
+
+    def record_upstream(self, data_type: str, gcs_writer, fingerprints: Optional[dict]) -> None:
+        """Record upstream fingerprints from changed_upstream after a successful extract."""
+        if fingerprints:
+            UpstreamFreshness(gcs_writer.manifests).record(data_type, fingerprints)
+
+    def prepare(self, data_type: str, df: pl.DataFrame, optimize: bool = True) -> pl.DataFrame:
+        """
+        Prepare an extracted frame for writing: drops raw columns that no dbt
+        staging model reads (when project_columns is enabled), then downcasts,
+        categorises and sorts it (when optimize_dtypes is enabled).
+
+        Args:
+            data_type: Type of data the frame holds
+            df: Extracted DataFrame
+            optimize: Set False to skip the dtype pass (e.g. when chunks must share a schema)
+
+        Returns:
+            DataFrame ready to serialise
+        """
+        if self.projector is not None:
+            df, _ = self.projector.project(data_type, df)
+        if optimize and self.config.optimize_dtypes and not df.is_empty():
+            df, _ = optimize_frame(data_type, df, measure_file_size=self.config.measure_file_sizes)
+        return df
+
+    def _extract_cached(self, data_type: str, load_func, seasons: Optional[list[int]], kwargs: dict) -> pl.DataFrame:
+        """
+        Extract through the local cache, one entry per season so closed seasons
+        are served from disk and only the missing ones hit the network.
+        """
+        if data_type in self.NO_SEASONS_PARAM:
+            df = self.cache.get(data_type, None, kwargs)
+            if df is None:
+                df = load_func(**kwargs)
+                self.cache.put(df, data_type, None, kwargs)
+            return df
+
+        frames = []
+        for season in seasons:
+            df = self.cache.get(data_type, season, kwargs)
+            if df is None:
+                df = load_func(seasons=[season], **kwargs)
+                self.cache.put(df, data_type, season, kwargs)
+            frames.append(df)
+
+        if len(frames) == 1:
+            return frames[0]
+        # seasons can differ in null-only columns, so relax dtypes when stacking
+        return pl.concat(frames, how="diagonal_relaxed")
+
     def extract_write_gcs(
             self,
             data_type: str,
@@ -111,17 +265,159 @@ class NFLExtractor:
             logger.warning(f"No data extracted for {data_type}, skipping GCS write.")
             return df, ""
         
+        df = self.prepare(data_type, df)
+
         # ID partition keys
         partition_keys = {} 
         if seasons and len(seasons) == 1:
             partition_keys['season'] = seasons[0]
         
         # Build GCS path
-        from ingestion.config import get_gcs_config
         config = get_gcs_config()
         path = config.get_raw_path("nfl", data_type, **partition_keys)
 
-        gcs_uri = gcs_writer.write(data=df, path=path)
+        # unchanged content reuses the previous file, so the load can be skipped too
+        gcs_uri = gcs_writer.write(
+            data=df, path=path, skip_unchanged=True, profile=get_parquet_profile(data_type)
+        )
 
         return df, gcs_uri
-    
\ No newline at end of file
+
+    def extract_load(
+            self,
+            data_type: str,
+            gcs_writer, # GCSWriter instance
+            bq_loader, # GCSToBigQueryLoader instance
+            table_id: str,
+            seasons: Optional[list[int]] = None,
+            **kwargs
+        ) -> tuple[pl.DataFrame, str, bool]:
+        """
+        Extract data and, if the prepared frame is small, load it straight into
+        BigQuery while archiving it to GCS in the background. Larger frames (and
+        single-season extracts, which only cover one partition) are written to
+        GCS as in extract_write_gcs and left for the load DAG.
+
+        Args:
+            data_type: type of data extracting
+            gcs_writer: GCSWriter instance
+            bq_loader: GCSToBigQueryLoader instance
+            table_id: BigQuery table to replace
+            seasons: List of seasons
+            **kwargs: Additional args
+
+        Returns:
+            Tuple of (DataFrame, GCS URI or "" if not archived, whether it was loaded)
+        """
+        max_bytes = self.config.direct_load_max_bytes
+        if not max_bytes or (seasons and len(seasons) == 1):
+            df, gcs_uri = self.extract_write_gcs(data_type, gcs_writer, seasons=seasons, **kwargs)
+            return df, gcs_uri, False
+
+        df = self.extract(data_type, seasons=seasons, **kwargs)
+        if df.is_empty():
+            logger.warning(f"No data extracted for {data_type}, skipping load.")
+            return df, "", False
+
+        df = self.prepare(data_type, df)
+        path = get_gcs_config().get_raw_path("nfl", data_type)
+        profile = get_parquet_profile(data_type)
+
+        if df.estimated_size() > max_bytes:
+            gcs_uri = gcs_writer.write(data=df, path=path, skip_unchanged=True, profile=profile)
+            return df, gcs_uri, False
+
+        df = gcs_writer.schemas.conform(path, df)
+        written_schema = df.schema
+        df = drop_untyped(df)
+        content_hash = frame_hash(df)
+        manifest = gcs_writer.manifests.read(path)
+        if manifest.get('loaded_hash') == content_hash:
+            logger.info(f"{data_type} unchanged since last load, skipping")
+            bq_loader.record_skip(table_id)
+            return df, manifest.get('loaded_uri') or "", False
+
+        gcs_writer.schemas.register(path, written_schema)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            archive = None
+            if self.config.archive_direct_loads:
+                archive = pool.submit(gcs_writer.write, data=df, path=path, profile=profile)
+            bq_loader.load_from_dataframe(
+                df,
+                table_id,
+                write_mode="replace",
+                schema=gcs_writer.schemas.bigquery_schema(path),
+                layout=get_table_layout(data_type),
+            )
+            gcs_uri = archive.result() if archive else ""
+
+        gcs_writer.manifests.record_direct_load(path, table_id, content_hash, uri=gcs_uri or None)
+        return df, gcs_uri, True
+
+    def extract_write_gcs_by_season(
+            self,
+            data_type: str,
+            gcs_writer, # GCSWriter instance
+            seasons: Optional[list[int]] = None,
+            max_workers: Optional[int] = None,
+            **kwargs
+        ) -> dict[int, str]:
+        """
+        Extract each season independently across a process pool and write each
+        one to its own raw/nfl/<data_type>/season=YYYY/ prefix.
+
+        Peak memory per worker is bounded to a single season, and a failing
+        season is retried on its own without re-pulling the others.
+
+        Args:
+            data_type: type of data extracting
+            gcs_writer: GCSWriter instance (only its bucket/project are reused)
+            seasons: List of seasons. If None, uses current season.
+            max_workers: Size of the process pool. Defaults to config.max_workers.
+            **kwargs: Additional args
+
+        Returns:
+            Dict of season -> GCS URI. Seasons with no data are omitted.
+        """
+        if data_type in self.NO_SEASONS_PARAM:
+            raise ValueError(f"'{data_type}' does not accept seasons and can't be partitioned by season")
+
+        if seasons is None:
+            seasons = [self.current_season]
+
+        max_workers = min(max_workers or self.config.max_workers, len(seasons))
+        bucket_name = gcs_writer.bucket.name
+        project_id = gcs_writer.client.project
+
+        logger.info(f"Extracting {data_type} for seasons {seasons} across {max_workers} workers")
+
+        # spawn rather than fork - polars' thread pool doesn't survive a fork
+        mp_context = multiprocessing.get_context("spawn")
+
+        uris = {}
+        failed = {}
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+            futures = {
+                pool.submit(_extract_write_season, data_type, season, bucket_name, project_id, kwargs): season
+                for season in seasons
+            }
+            for future in as_completed(futures):
+                season = futures[future]
+                try:
+                    _, rows, gcs_uri = future.result()
+                except Exception as e:
+                    logger.error(f"Error extracting {data_type} season {season}: {e}")
+                    failed[season] = e
+                    continue
+
+                if gcs_uri:
+                    logger.info(f"Wrote {rows} rows of {data_type} season {season} to {gcs_uri}")
+                    uris[season] = gcs_uri
+
+        if failed:
+            raise RuntimeError(
+                f"Failed to extract {data_type} for seasons {sorted(failed)}; "
+                f"wrote seasons {sorted(uris)}"
+            )
+
+        return dict(sorted(uris.items()))
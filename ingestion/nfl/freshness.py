@@ -0,0 +1,240 @@
+"""
+Upstream freshness checks for nflverse release files.
+
+Before extracting a dataset we HEAD the release files nflreadpy would download
+(one per season for per-season datasets) and compare their ETag, Last-Modified
+and size with what was recorded at the last successful extract. Seasons whose
+files haven't changed are skipped entirely: no download, no upload, no load.
+
+Fingerprints are kept in the dataset manifest in GCS
+(raw/nfl/<type>/_manifest.json -> upstream), keyed by season ("all" for
+datasets extracted without seasons), and only recorded once the extract that
+used them has been written, so a failed run is retried next time.
+"""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Protocol
+from urllib.parse import urljoin
+
+import requests
+
+from ingestion.config import get_gcs_config, get_ingestion_config
+
+logger = logging.getLogger(__name__)
+
+# key for datasets extracted without seasons
+ALL_SEASONS = "all"
+
+# data type -> (repository, path of the file nflreadpy downloads with our
+# default arguments). {season} is filled per season; per-season files of
+# datasets that take no seasons are for the current season.
+RELEASE_ASSETS = {
+    'pbp': ("nflverse-data", "pbp/play_by_play_{season}.parquet"),
+    'schedules': ("nflverse-data", "schedules/games.parquet"),
+    'rosters': ("nflverse-data", "rosters/roster_{season}.parquet"),
+    'rosters_weekly': ("nflverse-data", "weekly_rosters/roster_weekly_{season}.parquet"),
+    'depth_charts': ("nflverse-data", "depth_charts/depth_charts_{season}.parquet"),
+    'injuries': ("nflverse-data", "injuries/injuries_{season}.parquet"),
+    'trades': ("nflverse-data", "trades/trades.parquet"),
+    'players': ("nflverse-data", "players/players.parquet"),
+    'teams': ("nflverse-data", "teams/teams_colors_logos.parquet"),
+    'player_stats': ("nflverse-data", "stats_player/stats_player_week_{season}.parquet"),
+    'snap_counts': ("nflverse-data", "snap_counts/snap_counts_{season}.parquet"),
+    'nextgen_stats': ("nflverse-data", "nextgen_stats/ngs_passing.parquet"),
+    'participation': ("nflverse-data", "pbp_participation/pbp_participation_{season}.parquet"),
+    'officials': ("nflverse-data", "officials/officials.parquet"),
+    'combine': ("nflverse-data", "combine/combine.parquet"),
+    'draft_picks': ("nflverse-data", "draft_picks/draft_picks.parquet"),
+    'contracts': ("nflverse-data", "contracts/historical_contracts.parquet"),
+    'ff_playerids': ("dynastyprocess", "db_playerids.csv"),
+    'ff_rankings': ("dynastyprocess", "db_fpecr_latest.csv"),
+    'ff_opportunity': ("ffopportunity", "latest-data/ep_weekly_{season}.parquet"),
+}
+
+DEFAULT_PROBE_WORKERS = 8
+
+
+def release_base_urls() -> dict[str, str]:
+    """Repository -> base URL, as nflreadpy downloads from them."""
+    from nflreadpy.downloader import NflverseDownloader
+    return NflverseDownloader.BASE_URLS
+
+
+def release_urls(
+    data_type: str,
+    seasons: Optional[list[int]],
+    base_url: str = "",
+    current_season: Optional[int] = None,
+) -> dict[str, str]:
+    """
+    Release file URL per key (season, or "all") for a dataset.
+
+    Args:
+        data_type: NFL data type
+        seasons: Seasons being extracted (None for datasets that take no seasons)
+        base_url: Serve files from <base_url>/<repository>/<path> instead of
+            nflreadpy's URLs (e.g. a local stand-in)
+        current_season: Season for per-season files of datasets that take no seasons
+
+    Returns:
+        Dict of key -> URL ({} if the dataset's release files aren't known)
+    """
+    if data_type not in RELEASE_ASSETS:
+        return {}
+
+    repository, path = RELEASE_ASSETS[data_type]
+    base = f"{base_url.rstrip('/')}/{repository}/" if base_url else release_base_urls()[repository]
+
+    if "{season}" not in path:
+        # one file for every season; still keyed per season when extracting
+        # by season, so each season records its own extract
+        url = urljoin(base, path)
+        return {str(season): url for season in seasons} if seasons else {ALL_SEASONS: url}
+
+    seasons = seasons or [current_season or get_ingestion_config().current_season]
+    return {str(season): urljoin(base, path.format(season=season)) for season in seasons}
+
+
+class ReleaseProbe:
+    """HEAD release files (following the release download redirect) for their fingerprint."""
+
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def fingerprint(self, url: str) -> Optional[dict]:
+        """
+        ETag, Last-Modified and size of a release file, or None if it doesn't
+        exist (e.g. a season that isn't published yet).
+        """
+        response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'size': response.headers.get('Content-Length'),
+        }
+
+
+class StateStore(Protocol):
+    def read(self, path: str) -> dict: ...
+    def modify(self, path: str, modify: Callable[[dict], None]) -> dict: ...
+
+
+class JsonFileStore:
+    """Local stand-in for ManifestStore: one JSON file per path under a directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _file(self, path: str) -> str:
+        return os.path.join(self.root, path, "_manifest.json")
+
+    def read(self, path: str) -> dict:
+        try:
+            with open(self._file(path)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def modify(self, path: str, modify: Callable[[dict], None]) -> dict:
+        manifest = self.read(path)
+        modify(manifest)
+        os.makedirs(os.path.dirname(self._file(path)), exist_ok=True)
+        with open(self._file(path), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def is_unchanged(recorded: Optional[dict], current: Optional[dict]) -> bool:
+    """True if a file's fingerprint matches the recorded one and says something."""
+    if not recorded or not current or not any(current.values()):
+        return False
+    return recorded == current
+
+
+class UpstreamFreshness:
+    """
+    Decide which seasons of a dataset changed upstream since their last extract.
+
+    Args:
+        store: Where fingerprints are kept; a ManifestStore (or JsonFileStore)
+        probe: ReleaseProbe. Defaults to a new one.
+        base_url: Release file base URL override. Defaults to NFL_UPSTREAM_BASE_URL.
+        max_workers: Files probed at once
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        probe: Optional[ReleaseProbe] = None,
+        base_url: Optional[str] = None,
+        max_workers: int = DEFAULT_PROBE_WORKERS,
+    ):
+        config = get_ingestion_config()
+        self.store = store
+        self.probe = probe or ReleaseProbe()
+        self.base_url = config.upstream_base_url if base_url is None else base_url
+        self.current_season = config.current_season
+        self.max_workers = max_workers
+
+    def _dataset_path(self, data_type: str) -> str:
+        return get_gcs_config().get_raw_path("nfl", data_type)
+
+    def recorded(self, data_type: str) -> dict[str, dict]:
+        """Fingerprints recorded at the last successful extracts, by key."""
+        return self.store.read(self._dataset_path(data_type)).get('upstream', {})
+
+    def changed(self, data_type: str, seasons: Optional[list[int]] = None) -> dict[str, Optional[dict]]:
+        """
+        Keys (seasons, or "all") whose release file changed since it was last
+        recorded, with the current fingerprint to record once extracted.
+
+        Files that can't be probed, and datasets without known release files,
+        count as changed, so an unreachable release host never skips work.
+        Seasons with no release file yet are left out.
+        """
+        urls = release_urls(data_type, seasons, self.base_url, self.current_season)
+        if not urls:
+            return {str(season): None for season in seasons} if seasons else {ALL_SEASONS: None}
+
+        def _probe(url: str):
+            try:
+                return self.probe.fingerprint(url), True
+            except requests.RequestException as e:
+                logger.warning(f"Could not probe {url}: {e}; treating it as changed")
+                return None, False
+
+        unique = sorted(set(urls.values()))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as pool:
+            probed = dict(zip(unique, pool.map(_probe, unique), strict=True))
+
+        recorded = self.recorded(data_type)
+        changed = {}
+        for key, url in urls.items():
+            fingerprint, reachable = probed[url]
+            if reachable and fingerprint is None:
+                logger.info(f"{data_type} {key}: no release file upstream, skipping")
+                continue
+            if not is_unchanged(recorded.get(key), fingerprint):
+                changed[key] = fingerprint
+
+        logger.info(
+            f"{data_type}: {len(changed)}/{len(urls)} release files changed upstream"
+            f"{': ' + ', '.join(sorted(changed)) if changed else ''}"
+        )
+        return changed
+
+    def record(self, data_type: str, fingerprints: dict[str, Optional[dict]]) -> None:
+        """Record fingerprints of release files that were just extracted and written."""
+        fingerprints = {key: fp for key, fp in fingerprints.items() if fp}
+        if not fingerprints:
+            return
+        self.store.modify(
+            self._dataset_path(data_type),
+            lambda manifest: manifest.setdefault('upstream', {}).update(fingerprints),
+        )
@@ -0,0 +1,213 @@
+"""
+In-season refresh of availability data (injuries, depth charts, weekly rosters).
+
+The weekly pipeline extracts these once a week with everything else. During the
+season they change between games, so the nfl_in_season_refresh DAG refreshes
+the datasets marked in_season in ingestion.catalog every few hours, touching
+only the current season and week:
+
+    1. extract the current season and keep the current week's rows
+    2. diff them row by row against the snapshot of the week from the last run
+    3. if anything changed: rewrite the dataset's current-season file, and write
+       the added/removed rows to a change log partition
+       (raw/nfl/<table>_changelog/season=/week=), which is appended to
+       <table>_changelog in BigQuery
+    4. once loaded, replace the snapshot
+
+Runs where nothing changed write and load nothing.
+
+Usage:
+    refresh = WeekRefresh(extractor, gcs_writer, 'injuries')
+    result = refresh.run()
+    if result.changed:
+        ...  # load result.uri and result.changelog_uri
+    refresh.commit()
+"""
+import io
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+import polars as pl
+from google.cloud.exceptions import NotFound
+
+from ingestion.catalog import get_dataset
+from ingestion.config import get_gcs_config, get_parquet_profile
+from ingestion.utils.hashing import row_hashes
+
+logger = logging.getLogger(__name__)
+
+CHANGE_TYPE_COLUMN = 'change_type'
+CHANGED_AT_COLUMN = 'changed_at'
+
+
+class WeekSnapshot:
+    """Rows of a dataset's week as of the last refresh, stored as parquet in GCS."""
+
+    def __init__(self, gcs_writer, data_type: str, season: int, week: int):
+        self.gcs_writer = gcs_writer
+        self.path = (
+            f"{get_gcs_config().get_raw_path('nfl', data_type)}"
+            f"/_state/in_season/season={season}/week={week:02d}.parquet"
+        )
+
+    def load(self) -> Optional[pl.DataFrame]:
+        """The snapshot, or None if the week hasn't been refreshed yet."""
+        blob = self.gcs_writer.bucket.blob(self.path)
+        try:
+            return pl.read_parquet(io.BytesIO(blob.download_as_bytes()))
+        except NotFound:
+            return None
+
+    def save(self, df: pl.DataFrame) -> None:
+        buffer = io.BytesIO()
+        df.write_parquet(buffer)
+        blob = self.gcs_writer.bucket.blob(self.path)
+        blob.upload_from_string(buffer.getvalue(), content_type='application/octet-stream')
+
+
+def current_week(df: pl.DataFrame) -> int:
+    """Latest week in an extract of the current season, or nflreadpy's estimate if it has none."""
+    if 'week' in df.columns:
+        week = df.get_column('week').max()
+        if week is not None:
+            return int(week)
+
+    import nflreadpy as nfl
+    return nfl.get_current_week()
+
+
+def week_rows(df: pl.DataFrame, week: int) -> pl.DataFrame:
+    """A week's rows; the whole frame if it isn't broken down by week."""
+    if 'week' not in df.columns or df.get_column('week').null_count() == len(df):
+        return df
+    return df.filter(pl.col('week') == week)
+
+
+def diff_rows(previous: Optional[pl.DataFrame], current: pl.DataFrame) -> pl.DataFrame:
+    """
+    Rows added to and removed from current since previous, tagged 'added' or
+    'removed' in change_type. A row that changed shows up as both.
+
+    Rows are compared by content hash over the columns the frames share, so a
+    column added upstream doesn't mark every row as changed.
+
+    Args:
+        previous: Rows from the last refresh (None if there wasn't one)
+        current: Rows just extracted
+
+    Returns:
+        DataFrame of changed rows with current's columns plus change_type
+    """
+    if previous is None:
+        return current.with_columns(pl.lit('added').alias(CHANGE_TYPE_COLUMN))
+
+    columns = [name for name in current.columns if name in previous.columns]
+    previous = previous.with_columns(row_hashes(previous.select(columns)).alias('_row_hash'))
+    current = current.with_columns(row_hashes(current.select(columns)).alias('_row_hash'))
+
+    added = current.join(previous.select('_row_hash'), on='_row_hash', how='anti')
+    removed = previous.join(current.select('_row_hash'), on='_row_hash', how='anti')
+    changes = pl.concat([
+        added.with_columns(pl.lit('added').alias(CHANGE_TYPE_COLUMN)),
+        removed.select([name for name in added.columns if name in removed.columns])
+               .with_columns(pl.lit('removed').alias(CHANGE_TYPE_COLUMN)),
+    ], how='diagonal_relaxed')
+    return changes.drop('_row_hash')
+
+
+@dataclass
+class RefreshResult:
+    data_type: str
+    season: int
+    week: Optional[int] = None
+    rows: int = 0
+    added: int = 0
+    removed: int = 0
+    uri: str = ""            # the dataset's current-season file
+    changelog_uri: str = ""  # the change log file written by this refresh
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class WeekRefresh:
+    """
+    Refresh the current week of an in_season dataset.
+
+    Args:
+        extractor: NFLExtractor instance. Its cache should be disabled, since
+            the current season's cache TTL is longer than the refresh interval.
+        gcs_writer: GCSWriter instance
+        data_type: Dataset in ingestion.catalog
+        season: Season to refresh. Defaults to the extractor's current season.
+        week: Week to refresh. Defaults to the latest week in the extract.
+    """
+
+    def __init__(self, extractor, gcs_writer, data_type: str, season: Optional[int] = None, week: Optional[int] = None):
+        self.extractor = extractor
+        self.gcs_writer = gcs_writer
+        self.spec = get_dataset(data_type)
+        self.season = season or extractor.current_season
+        self.week = week
+        self._snapshot: Optional[WeekSnapshot] = None
+        self._rows: Optional[pl.DataFrame] = None
+
+    def run(self) -> RefreshResult:
+        """
+        Extract, diff and, if anything changed, write the season file and the
+        change log. Nothing is committed until commit().
+        """
+        data_type = self.spec.name
+        result = RefreshResult(data_type=data_type, season=self.season)
+
+        df = self.extractor.extract(data_type, seasons=[self.season])
+        if df.is_empty():
+            logger.info(f"No {data_type} rows for season {self.season}, nothing to refresh")
+            return result
+
+        # datasets extracted without seasons (injuries) may hold more than the current one
+        season_df = df.filter(pl.col('season') == self.season) if 'season' in df.columns else df
+        week = self.week or current_week(season_df)
+        rows = week_rows(season_df, week)
+        snapshot = WeekSnapshot(self.gcs_writer, data_type, self.season, week)
+        changes = diff_rows(snapshot.load(), rows)
+
+        result.week = week
+        result.rows = len(rows)
+        result.added = changes.filter(pl.col(CHANGE_TYPE_COLUMN) == 'added').height
+        result.removed = len(changes) - result.added
+        if not result.changed:
+            logger.info(f"{data_type} season {self.season} week {week}: no changes since the last refresh")
+            return result
+
+        logger.info(
+            f"{data_type} season {self.season} week {week}: "
+            f"{result.added} rows added, {result.removed} removed since the last refresh"
+        )
+
+        config = get_gcs_config()
+        partition_keys = {'season': self.season} if self.spec.by_season else {}
+        result.uri = self.gcs_writer.write(
+            data=self.extractor.prepare(data_type, df),
+            path=config.get_raw_path('nfl', data_type, **partition_keys),
+            skip_unchanged=True,
+            profile=get_parquet_profile(data_type),
+        )
+
+        changes = changes.with_columns(
+            pl.lit(datetime.now(timezone.utc)).alias(CHANGED_AT_COLUMN)
+        )
+        result.changelog_uri = self.gcs_writer.write(
+            data=changes,
+            path=config.get_raw_path('nfl', self.spec.changelog_table, season=self.season, week=f"{week:02d}"),
+        )
+
+        self._snapshot, self._rows = snapshot, rows
+        return result
+
+    def commit(self) -> None:
+        """Replace the week's snapshot once the refresh has been loaded."""
+        if self._snapshot is not None:
+            self._snapshot.save(self._rows)
@@ -0,0 +1,182 @@
+import functools
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Optional
+import polars as pl
+from google.cloud.exceptions import NotFound, PreconditionFailed
+
+from ingestion.config import get_gcs_config, get_parquet_profile, get_table_layout
+from ingestion.storage.manifest import MAX_UPDATE_ATTEMPTS
+from ingestion.utils.hashing import group_hashes
+
+logger = logging.getLogger(__name__)
+
+
+class PbpWatermark:
+    """
+    Watermark of ingested play-by-play games, stored as a JSON object in GCS.
+
+    The extract task adds to it and the load DAG drains it, possibly at the
+    same time (a retry or manual trigger during a load), so every change is a
+    read-modify-write with a generation precondition, retried on conflict, as
+    in ManifestStore.modify.
+
+    State layout:
+        games: game_id -> content hash of the rows last written for that game
+        pending: batches written to GCS but not yet loaded to BigQuery, each
+            with its URI and the game_ids it (re)writes
+    """
+
+    def __init__(self, gcs_writer, path: Optional[str] = None):
+        self.gcs_writer = gcs_writer
+        self.path = path or f"{get_gcs_config().get_raw_path('nfl', 'pbp')}/_state/watermark.json"
+
+    @staticmethod
+    def _defaults(state: dict) -> dict:
+        state.setdefault('games', {})
+        state.setdefault('pending', [])
+        return state
+
+    def load(self) -> dict:
+        blob = self.gcs_writer.bucket.blob(self.path)
+        try:
+            state = json.loads(blob.download_as_text())
+        except NotFound:
+            state = {}
+        return self._defaults(state)
+
+    def modify(self, modify: Callable[[dict], None]) -> dict:
+        """
+        Apply modify to the latest state and write it back, retrying if another
+        writer updated the watermark in between.
+        """
+        bucket = self.gcs_writer.bucket
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            blob = bucket.get_blob(self.path)
+            generation = 0 if blob is None else blob.generation
+            try:
+                state = self._defaults({} if blob is None else json.loads(
+                    blob.download_as_text(if_generation_match=generation)
+                ))
+                modify(state)
+                state['updated_at'] = datetime.now(timezone.utc).isoformat()
+                bucket.blob(self.path).upload_from_string(
+                    json.dumps(state),
+                    content_type='application/json',
+                    if_generation_match=generation,
+                )
+                return state
+            except (PreconditionFailed, NotFound):
+                continue
+        raise RuntimeError(f"Could not update {self.path} after {MAX_UPDATE_ATTEMPTS} attempts")
+
+
+def completed_games(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Keep only rows for games that have finished (an 'END GAME' play has been
+    recorded), so in-progress games aren't watermarked half way through.
+    """
+    if 'desc' not in df.columns:
+        return df
+    finished = df.filter(pl.col('desc') == 'END GAME').get_column('game_id').unique()
+    return df.filter(pl.col('game_id').is_in(finished.to_list()))
+
+
+def extract_pbp_incremental(extractor, gcs_writer, season: Optional[int] = None) -> list[str]:
+    """
+    Extract the current season's play-by-play and write only new or changed
+    completed games, one file per season=/week= partition.
+
+    Args:
+        extractor: NFLExtractor instance
+        gcs_writer: GCSWriter instance
+        season: Season to extract. Defaults to the extractor's current season.
+
+    Returns:
+        List of GCS URIs written (empty when nothing changed)
+    """
+    season = season or extractor.current_season
+    watermark = PbpWatermark(gcs_writer)
+    state = watermark.load()
+
+    df = completed_games(extractor.extract('pbp', seasons=[season]))
+    hashes = group_hashes(df, 'game_id')
+    changed = [
+        game_id for game_id, game_hash in hashes.items()
+        if state['games'].get(game_id) != game_hash
+    ]
+
+    if not changed:
+        logger.info(f"No new or changed pbp games for season {season}")
+        return []
+
+    delta = df.filter(pl.col('game_id').is_in(changed))
+    logger.info(f"Found {len(changed)} new or changed pbp games ({len(delta)} rows) for season {season}")
+
+    delta = extractor.prepare('pbp', delta)
+
+    config = get_gcs_config()
+    weeks = delta.partition_by('week', maintain_order=True)
+    results = gcs_writer.write_many([
+        (week_df, config.get_raw_path("nfl", "pbp", season=season, week=f"{int(week_df.get_column('week')[0]):02d}"))
+        for week_df in weeks
+    ], profile=get_parquet_profile('pbp'))
+
+    batches = [
+        {'uri': result.uri, 'game_ids': week_df.get_column('game_id').unique().to_list()}
+        for week_df, result in zip(weeks, results, strict=True)
+    ]
+
+    def _record(state: dict) -> None:
+        state['pending'].extend(batches)
+        for game_id in changed:
+            state['games'][game_id] = hashes[game_id]
+
+    watermark.modify(_record)
+    return [batch['uri'] for batch in batches]
+
+
+def _remove_batch(batch: dict, state: dict) -> None:
+    if batch in state['pending']:
+        state['pending'].remove(batch)
+
+
+def load_pbp_incremental(bq_loader, gcs_writer, table_id: str) -> int:
+    """
+    Load pending incremental pbp batches into BigQuery.
+
+    Each batch replaces its games' rows in one transaction (see
+    GCSToBigQueryLoader.replace_rows), so changed games are replaced, a failed
+    batch leaves the table as it was, and re-running a batch is idempotent.
+
+    Returns:
+        Number of batches loaded
+    """
+    watermark = PbpWatermark(gcs_writer)
+    schema = gcs_writer.schemas.bigquery_schema(get_gcs_config().get_raw_path('nfl', 'pbp'))
+
+    loaded = 0
+    while True:
+        # re-read each time: the extract task may have queued more batches
+        pending = watermark.load()['pending']
+        if not pending:
+            break
+        batch = pending[0]
+        bq_loader.replace_rows(
+            gcs_uri=batch['uri'],
+            table_id=table_id,
+            column='game_id',
+            values=batch['game_ids'],
+            schema=schema,
+            layout=get_table_layout('pbp'),
+        )
+
+        # persist after each batch so a failure doesn't replay earlier ones.
+        # Remove this batch rather than the head of the queue, which another
+        # writer may have changed since it was read.
+        watermark.modify(functools.partial(_remove_batch, batch))
+        loaded += 1
+        logger.info(f"Loaded incremental pbp batch {batch['uri']} ({len(batch['game_ids'])} games)")
+
+    return loaded
@@ -0,0 +1,135 @@
+import io
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# natural keys to sort by before writing, so runs of repeated values (game,
+# team, week) sit next to each other and encode well. Only keys present in
+# the frame are used.
+SORT_KEYS_BY_DATA_TYPE = {
+    'pbp': ['game_id', 'play_id'],
+    'participation': ['nflverse_game_id', 'play_id'],
+    'schedules': ['season', 'week', 'game_id'],
+    'player_stats': ['season', 'week', 'player_id'],
+    'team_stats': ['season', 'week', 'team'],
+    'snap_counts': ['game_id', 'team', 'pfr_player_id'],
+    'rosters': ['season', 'team', 'gsis_id'],
+    'rosters_weekly': ['season', 'week', 'team', 'gsis_id'],
+    'depth_charts': ['season', 'week', 'club_code'],
+    'injuries': ['season', 'week', 'team', 'gsis_id'],
+    'nextgen_stats': ['season', 'week', 'player_gsis_id'],
+    'officials': ['game_id'],
+    'ff_opportunity': ['season', 'week', 'player_id'],
+}
+
+INT_TYPES = [
+    (pl.Int8, -(2**7), 2**7 - 1),
+    (pl.Int16, -(2**15), 2**15 - 1),
+    (pl.Int32, -(2**31), 2**31 - 1),
+]
+
+# strings repeating at least this often (rows per distinct value) become Categorical
+CATEGORICAL_MIN_REPEAT = 20
+CATEGORICAL_MIN_ROWS = 1000
+
+
+@dataclass
+class OptimizationReport:
+    data_type: str
+    bytes_before: int
+    bytes_after: int
+    file_bytes_before: Optional[int] = None
+    file_bytes_after: Optional[int] = None
+    downcast: dict[str, str] = field(default_factory=dict)
+    categorical: list[str] = field(default_factory=list)
+    sorted_by: list[str] = field(default_factory=list)
+
+
+def _parquet_size(df: pl.DataFrame) -> int:
+    buffer = io.BytesIO()
+    df.write_parquet(buffer, compression="snappy")
+    return buffer.tell()
+
+
+def _smallest_int_type(series: pl.Series) -> Optional[pl.DataType]:
+    """Smallest signed integer type that holds every value, or None to leave as-is."""
+    if series.null_count() == len(series):
+        return None
+    low, high = series.min(), series.max()
+    for dtype, type_min, type_max in INT_TYPES:
+        if type_min <= low and high <= type_max:
+            return None if series.dtype == dtype else dtype
+    return None
+
+
+def optimize_frame(
+    data_type: str,
+    df: pl.DataFrame,
+    measure_file_size: bool = False,
+) -> tuple[pl.DataFrame, OptimizationReport]:
+    """
+    Shrink a frame before parquet serialisation.
+
+    Integer columns are downcast to the smallest signed type that fits (BigQuery
+    still reads them as INT64), low-cardinality strings become Categorical (still
+    STRING in BigQuery), and rows are sorted by the dataset's natural keys for
+    better run-length and dictionary encoding. Floats are left alone so column
+    types don't flip between runs.
+
+    Args:
+        data_type: Type of data the frame holds
+        df: DataFrame to optimise
+        measure_file_size: Also serialise before and after to report parquet sizes
+
+    Returns:
+        Tuple of (optimised DataFrame, report)
+    """
+    report = OptimizationReport(
+        data_type=data_type,
+        bytes_before=df.estimated_size(),
+        bytes_after=0,
+    )
+    if measure_file_size:
+        report.file_bytes_before = _parquet_size(df)
+
+    casts = []
+    for name, dtype in df.schema.items():
+        series = df.get_column(name)
+        if dtype in (pl.Int64, pl.Int32, pl.Int16):
+            smaller = _smallest_int_type(series)
+            if smaller is not None:
+                casts.append(pl.col(name).cast(smaller))
+                report.downcast[name] = str(smaller)
+        elif dtype == pl.String and len(df) >= CATEGORICAL_MIN_ROWS:
+            if series.n_unique() * CATEGORICAL_MIN_REPEAT <= len(df):
+                casts.append(pl.col(name).cast(pl.Categorical))
+                report.categorical.append(name)
+
+    if casts:
+        df = df.with_columns(casts)
+
+    sort_keys = [k for k in SORT_KEYS_BY_DATA_TYPE.get(data_type, []) if k in df.columns]
+    if sort_keys:
+        df = df.sort(sort_keys, nulls_last=True)
+        report.sorted_by = sort_keys
+
+    report.bytes_after = df.estimated_size()
+    if measure_file_size:
+        report.file_bytes_after = _parquet_size(df)
+
+    message = (
+        f"Optimised {data_type}: {report.bytes_before / 1024**2:.1f} MB -> "
+        f"{report.bytes_after / 1024**2:.1f} MB in memory "
+        f"({len(report.downcast)} downcast, {len(report.categorical)} categorical)"
+    )
+    if measure_file_size:
+        message += (
+            f", parquet {report.file_bytes_before / 1024**2:.1f} MB -> "
+            f"{report.file_bytes_after / 1024**2:.1f} MB"
+        )
+    logger.info(message)
+
+    return df, report
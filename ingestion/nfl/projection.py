@@ -0,0 +1,147 @@
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+import polars as pl
+
+from ingestion.catalog import raw_table
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGING_MODELS_DIR = (
+    Path(__file__).resolve().parents[2] / "dbt_project" / "models" / "staging" / "nfl"
+)
+
+# always kept so partitioning, incremental loads and dedup keep working
+ALWAYS_KEEP = {'season', 'week', 'game_id', 'play_id', 'player_id'}
+
+SOURCE_RE = re.compile(r"source\(\s*'nfl_raw'\s*,\s*'(\w+)'\s*\)")
+CTE_START_RE = re.compile(r"(?:with|,)\s*(\w+)\s+as\s*\(", re.IGNORECASE)
+BARE_STAR_RE = re.compile(r"(?:select|,)\s*(?:distinct\s+)?\*", re.IGNORECASE)
+FROM_RE = re.compile(r"\b(?:from|join)\s+(\w+)", re.IGNORECASE)
+IDENTIFIER_RE = re.compile(r"`([^`]+)`|\b([A-Za-z_][A-Za-z0-9_]*)\b")
+
+
+@dataclass
+class ProjectionReport:
+    data_type: str
+    columns_before: int
+    columns_after: int
+    bytes_before: int
+    bytes_after: int
+    dropped: list[str] = field(default_factory=list)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _split_ctes(sql: str) -> tuple[dict[str, str], str]:
+    """Split a model into its CTE bodies and the final select."""
+    ctes = {}
+    pos = 0
+    while True:
+        match = CTE_START_RE.match(sql, pos) if ctes else CTE_START_RE.search(sql, pos)
+        if not match:
+            break
+        depth, end = 1, match.end()
+        while depth and end < len(sql):
+            depth += {'(': 1, ')': -1}.get(sql[end], 0)
+            end += 1
+        ctes[match.group(1).lower()] = sql[match.end():end - 1]
+        pos = end
+        # skip whitespace up to the next "," or the final select
+        while pos < len(sql) and sql[pos].isspace():
+            pos += 1
+    return ctes, sql[pos:]
+
+
+def _referenced_columns(sql: str) -> Optional[set[str]]:
+    """
+    Identifiers referenced by a staging model, lowercased. Returns None if the
+    model passes every raw column through (a * over the source, directly or via
+    other CTEs).
+    """
+    sql = re.sub(r"--[^\n]*", "", sql)
+    ctes, final = _split_ctes(sql)
+
+    passthrough = set()
+    for name, body in ctes.items():
+        if SOURCE_RE.search(body) or (
+            BARE_STAR_RE.search(body) and set(FROM_RE.findall(body.lower())) & passthrough
+        ):
+            passthrough.add(name)
+    if BARE_STAR_RE.search(final) and set(FROM_RE.findall(final.lower())) & passthrough:
+        return None
+
+    sql = re.sub(r"\{\{.*?\}\}|\{%.*?%\}|'[^']*'", " ", sql, flags=re.DOTALL)
+    return {
+        (quoted or bare).lower()
+        for quoted, bare in IDENTIFIER_RE.findall(sql)
+    }
+
+
+@lru_cache(maxsize=4)
+def load_staging_columns(models_dir: str) -> dict[str, Optional[set[str]]]:
+    """
+    Parse the dbt staging models and map each raw table to the columns it uses.
+
+    Args:
+        models_dir: Directory holding the stg_*.sql models
+
+    Returns:
+        Dict of raw table name -> referenced column names (None = all columns)
+    """
+    columns = {}
+    for model_path in sorted(Path(models_dir).glob("stg_*.sql")):
+        sql = model_path.read_text()
+        match = SOURCE_RE.search(sql)
+        if not match:
+            continue
+        columns[match.group(1)] = _referenced_columns(sql)
+    return columns
+
+
+class ColumnProjector:
+    """Drop raw columns that no dbt staging model reads before writing parquet."""
+
+    def __init__(self, models_dir: Optional[str] = None):
+        self.models_dir = models_dir or os.getenv(
+            "DBT_STAGING_MODELS_DIR", str(DEFAULT_STAGING_MODELS_DIR)
+        )
+
+    def columns_for(self, data_type: str) -> Optional[set[str]]:
+        return load_staging_columns(self.models_dir).get(raw_table(data_type))
+
+    def project(self, data_type: str, df: pl.DataFrame) -> tuple[pl.DataFrame, ProjectionReport]:
+        """
+        Project a frame down to the columns its staging model references.
+
+        Data types with no staging model, or whose model selects *, are passed
+        through unchanged.
+        """
+        referenced = self.columns_for(data_type)
+        if referenced is None:
+            keep = df.columns
+        else:
+            referenced = referenced | ALWAYS_KEEP
+            keep = [c for c in df.columns if c.lower() in referenced]
+
+        projected = df.select(keep) if len(keep) < len(df.columns) else df
+        report = ProjectionReport(
+            data_type=data_type,
+            columns_before=len(df.columns),
+            columns_after=len(projected.columns),
+            bytes_before=df.estimated_size(),
+            bytes_after=projected.estimated_size(),
+            dropped=[c for c in df.columns if c not in keep],
+        )
+        if report.dropped:
+            logger.info(
+                f"Projected {data_type} from {report.columns_before} to {report.columns_after} columns, "
+                f"saving {report.bytes_saved / 1024**2:.1f} MB in memory"
+            )
+        return projected, report
@@ -0,0 +1,230 @@
+"""
+Registry of raw table schemas, derived from the Polars frames we write.
+
+The BigQuery schema for each dataset is stored in the dataset-level manifest in
+GCS (raw/nfl/<type>/_manifest.json -> schema) and cached in-process. New
+columns are appended as they appear, and frames are cast to the registered
+type where that's lossless, so loads don't depend on autodetect and a season
+with an all-null or integer-only column can't flip a type the staging models
+rely on.
+
+A registered column only changes type to widen it (INT64 to FLOAT64). Columns
+only ever seen all-null aren't typed yet: they're left out of the files,
+listed under null_columns and loaded as NULL STRING placeholders, and get their
+real type from the first frame that has a value in them.
+"""
+import logging
+from typing import TYPE_CHECKING, Optional
+import polars as pl
+
+if TYPE_CHECKING:
+    from ingestion.storage.manifest import ManifestStore
+
+logger = logging.getLogger(__name__)
+
+SCALAR_TYPES = {
+    pl.Int8: "INT64", pl.Int16: "INT64", pl.Int32: "INT64", pl.Int64: "INT64",
+    pl.UInt8: "INT64", pl.UInt16: "INT64", pl.UInt32: "INT64", pl.UInt64: "INT64",
+    pl.Float32: "FLOAT64", pl.Float64: "FLOAT64",
+    pl.Boolean: "BOOL",
+    pl.String: "STRING", pl.Categorical: "STRING",
+    pl.Date: "DATE",
+    pl.Time: "TIME",
+    pl.Binary: "BYTES",
+}
+
+# polars type to cast a column to so it matches a registered scalar type
+POLARS_BY_BQ_TYPE = {
+    "INT64": pl.Int64,
+    "FLOAT64": pl.Float64,
+    "BOOL": pl.Boolean,
+    "STRING": pl.String,
+    "DATE": pl.Date,
+    "TIME": pl.Time,
+    "BYTES": pl.Binary,
+}
+
+# (registered, written) type pairs we'll cast rather than let the load fail
+SAFE_CASTS = {
+    ("FLOAT64", "INT64"),
+    ("STRING", "INT64"),
+    ("STRING", "FLOAT64"),
+    ("STRING", "BOOL"),
+}
+
+# (registered, written) type pairs that widen the registered type instead
+WIDENINGS = {
+    ("INT64", "FLOAT64"),
+}
+
+# type untyped (null_columns) columns are loaded as until a value shows up
+PLACEHOLDER_TYPE = "STRING"
+
+
+def bigquery_field(name: str, dtype: pl.DataType) -> Optional[dict]:
+    """
+    BigQuery field (API representation) for a Polars column, or None when the
+    type can't be known yet (an all-null column).
+    """
+    if dtype == pl.Null:
+        return None
+    if isinstance(dtype, pl.List):
+        inner = bigquery_field(name, dtype.inner)
+        if inner is None or inner['mode'] == "REPEATED":
+            return None
+        return {**inner, 'mode': "REPEATED"}
+    if isinstance(dtype, pl.Struct):
+        fields = [bigquery_field(f.name, f.dtype) for f in dtype.fields]
+        return {
+            'name': name, 'type': "RECORD", 'mode': "NULLABLE",
+            'fields': [f for f in fields if f is not None],
+        }
+    if isinstance(dtype, pl.Datetime):
+        # parquet timestamps without a time zone load as DATETIME
+        bq_type = "TIMESTAMP" if dtype.time_zone else "DATETIME"
+    elif isinstance(dtype, pl.Decimal):
+        bq_type = "BIGNUMERIC" if (dtype.precision or 38) > 29 else "NUMERIC"
+    elif isinstance(dtype, pl.Duration):
+        bq_type = "INT64"
+    else:
+        bq_type = SCALAR_TYPES.get(dtype.base_type(), "STRING")
+    return {'name': name, 'type': bq_type, 'mode': "NULLABLE"}
+
+
+def bigquery_fields(schema: pl.Schema | dict) -> list[dict]:
+    """BigQuery fields for every typed column of a Polars schema."""
+    fields = [bigquery_field(name, dtype) for name, dtype in schema.items()]
+    return [f for f in fields if f is not None]
+
+
+def drop_untyped(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Drop all-null columns with no type, before writing a conformed frame: they
+    aren't registered yet, so a type written now could clash with the real one.
+    """
+    untyped = [name for name, dtype in df.schema.items() if dtype == pl.Null]
+    return df.drop(untyped) if untyped else df
+
+
+class SchemaRegistry:
+    """Per-dataset BigQuery schemas, kept in the dataset manifests."""
+
+    def __init__(self, manifests: "ManifestStore"):
+        self.manifests = manifests
+        self._cache: dict[str, dict] = {}
+
+    def _manifest(self, dataset_path: str) -> dict:
+        if dataset_path not in self._cache:
+            manifest = self.manifests.read(dataset_path)
+            self._cache[dataset_path] = {
+                'schema': manifest.get('schema', []),
+                'null_columns': manifest.get('null_columns', []),
+            }
+        return self._cache[dataset_path]
+
+    def fields(self, dataset_path: str) -> list[dict]:
+        """Registered fields for a dataset ([] if none are registered yet)."""
+        return self._manifest(dataset_path)['schema']
+
+    def null_columns(self, dataset_path: str) -> list[str]:
+        """Columns only ever written all-null, so not typed yet."""
+        return self._manifest(dataset_path)['null_columns']
+
+    def register(self, dataset_path: str, schema: pl.Schema | dict) -> list[dict]:
+        """
+        Append any new columns of schema to the dataset's registered schema,
+        widen registered columns where schema needs it (see WIDENINGS), and
+        record new all-null columns as untyped.
+
+        Args:
+            dataset_path: Dataset prefix, e.g. raw/nfl/pbp
+            schema: Polars schema of a frame being written, before drop_untyped
+
+        Returns:
+            The registered fields after the update
+        """
+        registered = {f['name'].lower(): f for f in self.fields(dataset_path)}
+        untyped = {name.lower() for name in self.null_columns(dataset_path)}
+
+        new, widened = [], []
+        for field in bigquery_fields(schema):
+            current = registered.get(field['name'].lower())
+            if current is None:
+                new.append(field)
+            elif current['mode'] == field['mode'] and (current['type'], field['type']) in WIDENINGS:
+                widened.append(field)
+        nulls = [
+            name for name, dtype in schema.items()
+            if dtype == pl.Null and name.lower() not in registered and name.lower() not in untyped
+        ]
+        if not (new or widened or nulls):
+            return self.fields(dataset_path)
+
+        def _update(manifest: dict) -> None:
+            fields = manifest.setdefault('schema', [])
+            by_name = {f['name'].lower(): f for f in fields}
+            for field in widened:
+                current = by_name[field['name'].lower()]
+                if (current['type'], field['type']) in WIDENINGS:
+                    current['type'] = field['type']
+            fields.extend(f for f in new if f['name'].lower() not in by_name)
+
+            typed = {f['name'].lower() for f in fields}
+            null_columns = [name for name in manifest.get('null_columns', []) if name.lower() not in typed]
+            seen = {name.lower() for name in null_columns}
+            null_columns.extend(name for name in nulls if name.lower() not in typed and name.lower() not in seen)
+            manifest['null_columns'] = null_columns
+
+        manifest = self.manifests.modify(dataset_path, _update)
+        self._cache[dataset_path] = {'schema': manifest['schema'], 'null_columns': manifest['null_columns']}
+        if new:
+            logger.info(f"Registered {len(new)} new columns for {dataset_path}: {[f['name'] for f in new]}")
+        for field in widened:
+            logger.info(f"Widened {dataset_path}.{field['name']} to {field['type']}")
+        if nulls:
+            logger.info(f"{dataset_path}: {nulls} are all-null so far, leaving them untyped")
+        return self.fields(dataset_path)
+
+    def conform(self, dataset_path: str, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Cast a frame's columns to their registered types where that's lossless
+        (all-null columns, ints to floats, scalars to strings). Columns that
+        widen their registered type (see WIDENINGS) are left for register();
+        other mismatches are left alone and logged, and the load will reject them.
+
+        All-null columns that aren't registered keep their Null type; drop them
+        with drop_untyped after registering.
+        """
+        registered = {f['name'].lower(): f for f in self.fields(dataset_path)}
+        casts = []
+        for name, dtype in df.schema.items():
+            field = registered.get(name.lower())
+            if field is None or field['mode'] == "REPEATED" or field['type'] not in POLARS_BY_BQ_TYPE:
+                continue
+            current = bigquery_field(name, dtype)
+            if current is not None and current['type'] == field['type'] and current['mode'] == field['mode']:
+                continue
+            if current is None or (field['type'], current['type']) in SAFE_CASTS:
+                casts.append(pl.col(name).cast(POLARS_BY_BQ_TYPE[field['type']]))
+            elif (field['type'], current['type']) not in WIDENINGS:
+                logger.warning(
+                    f"{dataset_path}.{name} is registered as {field['type']} but written as "
+                    f"{current['type']}; not casting"
+                )
+        return df.with_columns(casts) if casts else df
+
+    def bigquery_schema(self, dataset_path: str) -> Optional[list]:
+        """
+        Registered schema as BigQuery SchemaFields, plus NULL placeholders for
+        untyped columns, or None if none is registered.
+        """
+        from google.cloud import bigquery
+
+        fields = self.fields(dataset_path)
+        if not fields:
+            return None
+        placeholders = [
+            {'name': name, 'type': PLACEHOLDER_TYPE, 'mode': "NULLABLE"}
+            for name in self.null_columns(dataset_path)
+        ]
+        return [bigquery.SchemaField.from_api_repr(f) for f in fields + placeholders]
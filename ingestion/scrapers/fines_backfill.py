@@ -0,0 +1,259 @@
+"""
+Historical backfill of the Gameday Accountability fines page.
+
+The live page only shows the current season, so past seasons come from archived
+copies of it (the Wayback Machine by default, or any server laid out the same
+way, e.g. a local stand-in serving fixture pages). Pages are fetched
+concurrently through one async client with a shared connection pool, capped by
+a semaphore and spaced by a rate limiter, retried with backoff, and parsed as
+they arrive while the remaining downloads are in flight.
+
+Usage:
+    backfill = FinesBackfill()
+    uris, failed = asyncio.run(backfill.backfill_and_write(snapshot_targets([2019, 2020, 2021])))
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+import httpx
+
+from ingestion.config import get_gcs_config, get_parquet_profile, get_scraper_config
+from ingestion.scrapers import fines_parser
+from ingestion.scrapers.nfl_fines_scraper import NFLFinesScraper
+from ingestion.storage import GCSWriter
+
+logger = logging.getLogger(__name__)
+
+# worth retrying; anything else (e.g. 404: no snapshot) fails the page at once
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# a season's page is complete once its fines are published, a week or two
+# after the Super Bowl
+SEASON_SNAPSHOT_DAY = (2, 20)
+SEASON_FIRST_SNAPSHOT_DAY = (9, 15)
+
+
+@dataclass(frozen=True)
+class BackfillTarget:
+    """One archived copy of the fines page, holding weeks of a single season."""
+    season: int
+    timestamp: str  # YYYYMMDD[hhmmss]; the archive serves the nearest copy
+
+    def url(self, archive_url: str, page_url: str) -> str:
+        # id_ asks the Wayback Machine for the page as captured, without its toolbar
+        return f"{archive_url.rstrip('/')}/{self.timestamp}id_/{page_url}"
+
+
+def snapshot_targets(seasons: list[int], every_days: Optional[int] = None) -> list[BackfillTarget]:
+    """
+    Archived copies to fetch for seasons.
+
+    Args:
+        seasons: Seasons to backfill
+        every_days: If set, also fetch a copy every this many days through the
+            season, to pick up weeks that were later dropped from the page.
+            Otherwise one copy per season, taken after it ended.
+
+    Returns:
+        Targets in season and snapshot order (later copies win per week)
+    """
+    targets = []
+    for season in seasons:
+        last = date(season + 1, *SEASON_SNAPSHOT_DAY)
+        days = [last]
+        if every_days:
+            day = date(season, *SEASON_FIRST_SNAPSHOT_DAY)
+            days = []
+            while day < last:
+                days.append(day)
+                day += timedelta(days=every_days)
+            days.append(last)
+        targets.extend(BackfillTarget(season, day.strftime("%Y%m%d")) for day in days)
+    return targets
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across all tasks."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds from a Retry-After header, if it's given in seconds."""
+    value = response.headers.get('Retry-After', '')
+    return float(value) if value.isdigit() else None
+
+
+class FinesBackfill:
+    """
+    Fetch, parse and write archived fines pages for past seasons.
+
+    Args:
+        archive_url: Archive serving <archive_url>/<timestamp>id_/<page_url>.
+            Defaults to NFL_FINES_ARCHIVE_URL (the Wayback Machine).
+        page_url: Page to look up in the archive. Defaults to NFL_FINES_URL.
+        concurrency: Max requests in flight
+        rate: Max requests started per second (0 for no limit)
+        retries: Retries per page on connection errors, 429 and 5xx
+        backoff: Base delay in seconds, doubled each retry, with jitter
+        parser: fines_parser backend
+        transport: Optional httpx transport, e.g. for an in-process stand-in
+    """
+
+    def __init__(
+        self,
+        archive_url: Optional[str] = None,
+        page_url: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff: float = 1.0,
+        parser: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        config = get_scraper_config()
+        self.archive_url = archive_url or config.fines_archive_url
+        self.page_url = page_url or config.fines_url
+        self.concurrency = concurrency or config.backfill_concurrency
+        self.rate = config.backfill_rate if rate is None else rate
+        self.retries = config.backfill_retries if retries is None else retries
+        self.backoff = backoff
+        self.parser = parser or config.fines_parser
+        self.timeout = config.timeout
+        self.transport = transport
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,  # the archive redirects to the nearest copy
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            transport=self.transport,
+        )
+
+    async def _get(self, client: httpx.AsyncClient, url: str) -> Optional[httpx.Response]:
+        """GET url with rate limiting and retries. None if there's no copy (404)."""
+        for attempt in range(self.retries + 1):
+            await self.limiter.wait()
+            delay = None
+            try:
+                response = await client.get(url)
+                if response.status_code == 404:
+                    return None
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                delay = retry_after(response)
+                error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                error = repr(e)
+
+            if attempt == self.retries:
+                raise RuntimeError(f"Giving up on {url} after {attempt + 1} attempts: {error}")
+            delay = delay or self.backoff * 2 ** attempt * (1 + random.random())
+            logger.warning(f"{url}: {error}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _fetch_and_parse(self, client: httpx.AsyncClient, target: BackfillTarget):
+        url = target.url(self.archive_url, self.page_url)
+        async with self.semaphore:
+            response = await self._get(client, url)
+        if response is None:
+            logger.warning(f"No archived copy of the fines page for {target}")
+            return target, None, {}
+
+        # parse off the event loop so other downloads keep going
+        weekResults = await asyncio.to_thread(fines_parser.parse, response.text, self.parser)
+        logger.info(f"{target.season}: {len(weekResults)} weeks from {response.url}")
+        return target, str(response.url), weekResults
+
+    async def fetch(self, targets: list[BackfillTarget]) -> tuple[dict[int, dict], dict[BackfillTarget, str]]:
+        """
+        Fetch and parse every target. A target that fails (e.g. out of retries)
+        doesn't stop the others.
+
+        Returns:
+            Tuple of (season -> {data-week: (source URL, week content)}, keeping
+            each week from the latest copy that has it; failed target -> error)
+        """
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.limiter = RateLimiter(self.rate)
+
+        async with self._client() as client:
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(client, target) for target in targets),
+                return_exceptions=True,
+            )
+
+        failed = {}
+        fetched = []
+        for target, result in zip(targets, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to backfill {target}: {result}")
+                failed[target] = str(result)
+            else:
+                fetched.append(result)
+
+        seasons: dict[int, dict] = {}
+        for target, url, weekResults in sorted(fetched, key=lambda result: result[0].timestamp):
+            weeks = seasons.setdefault(target.season, {})
+            for week, content in weekResults.items():
+                weeks[week] = (url, content)
+        return seasons, failed
+
+    def partition_items(self, seasons: dict[int, dict]) -> list:
+        """(DataFrame, GCS path) pairs for every backfilled season and week."""
+        items = []
+        for season, weeks in seasons.items():
+            bySource: dict[str, dict] = {}
+            for week, (url, content) in weeks.items():
+                bySource.setdefault(url, {})[week] = content
+            for url, weekResults in bySource.items():
+                scraper = NFLFinesScraper(season=season, parser=self.parser, url=url)
+                items.extend(scraper.partition_items(weekResults))
+        return items
+
+    async def backfill_and_write(
+        self, targets: list[BackfillTarget], gcs_writer=None
+    ) -> tuple[list[str], dict[BackfillTarget, str]]:
+        """
+        Fetch targets and write their weeks to the same season=/week= partitions
+        the live scraper uses. Unchanged partitions aren't rewritten. Weeks from
+        targets that were fetched are written even if others failed; re-running
+        the failed targets fills in the rest.
+
+        Returns:
+            Tuple of (GCS URIs written, failed target -> error)
+        """
+        seasons, failed = await self.fetch(targets)
+        items = self.partition_items(seasons)
+        if not items:
+            return [], failed
+
+        if gcs_writer is None:
+            config = get_gcs_config()
+            gcs_writer = GCSWriter(bucket_name=config.bucket_name, project_id=config.project_id)
+
+        # the writer's thread pool does the uploads; keep the event loop free
+        results = await asyncio.to_thread(
+            gcs_writer.write_many, items, skip_unchanged=True, profile=get_parquet_profile('fines')
+        )
+        return [result.uri for result in results], failed
@@ -0,0 +1,157 @@
+"""
+Parsers for the Gameday Accountability fines page.
+
+Every backend returns the same structure - {data-week: {'weekSummary': {...},
+'playerDetails': [[header...], [cell...], ...]}} - so they can be swapped
+freely. The fast backends only build the week table containers rather than the
+whole page. See scripts/benchmark_fines_parsers.py.
+"""
+import logging
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+TABLE_CLASS = "select-table__table"
+EXPECTED_HEADERS = ['Club', 'Player', 'Quarter', 'Time', 'Fine Category', 'Description', 'Amount']
+
+DEFAULT_BACKEND = "lxml"
+
+
+def _summary_pair(text: str):
+    if ':' in text:
+        key, val = text.split(':', 1)
+        return key.strip(), val.strip()
+    return None
+
+
+def _parse_soup_divs(divs) -> dict:
+    weekResults = {}
+    for div in divs:
+        week = div.get('data-week') # this is the week number for partitioning
+
+        weekSummary = {}
+        for p in div.find_all('p'): # the summary info is enclosed in <p> tags
+            pair = _summary_pair(p.get_text())
+            if pair:
+                weekSummary[pair[0]] = pair[1]
+
+        playerDetails = div.find('table')
+        rows = []
+        if playerDetails:
+            for tr in playerDetails.find_all('tr'):
+                row = [td.get_text(strip=True) for td in tr.find_all(['th', 'td'])]
+                if row:
+                    rows.append(row)
+
+        weekResults[week] = {'weekSummary': weekSummary, 'playerDetails': rows}
+
+    return weekResults
+
+
+def parse_html_parser(data: str) -> dict:
+    """Whole-page parse with the stdlib html.parser (the original, slowest path)."""
+    soup = BeautifulSoup(data, 'html.parser')
+    return _parse_soup_divs(soup.find_all('div', class_=TABLE_CLASS))
+
+
+def _parse_strained(data: str, features: str) -> dict:
+    # only the week containers (and their contents) are turned into tags
+    only_tables = SoupStrainer('div', class_=TABLE_CLASS)
+    soup = BeautifulSoup(data, features, parse_only=only_tables)
+    return _parse_soup_divs(soup.find_all('div', class_=TABLE_CLASS))
+
+
+def parse_strainer_html_parser(data: str) -> dict:
+    """BeautifulSoup + SoupStrainer on html.parser: no lxml needed."""
+    return _parse_strained(data, 'html.parser')
+
+
+def parse_strainer_lxml(data: str) -> dict:
+    """BeautifulSoup + SoupStrainer on lxml's tokenizer."""
+    return _parse_strained(data, 'lxml')
+
+
+def _stripped_text(element) -> str:
+    # same as bs4's get_text(strip=True): strip each text node, then join
+    return "".join(text.strip() for text in element.itertext())
+
+
+def parse_lxml(data: str) -> dict:
+    """lxml tree + XPath, skipping BeautifulSoup entirely. Fastest."""
+    import lxml.html
+
+    tree = lxml.html.fromstring(data)
+    weekResults = {}
+    divs = tree.xpath(
+        f"//div[contains(concat(' ', normalize-space(@class), ' '), ' {TABLE_CLASS} ')]"
+    )
+    for div in divs:
+        week = div.get('data-week')
+
+        weekSummary = {}
+        for p in div.xpath('.//p'):
+            pair = _summary_pair(p.text_content())
+            if pair:
+                weekSummary[pair[0]] = pair[1]
+
+        rows = []
+        tables = div.xpath('(.//table)[1]')
+        if tables:
+            for tr in tables[0].xpath('.//tr'):
+                row = [_stripped_text(cell) for cell in tr.xpath('.//th | .//td')]
+                if row:
+                    rows.append(row)
+
+        weekResults[week] = {'weekSummary': weekSummary, 'playerDetails': rows}
+
+    return weekResults
+
+
+PARSERS = {
+    'lxml': parse_lxml,
+    'strainer-lxml': parse_strainer_lxml,
+    'strainer-html.parser': parse_strainer_html_parser,
+    'html.parser': parse_html_parser,
+}
+
+
+def parse(data: str, backend: str = DEFAULT_BACKEND) -> dict:
+    """
+    Parse the fines page into weekResults.
+
+    Args:
+        data: Page HTML
+        backend: One of PARSERS. Falls back to strainer-html.parser if lxml
+            isn't installed.
+
+    Returns:
+        Dict of data-week -> {'weekSummary': dict, 'playerDetails': list of rows}
+    """
+    if backend not in PARSERS:
+        raise ValueError(f"Unknown fines parser {backend!r}; choose from {list(PARSERS)}")
+    try:
+        return PARSERS[backend](data)
+    except (ImportError, FeatureNotFound) as e:
+        logger.warning(f"Fines parser {backend!r} unavailable ({e}); falling back to strainer-html.parser")
+        return parse_strainer_html_parser(data)
+
+
+def structure_problems(weekResults: dict) -> list[str]:
+    """
+    Signs the page layout changed under the parser: no week tables, or week
+    tables whose header row isn't the expected one.
+    """
+    if not weekResults:
+        return [f"no div.{TABLE_CLASS} containers found"]
+
+    problems = []
+    for week, content in weekResults.items():
+        rows = content['playerDetails']
+        if not week:
+            problems.append("week container without a data-week attribute")
+        if rows and rows[0] != EXPECTED_HEADERS:
+            problems.append(f"{week}: unexpected headers {rows[0]}")
+        if not content['weekSummary']:
+            problems.append(f"{week}: no summary paragraphs")
+    return problems
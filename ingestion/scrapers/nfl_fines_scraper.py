@@ -1,101 +1,307 @@
 # scraping monetary fines data from NFL.com
 
 import requests
-from bs4 import BeautifulSoup
+import hashlib
 import json
+import logging
+import re
 import sys
 import os
 from datetime import datetime, timezone
+import polars as pl
 from dotenv import load_dotenv
 
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 
 from ingestion.storage import GCSWriter
-from ingestion.config import get_gcs_config
+from ingestion.config import (
+    DEFAULT_FINES_URL,
+    get_gcs_config,
+    get_ingestion_config,
+    get_parquet_profile,
+    get_scraper_config,
+)
+from ingestion.scrapers import fines_parser
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# week key for a container without a data-week attribute (also its partition)
+UNKNOWN_WEEK = 'unknown'
+
+# bump when the written output changes, so every week is re-emitted once
+STATE_VERSION = 3
+
+# page table headers -> raw column names
+FINE_COLUMNS = {
+    'Club': 'club',
+    'Player': 'player',
+    'Quarter': 'quarter',
+    'Time': 'game_time',
+    'Fine Category': 'fine_category',
+    'Description': 'description',
+    'Amount': 'amount',
+}
+
+# quarter number given to overtime fines, as in nflverse play-by-play
+OVERTIME_QUARTER = 5
+
+FINE_SCHEMA = {
+    'week_label': pl.String,
+    'week': pl.Int64,
+    **dict.fromkeys(FINE_COLUMNS.values(), pl.String),
+}
+
+SUMMARY_SCHEMA = {
+    'week_label': pl.String,
+    'week': pl.Int64,
+    'total_plays': pl.String,
+    'plays_resulting_in_fines': pl.String,
+    'pct_of_all_plays': pl.String,
+}
+
+
+def week_hash(content: dict) -> str:
+    """Stable hash of a week's summary and rows, for change detection."""
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def week_number(week: str) -> int | None:
+    """Week number from a data-week label, e.g. "week-7" -> 7."""
+    match = re.search(r"\d+", week or "")
+    return int(match.group()) if match else None
+
+
+def parse_int(column: pl.Expr) -> pl.Expr:
+    """Integer from a formatted string column, e.g. "$11,593" -> 11593."""
+    return column.str.replace_all(r"[^\d]", "").cast(pl.Int64, strict=False)
+
+
+def parse_quarter(column: pl.Expr) -> pl.Expr:
+    """Quarter number from the page's label, e.g. "2" -> 2; overtime ("OT") is quarter 5."""
+    label = column.str.strip_chars().str.to_uppercase()
+    return (
+        pl.when(label.is_in(['OT', 'OVERTIME']))
+        .then(pl.lit(OVERTIME_QUARTER, dtype=pl.Int64))
+        .otherwise(parse_int(label))
+    )
+
+
+def week_partition(week: str) -> str:
+    """Partition value for a data-week label, e.g. "week-7" -> "07"."""
+    match = re.search(r"\d+", week or "")
+    return f"{int(match.group()):02d}" if match else re.sub(r"[^\w-]", "_", week or UNKNOWN_WEEK)
+
 
 class NFLFinesScraper:
     """
     Scrape NFL fines data from NFL Gameday Accountability page
+
+    Requests are conditional (ETag / If-Modified-Since) and the fines dataset
+    manifest in GCS keeps a hash per week, so unchanged pages cost a 304 and only
+    new or changed weeks are written, whichever worker runs the scrape.
     """
-    URL = 'https://operations.nfl.com/inside-football-ops/rules-enforcement/gameday-accountability/'
+    URL = DEFAULT_FINES_URL
 
-    def scrape(self):
-        
-        data = requests.get(self.URL).text
-        soup = BeautifulSoup(data, 'html.parser')
-        
-        weekResults = {} 
-        for div in soup.find_all('div', class_='select-table__table'):
-            week = div.get('data-week') # this is the week number for partitioning
-
-            weekSummary = {} 
-            for p in div.find_all('p'): # the summary info is enclosed in <p> tags
-                text = p.get_text()
-                if ':' in text:
-                    key, val = text.split(':', 1)
-                    weekSummary[key.strip()] = val.strip()
-    
-            playerDetails = div.find('table')
-            rows = []
-            if playerDetails:
-                for tr in playerDetails.find_all('tr'):
-                    row = [td.get_text(strip=True) for td in tr.find_all(['th', 'td'])]
-                    if row: 
-                        rows.append(row)
-            
-            weekResults[week] = {'weekSummary': weekSummary, 'playerDetails': rows}
-
-        # convert to ndJSON for BQ
-        finesRecords = []
+    def __init__(
+        self,
+        season: int | None = None,
+        parser: str | None = None,
+        url: str | None = None,
+    ):
+        config = get_scraper_config()
+        self.url = url or config.fines_url
+        self.timeout = config.timeout
+        self.parser = parser or config.fines_parser
+        # the page only covers the current season
+        self.season = season or get_ingestion_config().current_season
+
+    @staticmethod
+    def _state_path() -> str:
+        # kept in the fines dataset manifest, under 'scraper'
+        return get_gcs_config().get_raw_path("nfl", "fines")
+
+    def load_state(self, gcs_writer) -> dict:
+        """Validators and week hashes from the last scrape ({} on the first run)."""
+        return gcs_writer.manifests.read(self._state_path()).get('scraper', {})
+
+    def save_state(self, gcs_writer, state: dict):
+        gcs_writer.manifests.update(self._state_path(), scraper=state)
+
+    def fetch(self, state: dict | None = None):
+        """
+        GET the page, conditionally if state has validators from a previous fetch.
+
+        Returns:
+            Tuple of (HTML, or None if unchanged since state, validators dict)
+        """
+        state = state or {}
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+        response = requests.get(self.url, headers=headers, timeout=self.timeout)
+        validators = {
+            'etag': response.headers.get('ETag', state.get('etag')),
+            'last_modified': response.headers.get('Last-Modified', state.get('last_modified')),
+        }
+        if response.status_code == 304:
+            return None, validators
+
+        response.raise_for_status()
+        return response.text, validators
+
+    def parse(self, data):
+        return fines_parser.parse(data, backend=self.parser)
+
+    def to_frames(self, weekResults):
+        """
+        Build typed frames from parsed weeks: one row per fine, and one row per
+        week for the week summaries (kept out of the fine rows).
+
+        Returns:
+            Tuple of (fines DataFrame, week summaries DataFrame)
+        """
+        scraped_at = datetime.now(timezone.utc)
+        fineRows = []
+        summaryRows = []
         for week, content in weekResults.items():
+            weekNumber = week_number(week)
+            summary = {key.lower(): val for key, val in content['weekSummary'].items()}
+            summaryRows.append({
+                'week_label': week,
+                'week': weekNumber,
+                'total_plays': summary.get('total plays'),
+                'plays_resulting_in_fines': summary.get('resulting in fines'),
+                'pct_of_all_plays': summary.get('% of all plays'),
+            })
+
             playerDetails = content.get("playerDetails", []) # get the player details for the week
             if not playerDetails:
                 continue
 
-            headers = playerDetails[0]
+            headers = [FINE_COLUMNS.get(h, h.lower().replace(' ', '_')) for h in playerDetails[0]]
             for row in playerDetails[1:]:
                 if len(row) == len(headers):
-                    record = dict(zip(headers, row))
-                    record.update({
-                        'week': week,
-                        'weekSummary': content['weekSummary'],
-                        'scraped_at': datetime.now(timezone.utc).isoformat(),
-                        'source_url': self.URL
-                    })
-                    finesRecords.append(record)
+                    fineRows.append({'week_label': week, 'week': weekNumber, **dict(zip(headers, row, strict=True))})
+
+        context = [
+            pl.lit(self.season, dtype=pl.Int64).alias('season'),
+            pl.lit(scraped_at, dtype=pl.Datetime("us", "UTC")).alias('scraped_at'),
+            pl.lit(self.url).alias('source_url'),
+        ]
+        fines = pl.DataFrame(fineRows, schema_overrides=FINE_SCHEMA, infer_schema_length=None)
+        if fines.is_empty():
+            fines = pl.DataFrame(schema=FINE_SCHEMA)
+        fines = fines.with_columns(
+            parse_int(pl.col('amount')).alias('amount'),
+            parse_quarter(pl.col('quarter')).alias('quarter'),
+            pl.col('quarter').alias('quarter_label'),
+            *context,
+        )
+        unparsed = fines.filter(
+            pl.col('quarter').is_null() & (pl.col('quarter_label').str.strip_chars() != "")
+        ).get_column('quarter_label').unique().to_list()
+        if unparsed:
+            logger.warning(f"Could not parse fine quarters {sorted(unparsed)}; kept in quarter_label")
+        summaries = pl.DataFrame(summaryRows, schema=SUMMARY_SCHEMA).with_columns(
+            parse_int(pl.col('total_plays')).alias('total_plays'),
+            parse_int(pl.col('plays_resulting_in_fines')).alias('plays_resulting_in_fines'),
+            pl.col('pct_of_all_plays').str.replace_all(r"[^\d.]", "").cast(pl.Float64, strict=False),
+            *context,
+        )
+        return fines, summaries
+
+    def scrape(self):
+        data, _ = self.fetch()
+        return self.to_frames(self.parse(data))
+
+    def scrape_changes(self, state: dict):
+        """
+        Fetch the page conditionally and return only weeks that are new or whose
+        content changed since state.
+
+        Returns:
+            Tuple of (changed weekResults, new state to save once they're written)
+        """
+        if state.get('version') != STATE_VERSION:
+            # output format changed; re-emit every week once
+            state = {}
+
+        data, validators = self.fetch(state)
+        weekHashes = dict(state.get('weeks', {}))
+        if data is None:
+            logger.info("Fines page not modified since last scrape")
+            return {}, {**state, **validators}
 
-        return finesRecords
+        changed = {}
+        for week, content in self.parse(data).items():
+            # a container without data-week would otherwise be keyed None, which
+            # the JSON state stores as "null" and never matches again
+            week = week or UNKNOWN_WEEK
+            digest = week_hash(content)
+            if weekHashes.get(week) != digest:
+                changed[week] = content
+                weekHashes[week] = digest
+
+        logger.info(f"Fines page has {len(changed)} new or changed weeks: {sorted(changed)}")
+        return changed, {**state, **validators, 'version': STATE_VERSION, 'weeks': weekHashes}
 
     def scrape_and_write(self, gcs_writer=None):
-        finesRecords = self.scrape()
-        ndjson_data = "\n".join(json.dumps(r) for r in finesRecords)
+        """
+        Write each new or changed week's fines and week summary as parquet to
+        their own season=/week= partitions (raw/nfl/fines and
+        raw/nfl/fines_week_summary).
 
+        Returns:
+            List of GCS URIs written (empty when nothing changed)
+        """
         if gcs_writer is None:
             config = get_gcs_config()
             gcs_writer = GCSWriter(bucket_name=config.bucket_name, project_id=config.project_id)
 
-        config = get_gcs_config()
-        path = config.get_raw_path("nfl", "fines")
+        state = self.load_state(gcs_writer)
+        changed, new_state = self.scrape_changes(state)
 
-        gcs_uri = gcs_writer.write_raw_data(
-            data=ndjson_data,
-            path=path,
-            filename='nfl_fines.ndjson',
-            include_timestamp=True
-        )
+        uris = self.write_weeks(changed, gcs_writer) if changed else []
 
-        return gcs_uri
+        # only remember weeks once they're safely written
+        self.save_state(gcs_writer, new_state)
+        return uris
 
-if __name__ == "__main__":
-    scraper = NFLFinesScraper()
-    gcs_uri = scraper.scrape_and_write()
-    print(f"Scraped and wrote fines data to: {gcs_uri}") 
+    def partition_items(self, weekResults) -> list:
+        """(DataFrame, GCS path) pairs for each week's fines and week summary."""
+        config = get_gcs_config()
+        items = []
+        for week, content in weekResults.items():
+            fines, summaries = self.to_frames({week: content})
+            partition = {'season': self.season, 'week': week_partition(week)}
+            if not fines.is_empty():
+                items.append((fines, config.get_raw_path("nfl", "fines", **partition)))
+            items.append((summaries, config.get_raw_path("nfl", "fines_week_summary", **partition)))
+        return items
 
+    def write_weeks(self, weekResults, gcs_writer=None) -> list[str]:
+        """
+        Write weeks' fines and week summaries to their season=/week= partitions.
 
+        Returns:
+            List of GCS URIs written
+        """
+        if gcs_writer is None:
+            config = get_gcs_config()
+            gcs_writer = GCSWriter(bucket_name=config.bucket_name, project_id=config.project_id)
 
+        items = self.partition_items(weekResults)
+        results = gcs_writer.write_many(items, profile=get_parquet_profile('fines')) if items else []
+        return [result.uri for result in results]
 
 
+if __name__ == "__main__":
+    scraper = NFLFinesScraper()
+    gcs_uris = scraper.scrape_and_write()
+    print(f"Scraped and wrote fines data to: {gcs_uris}")
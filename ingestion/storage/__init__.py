@@ -1,6 +1,7 @@
 """Storage layer for raw data persistence."""
 
 from ingestion.storage.gcs_writer import GCSWriter
-from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
+from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader, LoadRequest
+from ingestion.storage.manifest import ManifestStore
 
-__all__ = ["GCSWriter", "GCSToBigQueryLoader"]
+__all__ = ["GCSWriter", "GCSToBigQueryLoader", "LoadRequest", "ManifestStore"]
@@ -1,11 +1,177 @@
+import io
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+import polars as pl
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 from urllib.parse import urlparse
 
+from ingestion.config import TableLayout, get_bigquery_config
+from ingestion.storage.load_metrics import MetricsSink, get_metrics_sink
+
+logger = logging.getLogger(__name__)
+
+# BigQuery runs load jobs in parallel on its side; this just bounds how many
+# we have submitted at once
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_POLL_INTERVAL = 2.0
+
+# BigQuery allows at most four clustering columns
+MAX_CLUSTERING_FIELDS = 4
+
+# legacy type names the API reports for existing tables
+LEGACY_TYPES = {"INTEGER": "INT64", "FLOAT": "FLOAT64", "BOOLEAN": "BOOL"}
+
+
+@dataclass
+class LoadRequest:
+    gcs_uri: str | list[str]
+    table_id: str
+    write_mode: str = "replace"
+    hive_partition_prefix: Optional[str] = None
+    schema: Optional[list[bigquery.SchemaField]] = None
+    layout: Optional[TableLayout] = None
+    partition: Optional[int | str] = None
+
+
+@dataclass
+class LoadResult:
+    table_id: str
+    uris: list[str]
+    state: str  # DONE, FAILED or SKIPPED (content unchanged since the last load)
+    seconds: float
+    job_id: Optional[str] = None
+    input_bytes: Optional[int] = None
+    output_rows: Optional[int] = None
+    error: Optional[str] = None
+    write_mode: Optional[str] = None
+    partition: Optional[str] = None
+    input_files: Optional[int] = None
+    output_bytes: Optional[int] = None
+    slot_millis: Optional[int] = None
+    created: Optional[datetime] = None
+    started: Optional[datetime] = None
+    ended: Optional[datetime] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.state in ("DONE", "SKIPPED") and self.error is None
+
+    @property
+    def queue_seconds(self) -> Optional[float]:
+        """Time from submission until BigQuery started running the job."""
+        if self.created and self.started:
+            return (self.started - self.created).total_seconds()
+        return None
+
+    @property
+    def run_seconds(self) -> Optional[float]:
+        if self.started and self.ended:
+            return (self.ended - self.started).total_seconds()
+        return None
+
+    @classmethod
+    def from_job(
+        cls,
+        job: Optional[bigquery.LoadJob],
+        table_id: str,
+        uris: list[str],
+        seconds: float,
+        error: Optional[str] = None,
+        write_mode: Optional[str] = None,
+        partition: Optional[int | str] = None,
+    ) -> "LoadResult":
+        result = cls(
+            table_id=table_id,
+            uris=uris,
+            state="FAILED" if error else "DONE",
+            seconds=seconds,
+            error=error,
+            write_mode=write_mode,
+            partition=None if partition is None else str(partition),
+        )
+        if job is not None:
+            statistics = getattr(job, '_properties', {}).get('statistics', {})
+            result.job_id = job.job_id
+            result.input_files = job.input_files
+            result.input_bytes = job.input_file_bytes
+            result.output_rows = job.output_rows
+            result.output_bytes = job.output_bytes
+            result.slot_millis = int(statistics['totalSlotMs']) if statistics.get('totalSlotMs') else None
+            result.created, result.started, result.ended = job.created, job.started, job.ended
+        return result
+
+    def to_record(self, run_id: str) -> dict:
+        """Flat metrics record for a MetricsSink."""
+        record = asdict(self)
+        record.pop('uris')
+        for key in ('created', 'started', 'ended'):
+            if record[key] is not None:
+                record[key] = record[key].isoformat()
+        record.update(
+            run_id=run_id,
+            recorded_at=datetime.now(timezone.utc).isoformat(),
+            dataset=self.table_id.rsplit(".", 1)[-1],
+            queue_seconds=self.queue_seconds,
+            run_seconds=self.run_seconds,
+        )
+        return record
+
+
+def make_bigquery_client(project_id: str) -> bigquery.Client:
+    """
+    BigQuery client for a project. If BIGQUERY_API_ENDPOINT is set, the client
+    talks to that endpoint (e.g. a local emulator) with anonymous credentials.
+    """
+    api_endpoint = get_bigquery_config().api_endpoint
+    if not api_endpoint:
+        return bigquery.Client(project=project_id)
+
+    from google.auth.credentials import AnonymousCredentials
+
+    return bigquery.Client(
+        project=project_id,
+        credentials=AnonymousCredentials(),
+        client_options={"api_endpoint": api_endpoint},
+    )
+
+
 class GCSToBigQueryLoader:
 
-    def __init__(self, project_id: str):
-        self.client = bigquery.Client(project=project_id)
+    def __init__(
+        self,
+        project_id: str,
+        client: Optional[bigquery.Client] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        run_id: Optional[str] = None,
+    ):
+        self.client = client or make_bigquery_client(project_id)
+        self.metrics_sink = metrics_sink or get_metrics_sink(self.client)
+        # groups metrics from one pipeline run; Airflow exports the DAG run id to tasks
+        self.run_id = run_id or os.getenv("AIRFLOW_CTX_DAG_RUN_ID") or (
+            datetime.now(timezone.utc).strftime("manual__%Y-%m-%dT%H:%M:%S")
+        )
+
+    def _record(self, results: list[LoadResult]) -> None:
+        if self.metrics_sink is not None:
+            self.metrics_sink.emit([result.to_record(self.run_id) for result in results])
+
+    def record_skip(self, table_id: str, uris: Optional[list[str]] = None, partition: Optional[int | str] = None) -> LoadResult:
+        """Record a load skipped because its content was already loaded."""
+        result = LoadResult(
+            table_id=table_id,
+            uris=uris or [],
+            state="SKIPPED",
+            seconds=0.0,
+            partition=None if partition is None else str(partition),
+        )
+        self._record([result])
+        return result
 
     def _infer_source_format(self, gcs_uri: str) -> bigquery.SourceFormat:
         """
@@ -27,35 +193,409 @@ class GCSToBigQueryLoader:
         # Default to PARQUET if unknown
         return bigquery.SourceFormat.PARQUET
 
-    def load_from_gcs(self, gcs_uri: str, table_id: str, write_mode: str = "replace"):
-        """
-        Load data from GCS to BigQuery with automatic format detection.
-        
-        Args:
-            gcs_uri: GCS URI of the file to load
-            table_id: BigQuery table ID (format: project.dataset.table)
-            write_mode: "replace" to truncate table, "append" to add rows
-        """
-        source_format = self._infer_source_format(gcs_uri)
+    def _load_job_config(
+        self,
+        source_format: bigquery.SourceFormat,
+        write_mode: str,
+        hive_partition_prefix: Optional[str] = None,
+        schema: Optional[list[bigquery.SchemaField]] = None,
+    ) -> bigquery.LoadJobConfig:
         job_config = bigquery.LoadJobConfig(
             source_format=source_format,
             write_disposition=(
                 bigquery.WriteDisposition.WRITE_TRUNCATE
-                if write_mode == "replace"
+                if write_mode in ("replace", "replace_partition")
                 else bigquery.WriteDisposition.WRITE_APPEND
             ),
-            autodetect=True,
+            autodetect=schema is None,
             ignore_unknown_values=True,
         )
+
+        if schema is not None:
+            job_config.schema = schema
+            if write_mode != "replace":
+                job_config.schema_update_options = [bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
+            if source_format == bigquery.SourceFormat.PARQUET:
+                # load parquet lists as REPEATED columns, as registered
+                parquet_options = bigquery.ParquetOptions()
+                parquet_options.enable_list_inference = True
+                job_config.parquet_options = parquet_options
         
+        if hive_partition_prefix:
+            hive_options = bigquery.HivePartitioningOptions()
+            hive_options.mode = "AUTO"
+            hive_options.source_uri_prefix = hive_partition_prefix
+            job_config.hive_partitioning = hive_options
+
         # Add CSV-specific configuration for future use 
         if source_format == bigquery.SourceFormat.CSV:
             job_config.field_delimiter = ','
             job_config.skip_leading_rows = 0
             job_config.quote_character = '"'
 
-        job = self.client.load_table_from_uri(gcs_uri, table_id, job_config=job_config)
-        job.result()
+        return job_config
+
+    def submit_load(
+        self,
+        gcs_uri: str | list[str],
+        table_id: str,
+        write_mode: str = "replace",
+        hive_partition_prefix: Optional[str] = None,
+        schema: Optional[list[bigquery.SchemaField]] = None,
+        layout: Optional[TableLayout] = None,
+        partition: Optional[int | str] = None,
+    ) -> bigquery.LoadJob:
+        """Submit a load job without waiting for it. Args as for load_from_gcs."""
+        uris = [gcs_uri] if isinstance(gcs_uri, str) else list(gcs_uri)
+        if schema is not None and layout is not None:
+            self.ensure_table(table_id, schema, layout, recreate=write_mode == "replace")
+
+        destination = _destination(table_id, write_mode, partition)
+        job_config = self._load_job_config(
+            self._infer_source_format(uris[0]), write_mode, hive_partition_prefix, schema
+        )
+        return self.client.load_table_from_uri(uris, destination, job_config=job_config)
+
+    def load_from_gcs(
+        self,
+        gcs_uri: str | list[str],
+        table_id: str,
+        write_mode: str = "replace",
+        hive_partition_prefix: Optional[str] = None,
+        schema: Optional[list[bigquery.SchemaField]] = None,
+        layout: Optional[TableLayout] = None,
+        partition: Optional[int | str] = None,
+    ) -> LoadResult:
+        """
+        Load data from GCS to BigQuery with automatic format detection.
+        
+        Args:
+            gcs_uri: GCS URI of the file to load, or a list of URIs (e.g. one per
+                season partition) to load together in a single job
+            table_id: BigQuery table ID (format: project.dataset.table)
+            write_mode: "replace" to truncate table, "append" to add rows,
+                "replace_partition" to truncate only the given partition (every
+                row loaded must fall in it)
+            hive_partition_prefix: gs:// prefix above key=value partition folders.
+                If set, partition keys (e.g. season) are loaded as columns. Only
+                use it when the keys aren't already columns in the files.
+            schema: Explicit schema (see ingestion.schema_registry). If None, the
+                schema is autodetected. Don't combine with hive_partition_prefix.
+            layout: Partitioning and clustering for the table, applied via
+                ensure_table(). Needs schema.
+            partition: Partition ID for "replace_partition"; for season range
+                partitions, the season (e.g. 2025)
+
+        Returns:
+            LoadResult with the job's statistics (also sent to the metrics sink)
+        """
+        uris = [gcs_uri] if isinstance(gcs_uri, str) else list(gcs_uri)
+        start = time.perf_counter()
+        job = None
+        try:
+            job = self.submit_load(
+                uris, table_id, write_mode, hive_partition_prefix, schema, layout, partition
+            )
+            job.result()
+        except Exception as e:
+            self._record([LoadResult.from_job(
+                job, table_id, uris, time.perf_counter() - start, str(e), write_mode, partition
+            )])
+            raise
+
+        result = LoadResult.from_job(
+            job, table_id, uris, time.perf_counter() - start, write_mode=write_mode, partition=partition
+        )
+        self._record([result])
+        return result
+
+    def load_from_dataframe(
+        self,
+        df: pl.DataFrame,
+        table_id: str,
+        write_mode: str = "replace",
+        schema: Optional[list[bigquery.SchemaField]] = None,
+        layout: Optional[TableLayout] = None,
+        partition: Optional[int | str] = None,
+    ) -> LoadResult:
+        """
+        Load a frame straight into BigQuery: it's serialised to parquet in memory
+        and sent with the load request, so there's no staged GCS object. Meant for
+        small frames (see IngestionConfig.direct_load_max_bytes).
+
+        Args:
+            df: Frame to load
+            table_id, write_mode, schema, layout, partition: As for load_from_gcs
+
+        Returns:
+            LoadResult for the job (uris is empty)
+        """
+        if schema is not None and layout is not None:
+            self.ensure_table(table_id, schema, layout, recreate=write_mode == "replace")
+
+        destination = _destination(table_id, write_mode, partition)
+        job_config = self._load_job_config(bigquery.SourceFormat.PARQUET, write_mode, schema=schema)
+
+        buffer = io.BytesIO()
+        df.write_parquet(buffer)
+        size = buffer.tell()
+        buffer.seek(0)
+
+        start = time.perf_counter()
+        job = None
+        try:
+            job = self.client.load_table_from_file(buffer, destination, size=size, job_config=job_config)
+            job.result()
+        except Exception as e:
+            self._record([LoadResult.from_job(
+                job, table_id, [], time.perf_counter() - start, str(e), write_mode, partition
+            )])
+            raise
+
+        result = LoadResult.from_job(
+            job, table_id, [], time.perf_counter() - start, write_mode=write_mode, partition=partition
+        )
+        # file loads don't report input bytes
+        result.input_bytes = result.input_bytes or size
+        self._record([result])
+        logger.info(f"Loaded {len(df)} rows ({size / 1024:.0f} KB) into {table_id} directly in {result.seconds:.1f}s")
+        return result
+
+    def is_partitioned_on(self, table_id: str, field: str) -> bool:
+        """True if the table exists and is range-partitioned on field."""
+        try:
+            table = self.client.get_table(table_id)
+        except NotFound:
+            return False
+        partitioning = table.range_partitioning
+        return partitioning is not None and partitioning.field.lower() == field.lower()
+
+    def ensure_table(
+        self,
+        table_id: str,
+        schema: list[bigquery.SchemaField],
+        layout: TableLayout,
+        recreate: bool = False,
+    ) -> bigquery.Table:
+        """
+        Create a table with the given partitioning and clustering if it doesn't
+        exist. Partitioning and clustering only use fields present in schema.
+
+        Args:
+            table_id: BigQuery table ID (format: project.dataset.table)
+            schema: Table schema
+            layout: Partitioning and clustering to apply
+            recreate: If an existing table's layout differs, rebuild it in the
+                new layout (its contents are kept until the load replaces them)
+
+        Returns:
+            The table
+        """
+        names = {f.name.lower() for f in schema}
+        table = bigquery.Table(table_id, schema=schema)
+        if layout.partition_field and layout.partition_field.lower() in names:
+            table.range_partitioning = bigquery.RangePartitioning(
+                field=layout.partition_field,
+                range_=bigquery.PartitionRange(
+                    start=layout.partition_start,
+                    end=layout.partition_end,
+                    interval=layout.partition_interval,
+                ),
+            )
+        clustering = [f for f in layout.clustering_fields if f.lower() in names][:MAX_CLUSTERING_FIELDS]
+        table.clustering_fields = clustering or None
+
+        try:
+            existing = self.client.get_table(table_id)
+        except NotFound:
+            logger.info(
+                f"Creating {table_id} partitioned on {layout.partition_field if table.range_partitioning else None}, "
+                f"clustered by {clustering}"
+            )
+            return self.client.create_table(table)
+
+        if _layout_key(existing) == _layout_key(table):
+            self._retype_columns(existing, schema)
+            return existing
+        if not recreate:
+            logger.warning(f"{table_id} layout differs from the configured one; leaving it as is")
+            self._retype_columns(existing, schema)
+            return existing
+
+        # partitioning can't be changed in place. Rebuild the table from its own
+        # rows in one statement rather than dropping it, so if the load that
+        # follows fails, the old contents are still there (in the new layout).
+        logger.info(f"Rebuilding {table_id} to apply partitioning/clustering")
+        self.client.query(_rebuild_statement(existing, table, schema)).result()
+        return self.client.get_table(table_id)
+
+    def _retype_columns(self, table: bigquery.Table, schema: list[bigquery.SchemaField]) -> None:
+        """
+        Bring existing columns up to types the schema registry has since widened:
+        INT64 columns are altered to FLOAT64 in place, and NULL placeholder
+        STRING columns that got a real type are dropped, for the load to add
+        back typed (ALLOW_FIELD_ADDITION, or the truncate's new schema).
+        """
+        table_id = f"{table.project}.{table.dataset_id}.{table.table_id}"
+        wanted = {f.name.lower(): _standard_type(f.field_type) for f in schema}
+        for field in table.schema:
+            current, target = _standard_type(field.field_type), wanted.get(field.name.lower())
+            if target is None or target == current or field.mode == "REPEATED":
+                continue
+
+            if (current, target) == ("INT64", "FLOAT64"):
+                statement = f"ALTER TABLE `{table_id}` ALTER COLUMN `{field.name}` SET DATA TYPE FLOAT64"
+            elif current == "STRING" and self._all_null(table_id, field.name):
+                statement = f"ALTER TABLE `{table_id}` DROP COLUMN `{field.name}`"
+            else:
+                logger.warning(
+                    f"{table_id}.{field.name} is {current} but registered as {target}; "
+                    f"leaving it for the load to reject"
+                )
+                continue
+
+            logger.info(f"{table_id}.{field.name}: {current} -> {target}")
+            self.client.query(statement).result()
+
+    def _all_null(self, table_id: str, column: str) -> bool:
+        query = f"SELECT COUNTIF(`{column}` IS NOT NULL) AS n FROM `{table_id}`"
+        return next(iter(self.client.query(query).result())).n == 0
+
+    def load_many(
+        self,
+        requests: Iterable[LoadRequest],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> list[LoadResult]:
+        """
+        Run several load jobs concurrently, keeping at most max_in_flight submitted
+        and polling them together, so the whole batch takes about as long as its
+        slowest job rather than the sum of all of them.
+
+        A failed job doesn't stop the others; check LoadResult.ok.
+
+        Args:
+            requests: Loads to run
+            max_in_flight: Max jobs submitted but not finished at once
+            poll_interval: Seconds between polls of the running jobs
+
+        Returns:
+            LoadResult per request, in input order
+        """
+        requests = list(requests)
+        pending = list(range(len(requests)))[::-1]
+        results: dict[int, LoadResult] = {}
+        running: dict[int, tuple[bigquery.LoadJob, float]] = {}
+
+        def _finish(i: int, job: Optional[bigquery.LoadJob], started: float, error: Optional[str]):
+            request = requests[i]
+            uris = [request.gcs_uri] if isinstance(request.gcs_uri, str) else list(request.gcs_uri)
+            result = LoadResult.from_job(
+                job, request.table_id, uris, time.perf_counter() - started, error,
+                request.write_mode, request.partition
+            )
+            if error:
+                logger.error(f"Load into {result.table_id} failed after {result.seconds:.1f}s: {error}")
+            else:
+                logger.info(
+                    f"Loaded {result.output_rows} rows ({(result.input_bytes or 0) / 1024**2:.1f} MB) "
+                    f"into {result.table_id} in {result.seconds:.1f}s"
+                )
+            results[i] = result
+
+        while pending or running:
+            while pending and len(running) < max_in_flight:
+                i = pending.pop()
+                request = requests[i]
+                started = time.perf_counter()
+                try:
+                    job = self.submit_load(
+                        request.gcs_uri, request.table_id, request.write_mode,
+                        request.hive_partition_prefix, request.schema, request.layout,
+                        request.partition
+                    )
+                except Exception as e:
+                    _finish(i, None, started, str(e))
+                    continue
+                running[i] = (job, started)
+
+            if not running:
+                continue
+            time.sleep(poll_interval)
+
+            for i, (job, started) in list(running.items()):
+                try:
+                    if not job.done():
+                        continue
+                    error = job.error_result['message'] if job.error_result else None
+                except Exception as e:
+                    error = str(e)
+                del running[i]
+                _finish(i, job, started, error)
+
+        ordered = [results[i] for i in range(len(requests))]
+        self._record(ordered)
+        return ordered
+
+    def replace_rows(
+        self,
+        gcs_uri: str | list[str],
+        table_id: str,
+        column: str,
+        values: list,
+        schema: list[bigquery.SchemaField],
+        layout: Optional[TableLayout] = None,
+    ) -> LoadResult:
+        """
+        Replace the rows whose column value is in values (e.g. games being
+        re-ingested) with the rows in gcs_uri, atomically.
+
+        The file is loaded into a staging table first, then one transaction
+        deletes the old rows and inserts the new ones, so a failure at any step
+        leaves the table as it was rather than missing those rows.
+
+        Args:
+            gcs_uri: GCS URI(s) of the replacement rows
+            table_id: BigQuery table ID (format: project.dataset.table)
+            column: Column to match on
+            values: Values whose rows are replaced
+            schema: Schema of the rows (see ingestion.schema_registry)
+            layout: Partitioning and clustering, if the table has to be created
+
+        Returns:
+            LoadResult of the staging load
+        """
+        table = self.ensure_table(table_id, schema, layout or TableLayout(partition_field=None))
+        self._add_columns(table, schema)
+
+        staging_id = f"{table_id}__staging_{uuid.uuid4().hex[:8]}"
+        try:
+            result = self.load_from_gcs(gcs_uri, staging_id, write_mode="replace", schema=schema)
+
+            columns = ", ".join(f"`{field.name}`" for field in schema)
+            script = f"""
+                BEGIN TRANSACTION;
+                DELETE FROM `{table_id}` WHERE `{column}` IN UNNEST(@values);
+                INSERT INTO `{table_id}` ({columns}) SELECT {columns} FROM `{staging_id}`;
+                COMMIT TRANSACTION;
+            """
+            param_type = "INT64" if isinstance(values[0], int) else "STRING"
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("values", param_type, values)]
+            )
+            self.client.query(script, job_config=job_config).result()
+        finally:
+            self.client.delete_table(staging_id, not_found_ok=True)
+        return result
+
+    def _add_columns(self, table: bigquery.Table, schema: list[bigquery.SchemaField]) -> None:
+        """Add schema fields the table doesn't have yet (DDL can't run inside the transaction)."""
+        existing = {field.name.lower() for field in table.schema}
+        added = [field for field in schema if field.name.lower() not in existing]
+        if added:
+            table.schema = [*table.schema, *added]
+            self.client.update_table(table, ["schema"])
+            logger.info(f"Added columns {[field.name for field in added]} to {table.table_id}")
 
     def get_row_count(self, table_id: str) -> int:
         """Get row count for a table."""
@@ -63,4 +603,62 @@ class GCSToBigQueryLoader:
             table = self.client.get_table(table_id)
             return table.num_rows
         except NotFound:
-            return 0
\ No newline at end of file
+            return 0
+
+
+def _destination(table_id: str, write_mode: str, partition: Optional[int | str]) -> str:
+    if write_mode != "replace_partition":
+        return table_id
+    if partition is None:
+        raise ValueError("write_mode='replace_partition' needs a partition")
+    # the decorator scopes WRITE_TRUNCATE to that one partition
+    return f"{table_id}${partition}"
+
+
+def _standard_type(field_type: str) -> str:
+    return LEGACY_TYPES.get(field_type, field_type)
+
+
+def _rebuild_statement(
+    existing: bigquery.Table, table: bigquery.Table, schema: list[bigquery.SchemaField]
+) -> str:
+    """
+    CREATE OR REPLACE statement that rewrites existing with table's partitioning
+    and clustering, keeping its rows. Layout fields the existing table doesn't
+    have yet are added as NULLs of their registered type.
+    """
+    table_id = f"{existing.project}.{existing.dataset_id}.{existing.table_id}"
+    columns = {f.name.lower() for f in existing.schema}
+    types = {f.name.lower(): _standard_type(f.field_type) for f in schema}
+
+    partitioning = table.range_partitioning
+    layout_fields = ([partitioning.field] if partitioning else []) + list(table.clustering_fields or [])
+    added = [
+        f"CAST(NULL AS {types[name.lower()]}) AS `{name}`"
+        for name in dict.fromkeys(layout_fields) if name.lower() not in columns
+    ]
+
+    statement = f"CREATE OR REPLACE TABLE `{table_id}`"
+    if partitioning:
+        bounds = partitioning.range_
+        statement += (
+            f" PARTITION BY RANGE_BUCKET(`{partitioning.field}`,"
+            f" GENERATE_ARRAY({bounds.start}, {bounds.end}, {bounds.interval}))"
+        )
+    if table.clustering_fields:
+        statement += " CLUSTER BY " + ", ".join(f"`{name}`" for name in table.clustering_fields)
+    return statement + f" AS SELECT {', '.join(['*', *added])} FROM `{table_id}`"
+
+
+def _layout_key(table: bigquery.Table) -> tuple:
+    """Comparable (partitioning, clustering) summary of a table."""
+    partitioning = table.range_partitioning
+    return (
+        None if partitioning is None else (
+            partitioning.field,
+            partitioning.range_.start,
+            partitioning.range_.end,
+            partitioning.range_.interval,
+        ),
+        tuple(table.clustering_fields or ()),
+    )
@@ -1,28 +1,232 @@
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cache
+from typing import Iterable, Optional
+import logging
+import os
+import tempfile
+import time
+import uuid
+import google.auth
 import polars as pl
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+
+from ingestion.config import DEFAULT_PARQUET_PROFILE, ParquetProfile, get_gcs_config
+from ingestion.schema_registry import SchemaRegistry, drop_untyped
+from ingestion.storage.gcs_to_bq_loader import DEFAULT_MAX_IN_FLIGHT
+from ingestion.storage.manifest import ManifestStore, split_partition_path
+from ingestion.utils.hashing import frame_hash, schema_hash
+
+logger = logging.getLogger(__name__)
+
+# max concurrent uploads per writer
+DEFAULT_WRITE_WORKERS = 8
+
+# HTTP connections kept per shared storage client. Everything in the process
+# shares it, so it's sized for the widest fan-out the pipeline runs (write_many's
+# uploads, load_many's window) plus headroom for manifest and state updates
+# alongside them; requests' default pool keeps 10.
+STORAGE_POOL_SIZE = max(DEFAULT_WRITE_WORKERS, DEFAULT_MAX_IN_FLIGHT) + 4
+
+
+@dataclass
+class WriteResult:
+    path: str
+    uri: str
+    rows: int
+    seconds: float
+
+
+@cache
+def get_storage_client(project_id: Optional[str] = None) -> storage.Client:
+    """
+    Shared storage client per project, so tasks in the same process reuse one
+    authenticated session and connection pool instead of building a new client.
+    """
+    if os.getenv("STORAGE_EMULATOR_HOST"):
+        # emulators take anonymous requests; the client sets that up itself
+        return storage.Client(project=project_id) if project_id else storage.Client()
+
+    credentials, default_project = google.auth.default()
+    session = AuthorizedSession(credentials)
+    session.mount("https://", HTTPAdapter(pool_maxsize=STORAGE_POOL_SIZE))
+    return storage.Client(project=project_id or default_project, credentials=credentials, _http=session)
+
+
+def _object_name(path: str) -> str:
+    """
+    New object name under path. The timestamp keeps names in write order; the
+    random suffix keeps two writes to the same prefix in the same second apart.
+    """
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{path}/{timestamp}_{uuid.uuid4().hex[:8]}.parquet"
+
+
+def write_parquet_with_profile(data: pl.DataFrame, sink, profile: ParquetProfile) -> None:
+    """Serialise a frame to parquet using a dataset's write profile."""
+    kwargs = {
+        'compression': profile.compression,
+        'compression_level': profile.compression_level,
+        'statistics': profile.statistics,
+    }
+    if profile.row_group_size:
+        kwargs['row_group_size'] = profile.row_group_size
+    if not profile.use_dictionary:
+        # polars' native writer always dictionary-encodes; pyarrow lets us turn it off
+        kwargs['use_pyarrow'] = True
+        kwargs['pyarrow_options'] = {'use_dictionary': False}
+    data.write_parquet(sink, **kwargs)
+
 
 class GCSWriter:
-    def __init__(self, bucket_name: str, project_id: str = None):
-        self.client = storage.Client(project=project_id) if project_id else storage.Client()
+    def __init__(
+        self,
+        bucket_name: str,
+        project_id: str = None,
+        chunk_size: Optional[int] = None,
+        spool_max_bytes: Optional[int] = None,
+        client: Optional[storage.Client] = None,
+    ):
+        """
+        Args:
+            bucket_name: GCS bucket to write to
+            project_id: GCP project. Defaults to the client's default project.
+            chunk_size: Resumable upload chunk size in bytes (multiple of 256 KiB).
+                Defaults to GCSConfig.upload_chunk_size.
+            spool_max_bytes: Serialised parquet stays in memory up to this size,
+                then spills to disk. Defaults to GCSConfig.spool_max_bytes.
+            client: Storage client, e.g. a local stand-in. Defaults to the shared
+                client for project_id.
+        """
+        config = get_gcs_config()
+        self.client = client or get_storage_client(project_id)
         self.bucket = self.client.bucket(bucket_name)
+        self.manifests = ManifestStore(self.bucket)
+        self.schemas = SchemaRegistry(self.manifests)
+        self.chunk_size = chunk_size or config.upload_chunk_size
+        self.spool_max_bytes = spool_max_bytes or config.spool_max_bytes
+        # uploads only ever create objects (if_generation_match=0), so retrying
+        # a failed chunk can't overwrite another write's object
+        self.upload_retry = DEFAULT_RETRY.with_deadline(config.upload_retry_deadline)
+
+    def write(
+        self,
+        data: pl.DataFrame,
+        path: str,
+        skip_unchanged: bool = False,
+        profile: Optional[ParquetProfile] = None,
+    ) -> str:
+        """
+        Write dataframe to GCS as parquet and record it in the prefix's manifest.
+        Columns are cast to the dataset's registered schema first, and any new
+        columns are registered.
+
+        Args:
+            data: DataFrame to write
+            path: GCS path
+            skip_unchanged: If the frame's content hash matches the latest write
+                under path, skip the upload and return the existing URI
+            profile: Parquet write profile (codec, row groups, ...). Defaults to snappy.
+
+        Returns:
+            Full GCS URI
+        """
+        dataset_path, _ = split_partition_path(path)
+        data = self.schemas.conform(dataset_path, data)
+        written_schema = data.schema
+        data = drop_untyped(data)
+
+        content_hash = frame_hash(data)
+        if skip_unchanged:
+            manifest = self.manifests.read(path)
+            if manifest.get('uri') and manifest.get('content_hash') == content_hash:
+                logger.info(f"Content under {path} unchanged, reusing {manifest['uri']}")
+                return manifest['uri']
+
+        gcs_path = _object_name(path)
+
+        # Serialise to a spooled file (memory up to spool_max_bytes, then disk) and
+        # upload it in resumable chunks, so large files aren't copied in memory and
+        # a transient failure only retries the chunk in flight
+        with tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes) as spool:
+            write_parquet_with_profile(data, spool, profile or DEFAULT_PARQUET_PROFILE)
+            size = spool.tell()
+            spool.seek(0)
 
-    def write(self, data: pl.DataFrame, path: str) -> str:
-        """Write dataframe to GCS as parquet"""
-        import io
+            # small files go up in a single request; chunking only pays off when large
+            blob = self.bucket.blob(
+                gcs_path, chunk_size=self.chunk_size if size > self.chunk_size else None
+            )
+            blob.upload_from_file(
+                spool,
+                size=size,
+                content_type='application/octet-stream',
+                if_generation_match=0,
+                retry=self.upload_retry,
+            )
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
-        gcs_path = f"{path}/{timestamp}.parquet"
+        gcs_uri = f"gs://{self.bucket.name}/{gcs_path}"
+        self.schemas.register(dataset_path, written_schema)
+        self.manifests.record_write(
+            path, gcs_uri,
+            content_hash=content_hash,
+            row_count=len(data),
+            schema_hash=schema_hash(data),
+            columns=data.columns,
+        )
+        return gcs_uri
 
-        # Write to in-memory buffer
-        buffer = io.BytesIO()
-        data.write_parquet(buffer, compression="snappy")
-        parquet_bytes = buffer.getvalue()
+    def write_many(
+        self,
+        items: Iterable[tuple[pl.DataFrame, str]],
+        max_workers: int = DEFAULT_WRITE_WORKERS,
+        skip_unchanged: bool = False,
+        profile: Optional[ParquetProfile] = None,
+    ) -> list[WriteResult]:
+        """
+        Write several frames (e.g. per-season or per-week partitions) concurrently
+        from a bounded thread pool sharing this writer's client.
 
-        blob = self.bucket.blob(gcs_path)
-        blob.upload_from_string(parquet_bytes)
+        Args:
+            items: (DataFrame, GCS path) pairs
+            max_workers: Max uploads in flight
+            skip_unchanged: Passed through to write()
+            profile: Passed through to write()
 
-        return f"gs://{self.bucket.name}/{gcs_path}"
+        Returns:
+            WriteResult per item, in input order
+        """
+        def _write(data: pl.DataFrame, path: str) -> WriteResult:
+            start = time.perf_counter()
+            gcs_uri = self.write(data=data, path=path, skip_unchanged=skip_unchanged, profile=profile)
+            return WriteResult(path=path, uri=gcs_uri, rows=len(data), seconds=time.perf_counter() - start)
+
+        items = list(items)
+        if not items:
+            return []
+
+        results = []
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            futures = [pool.submit(_write, data, path) for data, path in items]
+            for (_, path), future in zip(items, futures, strict=True):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error writing {path}: {e}")
+                    failed.append(path)
+                    continue
+                logger.info(f"Wrote {result.rows} rows to {result.uri} in {result.seconds:.1f}s")
+                results.append(result)
+
+        if failed:
+            raise RuntimeError(f"Failed to write {len(failed)} of {len(items)} objects: {failed}")
+
+        return results
 
     def write_raw_data(self, data: str | bytes, path: str, filename: str, 
                        include_timestamp: bool = True) -> str:
@@ -51,5 +255,7 @@ class GCSWriter:
                  blob.upload_from_string(data, content_type='application/json')
             else: 
                  blob.upload_from_string(data)
-            
-            return f"gs://{self.bucket.name}/{gcs_path}"
\ No newline at end of file
+
+            gcs_uri = f"gs://{self.bucket.name}/{gcs_path}"
+            self.manifests.record_write(path, gcs_uri)
+            return gcs_uri
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Sinks for BigQuery load-job metrics.
+
+GCSToBigQueryLoader emits one record per load (or skipped load) with the job's
+statistics - bytes in, rows out, slot time, queue and run time - tagged with the
+dataset and run, so regressions and the datasets driving cost show up over time.
+See scripts/load_metrics_report.py.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Optional, Protocol
+
+from ingestion.config import get_bigquery_config
+
+logger = logging.getLogger(__name__)
+
+# schema for the optional metrics table; mirrors LoadResult.to_record()
+METRICS_TABLE_SCHEMA = [
+    ("run_id", "STRING"),
+    ("recorded_at", "TIMESTAMP"),
+    ("dataset", "STRING"),
+    ("table_id", "STRING"),
+    ("partition", "STRING"),
+    ("write_mode", "STRING"),
+    ("state", "STRING"),
+    ("error", "STRING"),
+    ("job_id", "STRING"),
+    ("input_files", "INT64"),
+    ("input_bytes", "INT64"),
+    ("output_rows", "INT64"),
+    ("output_bytes", "INT64"),
+    ("slot_millis", "INT64"),
+    ("created", "TIMESTAMP"),
+    ("started", "TIMESTAMP"),
+    ("ended", "TIMESTAMP"),
+    ("queue_seconds", "FLOAT64"),
+    ("run_seconds", "FLOAT64"),
+    ("seconds", "FLOAT64"),
+]
+
+
+class MetricsSink(Protocol):
+    def emit(self, records: list[dict]) -> None: ...
+
+
+class JsonLinesSink:
+    """Append records to a local JSON-lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, records: list[dict]) -> None:
+        if not records:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lines = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        with self._lock, open(self.path, "a") as f:
+            f.write(lines)
+
+
+class BigQueryTableSink:
+    """Append records to a BigQuery table (created on first use by the load job)."""
+
+    def __init__(self, client, table_id: str):
+        self.client = client
+        self.table_id = table_id
+
+    def emit(self, records: list[dict]) -> None:
+        if not records:
+            return
+        from google.cloud import bigquery
+
+        job_config = bigquery.LoadJobConfig(
+            schema=[bigquery.SchemaField(name, field_type) for name, field_type in METRICS_TABLE_SCHEMA],
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            ignore_unknown_values=True,
+        )
+        self.client.load_table_from_json(records, self.table_id, job_config=job_config).result()
+
+
+class MultiSink:
+    """Fan records out to several sinks; a failing sink never fails the load."""
+
+    def __init__(self, sinks: list[MetricsSink]):
+        self.sinks = sinks
+
+    def emit(self, records: list[dict]) -> None:
+        for sink in self.sinks:
+            try:
+                sink.emit(records)
+            except Exception as e:
+                logger.warning(f"Could not write load metrics to {type(sink).__name__}: {e}")
+
+
+def get_metrics_sink(client=None) -> Optional[MetricsSink]:
+    """
+    Sink configured by LOAD_METRICS_PATH (JSON lines) and LOAD_METRICS_TABLE
+    (BigQuery table, needs client), or None if both are disabled.
+    """
+    config = get_bigquery_config()
+    sinks: list[MetricsSink] = []
+    if config.load_metrics_path:
+        sinks.append(JsonLinesSink(os.path.expanduser(config.load_metrics_path)))
+    if config.load_metrics_table and client is not None:
+        sinks.append(BigQueryTableSink(client, config.load_metrics_table))
+    return MultiSink(sinks) if sinks else None
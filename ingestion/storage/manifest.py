@@ -0,0 +1,216 @@
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from google.cloud.exceptions import NotFound, PreconditionFailed
+
+logger = logging.getLogger(__name__)
+
+# concurrent writers (e.g. season workers) retry their manifest update on conflict
+MAX_UPDATE_ATTEMPTS = 10
+
+# GCSWriter.write_raw_data puts each file in a <timestamp>/ folder
+TIMESTAMP_DIR_RE = re.compile(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}")
+
+
+class ManifestStore:
+    """
+    Small JSON manifest kept next to each dataset/partition prefix in GCS
+    (<path>/_manifest.json), recording what was last written and loaded.
+
+    Doubles as the "latest file" pointer for the prefix, so loaders can find the
+    current file without listing every timestamped blob under it.
+
+    Fields:
+        uri: GCS URI of the latest file written under the prefix
+        content_hash: content hash of that file's frame (None for raw files)
+        row_count: rows in that file, if known
+        schema_hash: hash of its column names and dtypes, if known
+        written_at: when it was written
+        loaded_uri / loaded_hash / loaded_at: the last file successfully loaded
+            to BigQuery
+        direct_load_table / direct_loaded_at: set when the frame was loaded
+            straight into BigQuery (loaded_uri is its archive copy, if any)
+        partitions: (dataset-level manifest only) partition suffix, e.g.
+            "season=2024", -> latest file of that partition, so every partition
+            of a dataset can be found from one object
+        scraper: (raw/nfl/fines only) ETag / Last-Modified and per-week hashes
+            from the last fines page scrape
+    """
+
+    FILENAME = "_manifest.json"
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+
+    def _blob(self, path: str):
+        return self.bucket.blob(f"{path}/{self.FILENAME}")
+
+    def read(self, path: str) -> dict:
+        """Read the manifest for a prefix, or {} if there isn't one yet."""
+        try:
+            return json.loads(self._blob(path).download_as_text())
+        except NotFound:
+            return {}
+
+    def modify(self, path: str, modify: Callable[[dict], None]) -> dict:
+        """
+        Read-modify-write the manifest for a prefix with a generation precondition,
+        retrying if another writer updated it in between.
+        """
+        name = f"{path}/{self.FILENAME}"
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            blob = self.bucket.get_blob(name)
+            generation = 0 if blob is None else blob.generation
+            try:
+                manifest = {} if blob is None else json.loads(
+                    blob.download_as_text(if_generation_match=generation)
+                )
+                modify(manifest)
+                self.bucket.blob(name).upload_from_string(
+                    json.dumps(manifest, default=str),
+                    content_type='application/json',
+                    if_generation_match=generation,
+                )
+                return manifest
+            except (PreconditionFailed, NotFound):
+                continue
+        raise RuntimeError(f"Could not update {name} after {MAX_UPDATE_ATTEMPTS} attempts")
+
+    def update(self, path: str, **fields) -> dict:
+        """Merge fields into the manifest for a prefix and write it back."""
+        return self.modify(path, lambda manifest: manifest.update(fields))
+
+    def record_write(
+        self,
+        path: str,
+        uri: str,
+        content_hash: Optional[str] = None,
+        row_count: Optional[int] = None,
+        schema_hash: Optional[str] = None,
+        columns: Optional[list[str]] = None,
+    ) -> dict:
+        """
+        Point the prefix's manifest at a newly written file. If the prefix is a
+        partition (e.g. raw/nfl/pbp/season=2024), also register it in the
+        dataset-level manifest.
+
+        Args:
+            columns: Columns in the written file, used to note which partition
+                keys also exist as data columns
+        """
+        written_at = datetime.now(timezone.utc).isoformat()
+        manifest = self.update(
+            path,
+            uri=uri,
+            content_hash=content_hash,
+            row_count=row_count,
+            schema_hash=schema_hash,
+            written_at=written_at,
+        )
+
+        dataset_path, partition = split_partition_path(path)
+        if partition:
+            keys = [segment.split("=", 1)[0] for segment in partition.split("/")]
+            entry = {
+                'uri': uri,
+                'row_count': row_count,
+                'written_at': written_at,
+                'keys_in_data': [key for key in keys if columns is not None and key in columns],
+            }
+            self.modify(
+                dataset_path,
+                lambda dataset: dataset.setdefault('partitions', {}).__setitem__(partition, entry),
+            )
+        return manifest
+
+    def partitions(self, dataset_path: str, keys: tuple[str, ...] = ('season',)) -> dict[str, dict]:
+        """
+        Latest file of every partition of a dataset partitioned by exactly these keys.
+
+        Args:
+            dataset_path: Dataset prefix, e.g. raw/nfl/rosters
+            keys: Partition keys, in path order
+
+        Returns:
+            Dict of partition suffix (e.g. "season=2024") -> entry with uri,
+            row_count, written_at and keys_in_data, sorted by suffix
+        """
+        partitions = self.read(dataset_path).get('partitions', {})
+        return {
+            partition: entry
+            for partition, entry in sorted(partitions.items())
+            if tuple(segment.split("=", 1)[0] for segment in partition.split("/")) == keys
+        }
+
+    def latest_uri(self, path: str) -> Optional[str]:
+        """URI of the latest file written under path, or None without a manifest."""
+        return self.read(path).get('uri')
+
+    def is_loaded(self, path: str, uri: str) -> bool:
+        """True if uri is the latest write under path and its content is already loaded."""
+        manifest = self.read(path)
+        return (
+            manifest.get('uri') == uri
+            and manifest.get('content_hash') is not None
+            and manifest.get('loaded_hash') == manifest.get('content_hash')
+        )
+
+    def mark_loaded(self, path: str, uri: str) -> None:
+        """Record that uri (the latest write under path) was loaded successfully."""
+        def _mark(manifest: dict) -> None:
+            if manifest.get('uri') != uri:
+                logger.warning(f"Not marking {uri} loaded: manifest for {path} points at {manifest.get('uri')}")
+                return
+            manifest.update(
+                loaded_uri=uri,
+                loaded_hash=manifest.get('content_hash'),
+                loaded_at=datetime.now(timezone.utc).isoformat(),
+            )
+
+        self.modify(path, _mark)
+
+    def record_direct_load(self, path: str, table_id: str, content_hash: str, uri: Optional[str] = None) -> None:
+        """
+        Record that a frame was loaded straight into BigQuery rather than from a
+        file, optionally archived to uri.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        self.update(
+            path,
+            loaded_uri=uri,
+            loaded_hash=content_hash,
+            loaded_at=now,
+            direct_load_table=table_id,
+            direct_loaded_at=now,
+        )
+
+    def loaded_directly(self, path: str) -> bool:
+        """True if the last thing loaded for path was a direct load, with no newer file since."""
+        manifest = self.read(path)
+        direct_loaded_at = manifest.get('direct_loaded_at')
+        written_at = manifest.get('written_at')
+        return direct_loaded_at is not None and (written_at is None or written_at <= direct_loaded_at)
+
+
+def path_from_uri(gcs_uri: str) -> str:
+    """
+    Prefix (dataset/partition path) a gs://bucket/<path>/<file> URI was written
+    under. Raw files written as <path>/<timestamp>/<file> map to <path> too.
+    """
+    path = gcs_uri.split("/", 3)[3].rsplit("/", 1)[0]
+    head, _, last = path.rpartition("/")
+    return head if head and TIMESTAMP_DIR_RE.fullmatch(last) else path
+
+
+def split_partition_path(path: str) -> tuple[str, str]:
+    """
+    Split a raw path into its dataset prefix and partition suffix, e.g.
+    raw/nfl/pbp/season=2025/week=07 -> (raw/nfl/pbp, season=2025/week=07).
+    """
+    segments = path.split("/")
+    for i, segment in enumerate(segments):
+        if "=" in segment:
+            return "/".join(segments[:i]), "/".join(segments[i:])
+    return path, ""
@@ -0,0 +1,86 @@
+"""Content hashing helpers for change detection."""
+
+import hashlib
+
+import polars as pl
+
+# fixed seed so hashes are comparable across runs (polars row hashes are only
+# stable for a given polars version, which is fine for change detection - a
+# version bump just looks like a one-off change)
+HASH_SEED = 0
+
+
+def group_hashes(df: pl.DataFrame, key: str) -> dict[str, str]:
+    """
+    Compute an order-insensitive content hash for each group of rows sharing a key.
+
+    Args:
+        df: DataFrame to hash
+        key: Column to group by (e.g. 'game_id')
+
+    Returns:
+        Dict of key value -> hash string
+    """
+    if df.is_empty():
+        return {}
+
+    # keep the top 32 bits of each row hash so a per-group sum can't overflow
+    row_hash = df.hash_rows(seed=HASH_SEED) // 2**32
+    grouped = (
+        df.select(pl.col(key))
+        .with_columns(row_hash.alias('_row_hash'))
+        .group_by(key)
+        .agg(pl.col('_row_hash').sum().alias('_sum'), pl.len().alias('_rows'))
+    )
+    return {
+        str(row[key]): f"{row['_sum']:x}-{row['_rows']}"
+        for row in grouped.iter_rows(named=True)
+    }
+
+
+def _categoricals_as_strings(df: pl.DataFrame) -> pl.DataFrame:
+    categoricals = [name for name, dtype in df.schema.items() if dtype == pl.Categorical]
+    if categoricals:
+        df = df.with_columns([pl.col(name).cast(pl.String) for name in categoricals])
+    return df
+
+
+def row_hashes(df: pl.DataFrame) -> pl.Series:
+    """
+    Content hash of each row, for diffing two extracts row by row.
+
+    Categorical columns are hashed by value, as in frame_hash.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        UInt64 Series, one hash per row
+    """
+    return _categoricals_as_strings(df).hash_rows(seed=HASH_SEED)
+
+
+def frame_hash(df: pl.DataFrame) -> str:
+    """
+    Compute a content hash for a whole frame (schema + row values, in order).
+
+    Categorical columns are hashed by value rather than by their physical codes,
+    which depend on the order strings were first seen.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest string
+    """
+    df = _categoricals_as_strings(df)
+
+    digest = hashlib.sha256(str(list(df.schema.items())).encode())
+    if not df.is_empty():
+        digest.update(df.hash_rows(seed=HASH_SEED).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def schema_hash(df: pl.DataFrame) -> str:
+    """Short hash of a frame's column names and dtypes, for spotting schema drift."""
+    return hashlib.sha256(str(list(df.schema.items())).encode()).hexdigest()[:16]
@@ -0,0 +1,121 @@
+"""
+Backfill past seasons of NFL fines from archived copies of the fines page.
+
+Fetches the seasons concurrently (see ingestion/scrapers/fines_backfill.py) and
+writes each season's weeks to raw/nfl/fines and raw/nfl/fines_week_summary.
+Snapshots that can't be fetched don't stop the rest: everything fetched is
+written, the failed snapshots are listed, and the script exits non-zero.
+
+With --local, a local HTTP stand-in serves the fixture page for every request
+instead of the archive, and nothing is written: an offline check of the
+fetch/retry/parse path. --fail-every makes the stand-in answer every Nth
+request with a 503 to exercise the retries.
+
+Usage:
+    python scripts/backfill_fines.py --seasons 2019 2020 2021 2022 2023 2024
+    python scripts/backfill_fines.py --seasons 2022 2023 --every-days 7 --concurrency 8
+    python scripts/backfill_fines.py --seasons 2015 2016 2017 2018 --local --fail-every 3
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from ingestion.scrapers.fines_backfill import FinesBackfill, snapshot_targets
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURE = os.path.join(
+    project_root, "ingestion", "scrapers", "fixtures", "gameday_accountability.html"
+)
+
+
+def serve_fixture(path: str, fail_every: int = 0, latency: float = 0.2) -> ThreadingHTTPServer:
+    """Serve the fixture page for every GET on a free local port, in a background thread."""
+    with open(path, "rb") as f:
+        body = f.read()
+    requests_seen = iter(range(1, 1_000_000))
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                n = next(requests_seen)
+            time.sleep(latency)  # stand in for network round-trips
+            if fail_every and n % fail_every == 0:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seasons', type=int, nargs='+', required=True, help="seasons to backfill")
+    parser.add_argument('--every-days', type=int, default=None, help="also fetch in-season copies this often")
+    parser.add_argument('--concurrency', type=int, default=None, help="max requests in flight")
+    parser.add_argument('--rate', type=float, default=None, help="max requests per second (0 = unlimited)")
+    parser.add_argument('--local', action='store_true', help="fetch from a local stand-in serving --fixture; write nothing")
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE, help="page the local stand-in serves")
+    parser.add_argument('--fail-every', type=int, default=0, help="local stand-in answers every Nth request with 503")
+    args = parser.parse_args()
+
+    targets = snapshot_targets(args.seasons, every_days=args.every_days)
+    start = time.perf_counter()
+
+    if args.local:
+        server = serve_fixture(args.fixture, fail_every=args.fail_every)
+        archive_url = f"http://127.0.0.1:{server.server_port}/web"
+        backfill = FinesBackfill(
+            archive_url=archive_url, concurrency=args.concurrency, rate=args.rate, backoff=0.1
+        )
+        seasons, failed = asyncio.run(backfill.fetch(targets))
+        server.shutdown()
+
+        items = backfill.partition_items(seasons)
+        for data, path in items:
+            logger.info(f"{path}: {len(data)} rows")
+        logger.info(
+            f"Fetched {len(targets) - len(failed)} of {len(targets)} pages for {len(seasons)} seasons "
+            f"({len(items)} partitions) in {time.perf_counter() - start:.2f}s"
+        )
+    else:
+        backfill = FinesBackfill(concurrency=args.concurrency, rate=args.rate)
+        uris, failed = asyncio.run(backfill.backfill_and_write(targets))
+        logger.info(
+            f"Wrote {len(uris)} files for {len(targets) - len(failed)} of {len(targets)} pages "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+    if failed:
+        for target in failed:
+            logger.error(f"Not backfilled: season {target.season} snapshot {target.timestamp}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
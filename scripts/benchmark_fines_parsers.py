@@ -0,0 +1,106 @@
+"""
+Benchmark fines page parser backends offline.
+
+Parses a saved copy of the Gameday Accountability page with every backend in
+ingestion/scrapers/fines_parser.py, reporting parse time and peak Python memory,
+and checks that every backend agrees and that the page still has the structure
+the scraper expects. Exits non-zero on a mismatch or structure problem, so it
+doubles as an offline regression check.
+
+Usage:
+    python scripts/benchmark_fines_parsers.py
+    python scripts/benchmark_fines_parsers.py --repeats 50 --backends lxml html.parser
+    python scripts/benchmark_fines_parsers.py --refresh   # re-save the fixture from the live page
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import polars as pl
+
+from ingestion.scrapers import fines_parser
+from ingestion.scrapers.nfl_fines_scraper import NFLFinesScraper
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURE = os.path.join(
+    project_root, "ingestion", "scrapers", "fixtures", "gameday_accountability.html"
+)
+
+
+def benchmark(html: str, backends: list[str], repeats: int) -> tuple[pl.DataFrame, list[str]]:
+    reference = fines_parser.parse_html_parser(html)
+    problems = [f"page: {problem}" for problem in fines_parser.structure_problems(reference)]
+
+    rows = []
+    for name in backends:
+        parse = fines_parser.PARSERS[name]
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = parse(html)
+            times.append(time.perf_counter() - start)
+
+        # tracemalloc only sees Python allocations, not lxml's C-side tree
+        tracemalloc.start()
+        parse(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        matches = result == reference
+        if not matches:
+            problems.append(f"{name}: output differs from html.parser")
+
+        rows.append({
+            'backend': name,
+            'parse_ms': round(min(times) * 1000, 2),
+            'peak_kb': round(peak / 1024, 1),
+            'weeks': len(result),
+            'rows': sum(max(len(week['playerDetails']) - 1, 0) for week in result.values()),
+            'matches': matches,
+        })
+        logger.info(f"{name}: {rows[-1]}")
+
+    return pl.DataFrame(rows).sort('parse_ms'), problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE, help="saved page to parse")
+    parser.add_argument('--backends', nargs='*', default=list(fines_parser.PARSERS), help="backends to compare")
+    parser.add_argument('--repeats', type=int, default=20, help="parses per backend (best is kept)")
+    parser.add_argument('--refresh', action='store_true', help="download the live page over the fixture first")
+    args = parser.parse_args()
+
+    if args.refresh:
+        html, _ = NFLFinesScraper().fetch()
+        with open(args.fixture, "w") as f:
+            f.write(html)
+        logger.info(f"Saved live page to {args.fixture}")
+
+    with open(args.fixture) as f:
+        html = f.read()
+
+    results, problems = benchmark(html, args.backends, args.repeats)
+    with pl.Config(tbl_rows=-1):
+        print(results)
+
+    for problem in problems:
+        logger.error(problem)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
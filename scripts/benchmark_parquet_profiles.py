@@ -0,0 +1,117 @@
+"""
+Benchmark parquet write profiles for a dataset.
+
+Extracts a sample of a dataset and, for each candidate profile, measures encode
+time and file size - and optionally BigQuery load time into a scratch table -
+so the profiles in ingestion/config.py can be picked from measurements.
+
+Usage:
+    python scripts/benchmark_parquet_profiles.py pbp --seasons 2024 --sample-rows 200000
+    python scripts/benchmark_parquet_profiles.py player_stats --bq-dataset nfl_scratch
+"""
+import argparse
+import io
+import logging
+import os
+import sys
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import polars as pl
+
+from ingestion.config import ParquetProfile, get_parquet_profile
+from ingestion.nfl.extractor import NFLExtractor
+from ingestion.storage.gcs_writer import write_parquet_with_profile
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ID = os.getenv("GCP_PROJECT_ID", "sports-analytics-475802")
+
+CANDIDATE_PROFILES = {
+    'snappy': ParquetProfile(compression="snappy"),
+    'snappy-no-dict': ParquetProfile(compression="snappy", use_dictionary=False),
+    'lz4': ParquetProfile(compression="lz4"),
+    'zstd-1': ParquetProfile(compression="zstd", compression_level=1),
+    'zstd-3': ParquetProfile(compression="zstd", compression_level=3),
+    'zstd-3-rg50k': ParquetProfile(compression="zstd", compression_level=3, row_group_size=50_000),
+    'zstd-3-rg250k': ParquetProfile(compression="zstd", compression_level=3, row_group_size=250_000),
+    'zstd-9': ParquetProfile(compression="zstd", compression_level=9),
+    'gzip-6': ParquetProfile(compression="gzip", compression_level=6),
+}
+
+
+def bq_load_seconds(buffer: io.BytesIO, table_id: str) -> float:
+    """Load a parquet buffer into a scratch table and return the job's wall time."""
+    from google.cloud import bigquery
+
+    client = bigquery.Client(project=PROJECT_ID)
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+    )
+    buffer.seek(0)
+    start = time.perf_counter()
+    client.load_table_from_file(buffer, table_id, job_config=job_config).result()
+    seconds = time.perf_counter() - start
+    client.delete_table(table_id, not_found_ok=True)
+    return seconds
+
+
+def benchmark(data_type: str, df: pl.DataFrame, repeats: int, bq_dataset: str | None) -> pl.DataFrame:
+    profiles = dict(CANDIDATE_PROFILES)
+    profiles['current'] = get_parquet_profile(data_type)
+
+    rows = []
+    for name, profile in profiles.items():
+        encode_times = []
+        for _ in range(repeats):
+            buffer = io.BytesIO()
+            start = time.perf_counter()
+            write_parquet_with_profile(df, buffer, profile)
+            encode_times.append(time.perf_counter() - start)
+
+        result = {
+            'profile': name,
+            'encode_ms': round(min(encode_times) * 1000, 1),
+            'size_mb': round(buffer.tell() / 1024**2, 3),
+            'ratio': round(df.estimated_size() / buffer.tell(), 2),
+        }
+        if bq_dataset:
+            table_id = f"{PROJECT_ID}.{bq_dataset}._bench_{data_type}_{name.replace('-', '_')}"
+            result['bq_load_s'] = round(bq_load_seconds(buffer, table_id), 2)
+
+        logger.info(f"{data_type} / {name}: {result}")
+        rows.append(result)
+
+    return pl.DataFrame(rows).sort('size_mb')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('data_type', help="nflreadpy data type, e.g. pbp")
+    parser.add_argument('--seasons', type=int, nargs='*', help="seasons to sample (default: current)")
+    parser.add_argument('--sample-rows', type=int, default=100_000, help="rows to benchmark on")
+    parser.add_argument('--repeats', type=int, default=3, help="encode runs per profile (best is kept)")
+    parser.add_argument('--bq-dataset', help="scratch BigQuery dataset; if set, also time load jobs")
+    args = parser.parse_args()
+
+    extractor = NFLExtractor()
+    df = extractor.prepare(args.data_type, extractor.extract(args.data_type, seasons=args.seasons))
+    # head rather than a random sample, to keep the sort order encoding depends on
+    df = df.head(args.sample_rows)
+
+    logger.info(f"Benchmarking {len(CANDIDATE_PROFILES) + 1} profiles on {len(df)} rows of {args.data_type}")
+    with pl.Config(tbl_rows=-1):
+        print(benchmark(args.data_type, df, args.repeats, args.bq_dataset))
+
+
+if __name__ == "__main__":
+    main()
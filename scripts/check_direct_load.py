@@ -0,0 +1,266 @@
+"""
+Check the direct-to-BigQuery load path of NFLExtractor.extract_load.
+
+Runs three extracts of a small synthetic frame through extract_load and checks
+what happened after each:
+
+    1. direct:   the frame fits under direct_load_max_bytes, so it's loaded
+                 straight into BigQuery, archived to GCS and recorded as a
+                 direct load (the load DAG's loaded_directly skip applies)
+    2. skip:     the same frame again is recognised as already loaded; no job
+    3. fallback: a changed frame over direct_load_max_bytes is written to GCS
+                 for the load DAG instead, and loaded_directly is cleared
+
+By default BigQuery and GCS are in-process stand-ins that keep tables and
+objects in memory, so this runs offline. With --emulator the configured
+clients are used instead: point BIGQUERY_API_ENDPOINT and STORAGE_EMULATOR_HOST
+at local emulators (with GCP_PROJECT_ID, GCS_RAW_BUCKET and the raw dataset
+created there). Exits non-zero if any check fails.
+
+Usage:
+    python scripts/check_direct_load.py
+    python scripts/check_direct_load.py --rows 5000
+    BIGQUERY_API_ENDPOINT=http://localhost:9050 STORAGE_EMULATOR_HOST=http://localhost:4443 \\
+        python scripts/check_direct_load.py --emulator
+"""
+import argparse
+import io
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import polars as pl
+from google.cloud.exceptions import NotFound, PreconditionFailed
+
+from ingestion.config import IngestionConfig, get_bigquery_config, get_gcs_config
+from ingestion.nfl.extractor import NFLExtractor
+from ingestion.storage.gcs_to_bq_loader import GCSToBigQueryLoader
+from ingestion.storage.gcs_writer import GCSWriter
+from ingestion.storage.load_metrics import JsonLinesSink
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+DATA_TYPE = 'teams'
+
+
+class LocalBlob:
+    """Object in a LocalBucket, with the generation preconditions ManifestStore relies on."""
+
+    def __init__(self, bucket: "LocalBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def generation(self) -> int:
+        return self.bucket.objects[self.name][1]
+
+    def _check(self, if_generation_match):
+        current = self.bucket.objects.get(self.name, (None, 0))[1]
+        if if_generation_match is not None and if_generation_match != current:
+            raise PreconditionFailed(f"{self.name}: generation {current} != {if_generation_match}")
+
+    def download_as_bytes(self, if_generation_match=None) -> bytes:
+        if self.name not in self.bucket.objects:
+            raise NotFound(self.name)
+        self._check(if_generation_match)
+        return self.bucket.objects[self.name][0]
+
+    def download_as_text(self, if_generation_match=None) -> str:
+        return self.download_as_bytes(if_generation_match).decode()
+
+    # retry, chunk sizes and other transport options don't apply in memory
+    def upload_from_string(self, data, content_type=None, if_generation_match=None, **_options) -> None:
+        self._check(if_generation_match)
+        data = data.encode() if isinstance(data, str) else data
+        self.bucket.objects[self.name] = (data, next(self.bucket.generations))
+        self.content_type = content_type
+
+    def upload_from_file(self, file, size=None, content_type=None, if_generation_match=None, **_options) -> None:
+        self.upload_from_string(file.read(size), content_type, if_generation_match)
+
+
+class LocalBucket:
+    def __init__(self, name: str):
+        self.name = name
+        self.objects: dict[str, tuple[bytes, int]] = {}
+        self.generations = itertools.count(1)
+
+    def blob(self, name: str, **_options) -> LocalBlob:
+        return LocalBlob(self, name)
+
+    def get_blob(self, name: str):
+        return LocalBlob(self, name) if name in self.objects else None
+
+
+class LocalStorageClient:
+    project = "local"
+
+    def __init__(self):
+        self.buckets: dict[str, LocalBucket] = {}
+
+    def bucket(self, name: str) -> LocalBucket:
+        return self.buckets.setdefault(name, LocalBucket(name))
+
+
+class LocalLoadJob:
+    def __init__(self, rows: int, size: int):
+        now = datetime.now(timezone.utc)
+        self.job_id = f"local_{id(self):x}"
+        self.input_files, self.input_file_bytes = 1, size
+        self.output_rows, self.output_bytes = rows, size
+        self.created = self.started = self.ended = now
+        self._properties = {'statistics': {}}
+
+    def result(self):
+        return self
+
+
+class LocalBigQueryClient:
+    """Keeps loaded tables as frames; enough of bigquery.Client for direct loads."""
+
+    def __init__(self):
+        self.tables: dict[str, object] = {}
+        self.rows: dict[str, pl.DataFrame] = {}
+        self.jobs = 0
+
+    def get_table(self, table_id: str):
+        if table_id not in self.tables:
+            raise NotFound(table_id)
+        return self.tables[table_id]
+
+    def create_table(self, table):
+        table_id = f"{table.project}.{table.dataset_id}.{table.table_id}"
+        self.tables[table_id] = table
+        return table
+
+    def load_table_from_file(self, file, destination: str, size=None, job_config=None) -> LocalLoadJob:
+        df = pl.read_parquet(io.BytesIO(file.read(size)))
+        append = job_config is not None and job_config.write_disposition == "WRITE_APPEND"
+        if append and destination in self.rows:
+            df = pl.concat([self.rows[destination], df], how="diagonal_relaxed")
+        self.rows[destination] = df
+        self.jobs += 1
+        return LocalLoadJob(len(df), size or 0)
+
+
+def sample_frame(rows: int) -> pl.DataFrame:
+    return pl.DataFrame({
+        'team_abbr': [f"T{i:04d}" for i in range(rows)],
+        'team_name': [f"Team {i}" for i in range(rows)],
+        'team_conf': ["AFC" if i % 2 else "NFC" for i in range(rows)],
+        'team_id': list(range(rows)),
+    })
+
+
+def run_checks(extractor, gcs_writer, bq_loader, bq_client, table_id: str, frame: pl.DataFrame) -> list[str]:
+    problems = []
+    path = get_gcs_config().get_raw_path('nfl', DATA_TYPE)
+    manifests = gcs_writer.manifests
+    # serves whatever `frame` is bound to at each step
+    extractor.extract = lambda *_args, **_kwargs: frame
+
+    def extract_load():
+        return extractor.extract_load(DATA_TYPE, gcs_writer, bq_loader, table_id)
+
+    def expect(step: str, condition: bool, message: str):
+        if not condition:
+            problems.append(f"{step}: {message}")
+
+    def jobs() -> int:
+        return bq_client.jobs if bq_client is not None else 0
+
+    # 1. direct load
+    before = jobs()
+    _, direct_uri, loaded = extract_load()
+    uri = direct_uri
+    expect("direct", loaded, "frame wasn't loaded directly")
+    expect("direct", bool(uri), "frame wasn't archived to GCS")
+    expect("direct", manifests.loaded_directly(path), "manifest doesn't record a direct load")
+    if bq_client is not None:
+        expect("direct", jobs() == before + 1, f"expected 1 load job, got {jobs() - before}")
+        expect("direct", len(bq_client.rows.get(table_id, [])) == len(frame), "table doesn't hold the frame")
+    logger.info(f"direct: loaded={loaded} archived to {uri}")
+
+    # 2. unchanged frame is skipped
+    before = jobs()
+    _, _, loaded = extract_load()
+    expect("skip", not loaded, "unchanged frame was loaded again")
+    if bq_client is not None:
+        expect("skip", jobs() == before, "unchanged frame ran a load job")
+    logger.info(f"skip: loaded={loaded}")
+
+    # 3. a changed frame above the threshold goes to GCS for the load DAG
+    frame = sample_frame(len(frame) + 1)
+    extractor.config.direct_load_max_bytes = max(1, frame.estimated_size() // 2)
+    before = jobs()
+    _, uri, loaded = extract_load()
+    expect("fallback", not loaded, "frame over the threshold was loaded directly")
+    expect("fallback", bool(uri), "frame over the threshold wasn't written to GCS")
+    expect("fallback", uri != direct_uri, "fallback write overwrote the direct load's archive")
+    expect("fallback", not manifests.loaded_directly(path), "load DAG would still skip the new file")
+    if bq_client is not None:
+        expect("fallback", jobs() == before, "frame over the threshold ran a load job")
+    logger.info(f"fallback: loaded={loaded} written to {uri}")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000, help="rows in the synthetic frame")
+    parser.add_argument('--emulator', action='store_true', help="use the configured (emulator) clients")
+    args = parser.parse_args()
+
+    frame = sample_frame(args.rows)
+    config = IngestionConfig(
+        project_columns=False,
+        optimize_dtypes=False,
+        direct_load_max_bytes=frame.estimated_size() * 4,
+        archive_direct_loads=True,
+    )
+    extractor = NFLExtractor(config=config)
+    extractor.cache = None
+    bq_config = get_bigquery_config()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics = JsonLinesSink(os.path.join(tmp, "load_metrics.jsonl"))
+        if args.emulator:
+            gcs_config = get_gcs_config()
+            bq_client = None
+            gcs_writer = GCSWriter(bucket_name=gcs_config.bucket_name, project_id=gcs_config.project_id)
+            bq_loader = GCSToBigQueryLoader(project_id=bq_config.project_id, metrics_sink=metrics)
+            project = bq_config.project_id
+        else:
+            bq_client = LocalBigQueryClient()
+            gcs_writer = GCSWriter(bucket_name="local-raw", client=LocalStorageClient())
+            bq_loader = GCSToBigQueryLoader(project_id="local", client=bq_client, metrics_sink=metrics)
+            project = "local"
+
+        table_id = f"{project}.{bq_config.raw_dataset}.direct_load_check"
+        problems = run_checks(extractor, gcs_writer, bq_loader, bq_client, table_id, frame)
+        with open(metrics.path) as f:
+            states = [json.loads(line)['state'] for line in f]
+        logger.info(f"Load metrics recorded: {states}")
+
+    for problem in problems:
+        logger.error(problem)
+    if not problems:
+        logger.info("Direct load, skip and fallback behaved as expected")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
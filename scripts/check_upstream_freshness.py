@@ -0,0 +1,138 @@
+"""
+Report which nflverse release files changed since they were last extracted.
+
+By default probes the real release files for every nflreadpy dataset in the
+catalog and compares them with the fingerprints recorded in the GCS manifests
+(read-only: nothing is recorded).
+
+With --local, a local HTTP stand-in serves release metadata (ETag,
+Last-Modified, Content-Length) instead, fingerprints are kept in a temporary
+directory, and the freshness check is exercised end to end: everything is new
+on the first check, nothing after recording, and only the file bumped on the
+stand-in afterwards. Exits non-zero if any of that doesn't hold, so it doubles
+as an offline regression check.
+
+Usage:
+    python scripts/check_upstream_freshness.py
+    python scripts/check_upstream_freshness.py --datasets pbp schedules
+    python scripts/check_upstream_freshness.py --local
+"""
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from ingestion.catalog import CATALOG
+from ingestion.nfl.freshness import JsonFileStore, UpstreamFreshness, release_urls
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def serve_release_metadata(versions: dict[str, int]) -> ThreadingHTTPServer:
+    """
+    Answer HEAD for any path with metadata derived from versions[path] (default 1),
+    on a free local port in a background thread. Bump versions[path] to
+    "publish" a new release of that file.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            version = versions.get(self.path, 1)
+            digest = hashlib.sha256(f"{self.path}:{version}".encode()).hexdigest()
+            self.send_response(200)
+            self.send_header("ETag", f'"{digest[:16]}"')
+            self.send_header("Last-Modified", formatdate(1_700_000_000 + version * 3600, usegmt=True))
+            self.send_header("Content-Length", str(int(digest[:6], 16)))
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def check_all(freshness: UpstreamFreshness, specs) -> dict[str, dict]:
+    return {spec.name: freshness.changed(spec.name, spec.seasons()) for spec in specs}
+
+
+def local_check(specs) -> list[str]:
+    versions: dict[str, int] = {}
+    server = serve_release_metadata(versions)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    problems = []
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        freshness = UpstreamFreshness(JsonFileStore(state_dir), base_url=base_url)
+
+        first = check_all(freshness, specs)
+        for spec in specs:
+            if not first[spec.name]:
+                problems.append(f"{spec.name}: nothing changed on the first check")
+            freshness.record(spec.name, first[spec.name])
+
+        second = check_all(freshness, specs)
+        problems += [f"{name}: {sorted(changed)} changed after recording" for name, changed in second.items() if changed]
+
+        # publish a new release of one file; every season it covers is changed
+        bumped = specs[0]
+        urls = release_urls(bumped.name, bumped.seasons(), base_url)
+        url = urls[max(urls)]
+        versions[url.removeprefix(base_url)] = 2
+        third = check_all(freshness, specs)
+        for name, changed in third.items():
+            expected = {key for key, u in urls.items() if u == url} if name == bumped.name else set()
+            if set(changed) != expected:
+                problems.append(f"{name}: {sorted(changed)} changed after bumping {url}, expected {sorted(expected)}")
+        logger.info(f"After bumping {url}: {({name: sorted(changed) for name, changed in third.items() if changed})}")
+
+    server.shutdown()
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--datasets', nargs='*', default=None, help="catalog datasets to check (default: all nflreadpy ones)")
+    parser.add_argument('--local', action='store_true', help="check against a local stand-in serving release metadata")
+    args = parser.parse_args()
+
+    specs = [
+        spec for spec in CATALOG
+        if spec.source == 'nflreadpy' and (args.datasets is None or spec.name in args.datasets)
+    ]
+
+    if args.local:
+        problems = local_check(specs)
+        for problem in problems:
+            logger.error(problem)
+        if not problems:
+            logger.info(f"Freshness check behaved as expected for {len(specs)} datasets")
+        sys.exit(1 if problems else 0)
+
+    from ingestion.config import get_gcs_config
+    from ingestion.storage.gcs_writer import get_storage_client
+    from ingestion.storage.manifest import ManifestStore
+
+    config = get_gcs_config()
+    bucket = get_storage_client(config.project_id).bucket(config.bucket_name)
+    freshness = UpstreamFreshness(ManifestStore(bucket))
+    for name, changed in check_all(freshness, specs).items():
+        print(f"{name}: {', '.join(sorted(changed)) if changed else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
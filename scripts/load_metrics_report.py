@@ -0,0 +1,86 @@
+"""
+Summarise BigQuery load-job metrics written by GCSToBigQueryLoader.
+
+Compares each dataset's latest load with its recent history, flagging loads
+that ran much slower (or read much more) than usual, and ranks datasets by
+bytes loaded and slot time.
+
+Usage:
+    python scripts/load_metrics_report.py
+    python scripts/load_metrics_report.py --path ~/.cache/nfl_v3/load_metrics.jsonl --history 10
+"""
+import argparse
+import os
+import sys
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import polars as pl
+
+from ingestion.config import get_bigquery_config
+
+
+def load_metrics(path: str) -> pl.DataFrame:
+    return (
+        pl.read_ndjson(path, infer_schema_length=None)
+        .filter(pl.col('state') != 'SKIPPED')
+        .with_columns(pl.col('recorded_at').str.to_datetime(time_zone="UTC"))
+        .sort('recorded_at')
+    )
+
+
+def regressions(df: pl.DataFrame, history: int, threshold: float) -> pl.DataFrame:
+    """Latest load per dataset vs the median of its previous `history` loads."""
+    return (
+        df.group_by('dataset', maintain_order=True)
+        .agg(
+            pl.col('recorded_at').last().alias('last_load'),
+            pl.col('seconds').last().alias('seconds'),
+            pl.col('seconds').slice(0, pl.len() - 1).tail(history).median().alias('median_seconds'),
+            pl.col('input_bytes').last().alias('input_bytes'),
+            pl.col('input_bytes').slice(0, pl.len() - 1).tail(history).median().alias('median_input_bytes'),
+            pl.col('state').last().alias('state'),
+        )
+        .with_columns(
+            (pl.col('seconds') / pl.col('median_seconds')).round(2).alias('time_ratio'),
+            (pl.col('input_bytes') / pl.col('median_input_bytes')).round(2).alias('bytes_ratio'),
+        )
+        .with_columns(
+            ((pl.col('time_ratio') > threshold) | (pl.col('bytes_ratio') > threshold) | (pl.col('state') == 'FAILED'))
+            .fill_null(False)
+            .alias('regressed')
+        )
+        .sort(['regressed', 'time_ratio'], descending=True, nulls_last=True)
+    )
+
+
+def cost_by_dataset(df: pl.DataFrame) -> pl.DataFrame:
+    return (
+        df.group_by('dataset')
+        .agg(
+            pl.len().alias('loads'),
+            (pl.col('input_bytes').sum() / 1024**3).round(3).alias('input_gb'),
+            (pl.col('slot_millis').sum() / 1000).round(1).alias('slot_seconds'),
+            pl.col('seconds').mean().round(1).alias('mean_seconds'),
+        )
+        .sort('input_gb', descending=True)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default=get_bigquery_config().load_metrics_path, help="JSON-lines metrics file")
+    parser.add_argument('--history', type=int, default=5, help="previous loads to compare against")
+    parser.add_argument('--threshold', type=float, default=1.5, help="ratio to the median that counts as a regression")
+    args = parser.parse_args()
+
+    df = load_metrics(os.path.expanduser(args.path))
+    with pl.Config(tbl_rows=-1, tbl_cols=-1):
+        print(regressions(df, args.history, args.threshold))
+        print(cost_by_dataset(df))
+
+
+if __name__ == "__main__":
+    main()
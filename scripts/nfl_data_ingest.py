@@ -6,9 +6,11 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from ingestion.catalog import CATALOG
 from ingestion.nfl.extractor import NFLExtractor
-from ingestion.storage import GCSWriter, GCSToBigQueryLoader
-from ingestion.config import get_bigquery_config
+from ingestion.storage import GCSWriter, GCSToBigQueryLoader, LoadRequest
+from ingestion.storage.manifest import path_from_uri
+from ingestion.config import get_bigquery_config, get_gcs_config, get_table_layout
 
 # Setup logging
 logging.basicConfig(
@@ -18,15 +20,12 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# params 
-seasons = [2020, 2021, 2022, 2023, 2024, 2025]
-
 # GCS config
 GCS_BUCKET = os.getenv("GCS_RAW_BUCKET", "nfl-analytics-dev")
 PROJECT_ID = os.getenv("GCP_PROJECT_ID", "sports-analytics-475802")
 
 def ingest_all_data():
-    """Get key datasets: pbp, schedules, rosters, teams"""
+    """Backfill every nflreadpy dataset in the catalog, then load them together"""
     logger.info("=== Starting Core Data Ingestion ===")
 
     extractor = NFLExtractor()
@@ -35,96 +34,68 @@ def ingest_all_data():
     gcs_writer = GCSWriter(bucket_name=GCS_BUCKET, project_id=PROJECT_ID)
     bq_loader = GCSToBigQueryLoader(project_id=PROJECT_ID)
 
-    datasets = [
-
-        # core game data
-        ('pbp', 'play_by_play'),
-        ('schedules', 'schedules'),
-
-        # roster data, including context re: injuries, trades, starter changes, etc.
-        ('rosters', 'rosters'),
-        ('rosters_weekly', 'rosters_weekly'),
-        ('depth_charts', 'depth_charts'),
-        ('injuries', 'injuries'),
-        ('trades', 'trades'),
-        ('players', 'players'),
-
-        # player performance data
-        ('player_stats', 'player_stats'),
-        ('snap_counts', 'snap_counts'),
-
-        # advanced data
-        ('nextgen_stats', 'nextgen_stats'),
-        ('participation', 'participation'),
-
-        # other stuff
-        ('officials', 'officials'),
-        ('combine', 'combine'),
-        ('draft_picks', 'draft_picks'),
-        ('contracts', 'contracts'),
-
-        # fantasy
-        ('ff_playerids', 'ff_playerids'),
-        ('ff_opportunity', 'ff_opportunity'),
-        ('ff_rankings', 'ff_rankings')
-    ]
-
-    for data_type, table_name in datasets:
+    # extract everything first, then submit the loads together
+    loads = []
+
+    for spec in CATALOG:
+        if spec.source != 'nflreadpy':
+            continue
+
+        data_type = spec.name
+        seasons = spec.seasons()
+        table_id = f"{PROJECT_ID}.{config.raw_dataset}.{spec.raw_table}"
         logger.info(f"Extracting {data_type} for seasons {seasons}")
 
         try:
-            df, gcs_uri = extractor.extract_write_gcs(
-                data_type=data_type,
-                gcs_writer=gcs_writer,
-                seasons=seasons
-            )
+            if spec.by_season:
+                # one season= partition per season, extracted in parallel
+                gcs_uri = list(extractor.extract_write_gcs_by_season(
+                    data_type=data_type,
+                    gcs_writer=gcs_writer,
+                    seasons=seasons
+                ).values())
+            else:
+                # small frames are loaded straight into BigQuery here
+                df, gcs_uri, loaded = extractor.extract_load(
+                    data_type=data_type,
+                    gcs_writer=gcs_writer,
+                    bq_loader=bq_loader,
+                    table_id=table_id,
+                    seasons=seasons
+                )
+                if loaded:
+                    logger.info(f"Loaded {len(df)} rows of {data_type} directly")
+                    continue
+                if gcs_uri:
+                    logger.info(f"Wrote {len(df)} rows to {gcs_uri}")
 
             if not gcs_uri: 
                 logger.warning(f"No data written to GCS for {data_type}, skipping")
                 continue
 
-            logger.info(f"Wrote {len(df)} rows to {gcs_uri}")
+            uris = [gcs_uri] if isinstance(gcs_uri, str) else gcs_uri
+            if all(gcs_writer.manifests.is_loaded(path_from_uri(uri), uri) for uri in uris):
+                logger.info(f"{data_type} unchanged since last load, skipping")
+                bq_loader.record_skip(table_id, uris)
+                continue
 
-            logger.info(f"Loading {data_type} to {config.raw_dataset}.{table_name}")
-            table_id = f"{PROJECT_ID}.{config.raw_dataset}.{table_name}"
-            bq_loader.load_from_gcs(
-                gcs_uri=gcs_uri,
+            loads.append(LoadRequest(
+                gcs_uri=uris,
                 table_id=table_id,
-                write_mode='replace'
-            )
-
-            # validate
-            row_count = bq_loader.get_row_count(table_id)
-            logger.info(f"{data_type}: {row_count} rows loaded successfully")
+                write_mode='replace',
+                schema=gcs_writer.schemas.bigquery_schema(get_gcs_config().get_raw_path('nfl', data_type)),
+                layout=get_table_layout(data_type)
+            ))
         
         except Exception as e:
-            logger.error(f"Failed to load {data_type}: {e}")
-    
-    # teams data
-    logger.info("=== Starting Teams Data Ingestion // NO SEASON PARAM ===")
-    try:
-        df, gcs_uri = extractor.extract_write_gcs(
-            data_type='teams',
-            gcs_writer=gcs_writer
-        )
-
-        if gcs_uri:
-            logger.info(f"Wrote {len(df)} rows to {gcs_uri}")
-
-            logger.info(f"Loading teams to {config.raw_dataset}.teams")
-            table_id = f"{PROJECT_ID}.{config.raw_dataset}.teams"
-            bq_loader.load_from_gcs(
-                gcs_uri=gcs_uri,
-                table_id=table_id,
-                write_mode='replace'
-            )
-
-            # validate
-            row_count = bq_loader.get_row_count(table_id)
-            logger.info(f"teams: {row_count} rows loaded successfully")
-        
-    except Exception as e:
-        logger.error(f"Failed to load teams: {e}")
+            logger.error(f"Failed to extract {data_type}: {e}")
+
+    logger.info(f"=== Loading {len(loads)} tables to {config.raw_dataset} ===")
+    for result in bq_loader.load_many(loads):
+        if not result.ok:
+            continue
+        for uri in result.uris:
+            gcs_writer.manifests.mark_loaded(path_from_uri(uri), uri)
 
     logger.info("=== Ingestion finished ===")
 
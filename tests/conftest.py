@@ -0,0 +1,62 @@
+import itertools
+
+import pytest
+from google.cloud.exceptions import NotFound, PreconditionFailed
+
+from ingestion.storage.manifest import ManifestStore
+
+
+class MemoryBlob:
+    """GCS blob kept in a MemoryBucket, honouring generation preconditions."""
+
+    def __init__(self, bucket: "MemoryBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def generation(self) -> int:
+        return self.bucket.objects[self.name][1]
+
+    def _check(self, if_generation_match):
+        current = self.bucket.objects.get(self.name, (None, 0))[1]
+        if if_generation_match is not None and if_generation_match != current:
+            raise PreconditionFailed(self.name)
+
+    def download_as_bytes(self, if_generation_match=None) -> bytes:
+        if self.name not in self.bucket.objects:
+            raise NotFound(self.name)
+        self._check(if_generation_match)
+        return self.bucket.objects[self.name][0]
+
+    def download_as_text(self, if_generation_match=None) -> str:
+        return self.download_as_bytes(if_generation_match).decode()
+
+    def upload_from_string(self, data, content_type=None, if_generation_match=None, **_options) -> None:
+        self._check(if_generation_match)
+        data = data.encode() if isinstance(data, str) else data
+        self.bucket.objects[self.name] = (data, next(self.bucket.generations))
+        self.content_type = content_type
+
+
+class MemoryBucket:
+    name = "test-bucket"
+
+    def __init__(self):
+        self.objects: dict[str, tuple[bytes, int]] = {}
+        self.generations = itertools.count(1)
+
+    def blob(self, name: str, **_options) -> MemoryBlob:
+        return MemoryBlob(self, name)
+
+    def get_blob(self, name: str):
+        return MemoryBlob(self, name) if name in self.objects else None
+
+
+@pytest.fixture
+def bucket() -> MemoryBucket:
+    return MemoryBucket()
+
+
+@pytest.fixture
+def manifests(bucket) -> ManifestStore:
+    return ManifestStore(bucket)
@@ -0,0 +1,38 @@
+import pytest
+
+from ingestion.catalog import CATALOG, DATASETS, DatasetSpec, get_dataset, groups, raw_table
+
+
+def test_seasons_run_from_first_season_to_the_lagged_current_one():
+    spec = DatasetSpec('nextgen_stats', 'g', first_season=2020, season_lag=1, partition_keys=('season',))
+    assert spec.seasons(2024) == [2020, 2021, 2022, 2023]
+    assert DatasetSpec('schedules', 'g', first_season=2022).seasons(2024) == [2022, 2023, 2024]
+
+
+def test_seasonless_sources_have_no_seasons():
+    assert DatasetSpec('teams', 'g', first_season=None).seasons(2024) is None
+
+
+def test_only_season_partitioned_datasets_are_extracted_by_season():
+    assert get_dataset('schedules').by_season
+    assert not get_dataset('fines').by_season
+    assert not get_dataset('teams').by_season
+
+
+def test_raw_table_falls_back_to_the_data_type():
+    assert raw_table('pbp') == 'play_by_play'
+    assert raw_table('teams') == 'teams'
+    assert raw_table('not_cataloged') == 'not_cataloged'
+    assert get_dataset('injuries').changelog_table == 'injuries_changelog'
+
+
+def test_get_dataset_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown dataset"):
+        get_dataset('nope')
+
+
+def test_catalog_names_are_unique_and_grouped_in_order():
+    assert len(DATASETS) == len(CATALOG)
+    by_group = groups()
+    assert sum(len(specs) for specs in by_group.values()) == len(CATALOG)
+    assert by_group['fines'] == [get_dataset('fines'), get_dataset('fines_week_summary')]
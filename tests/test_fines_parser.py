@@ -0,0 +1,62 @@
+import logging
+import os
+
+import pytest
+
+from ingestion.scrapers import fines_parser
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'ingestion', 'scrapers', 'fixtures', 'gameday_accountability.html',
+)
+
+
+@pytest.fixture(scope="module")
+def page() -> str:
+    with open(FIXTURE) as f:
+        return f.read()
+
+
+def test_parse_reads_every_week_of_the_fixture(page):
+    weekResults = fines_parser.parse(page)
+
+    assert list(weekResults) == [f"week-{week}" for week in range(7, 0, -1)]
+    week = weekResults['week-7']
+    assert week['weekSummary'] == {'Total Plays': '2,428', 'Resulting in Fines': '23', '% Of All Plays': '.95%'}
+    assert week['playerDetails'][0] == fines_parser.EXPECTED_HEADERS
+    assert week['playerDetails'][1] == [
+        'AZ', 'Josh Sweat', '2', '10:52', 'Unnecessary Roughness', 'Facemask', '$11,593'
+    ]
+    assert len(week['playerDetails']) == 24
+    assert fines_parser.structure_problems(weekResults) == []
+
+
+@pytest.mark.parametrize("backend", list(fines_parser.PARSERS))
+def test_backends_agree_with_html_parser(page, backend):
+    assert fines_parser.parse(page, backend) == fines_parser.parse(page, 'html.parser')
+
+
+def test_unknown_backend_is_rejected(page):
+    with pytest.raises(ValueError):
+        fines_parser.parse(page, 'regex')
+
+
+def test_falls_back_with_a_warning_when_lxml_is_missing(page, monkeypatch, caplog):
+    def _missing(_data):
+        raise ImportError("No module named 'lxml'")
+
+    monkeypatch.setitem(fines_parser.PARSERS, 'lxml', _missing)
+    with caplog.at_level(logging.WARNING, logger=fines_parser.__name__):
+        weekResults = fines_parser.parse(page, 'lxml')
+
+    assert weekResults == fines_parser.parse(page, 'html.parser')
+    assert "falling back" in caplog.text
+
+
+def test_structure_problems_flags_layout_changes():
+    assert fines_parser.structure_problems({}) == [f"no div.{fines_parser.TABLE_CLASS} containers found"]
+
+    problems = fines_parser.structure_problems({
+        None: {'weekSummary': {}, 'playerDetails': [['Team', 'Player']]},
+    })
+    assert len(problems) == 3
@@ -0,0 +1,118 @@
+import polars as pl
+import pytest
+
+from ingestion.scrapers.nfl_fines_scraper import (
+    OVERTIME_QUARTER,
+    UNKNOWN_WEEK,
+    NFLFinesScraper,
+    parse_int,
+    parse_quarter,
+    week_number,
+    week_partition,
+)
+
+
+def parsed(expr, values: list) -> list:
+    df = pl.DataFrame({'value': values}, schema={'value': pl.String})
+    return df.select(expr(pl.col('value')).alias('parsed'))['parsed'].to_list()
+
+
+def test_parse_int_strips_formatting():
+    assert parsed(parse_int, ["$11,593", "23", "", None]) == [11593, 23, None, None]
+
+
+def test_parse_quarter_maps_overtime():
+    assert parsed(parse_quarter, ["1", " 4 ", "OT", "ot", "Overtime"]) == [1, 4, *[OVERTIME_QUARTER] * 3]
+
+
+def test_parse_quarter_leaves_unknown_labels_null():
+    assert parsed(parse_quarter, ["Half", "", None]) == [None, None, None]
+
+
+@pytest.mark.parametrize("week, number, partition", [
+    ("week-7", 7, "07"),
+    ("week-18", 18, "18"),
+    ("preseason", None, "preseason"),
+    (None, None, "unknown"),
+])
+def test_week_labels(week, number, partition):
+    assert week_number(week) == number
+    assert week_partition(week) == partition
+
+
+def test_to_frames_types_fines_and_keeps_quarter_label():
+    scraper = NFLFinesScraper(season=2025, url="https://example.com/fines")
+    weekResults = {
+        'week-3': {
+            'weekSummary': {'Total Plays': '2,428', 'Resulting in Fines': '2', '% Of All Plays': '.08%'},
+            'playerDetails': [
+                ['Club', 'Player', 'Quarter', 'Time', 'Fine Category', 'Description', 'Amount'],
+                ['AZ', 'Josh Sweat', '2', '10:52', 'Unnecessary Roughness', 'Facemask', '$11,593'],
+                ['KC', 'Someone', 'OT', '1:02', 'Taunting', 'Taunting', '$5,000'],
+            ],
+        },
+    }
+    fines, summaries = scraper.to_frames(weekResults)
+
+    assert fines['quarter'].to_list() == [2, OVERTIME_QUARTER]
+    assert fines['quarter_label'].to_list() == ["2", "OT"]
+    assert fines['amount'].to_list() == [11593, 5000]
+    assert fines['week'].to_list() == [3, 3]
+    assert fines['season'].to_list() == [2025, 2025]
+    assert summaries['total_plays'].to_list() == [2428]
+    assert summaries['pct_of_all_plays'].to_list() == [0.08]
+
+
+class StubWriter:
+    """Just the manifests the scraper keeps its state in."""
+
+    def __init__(self, manifests):
+        self.manifests = manifests
+
+
+def week(number: int | None, fines: int) -> str:
+    attribute = f' data-week="week-{number}"' if number else ""
+    return (
+        f'<div class="select-table__table"{attribute}><p>Resulting in Fines: {fines}</p>'
+        f'<table><tr><th>Club</th></tr></table></div>'
+    )
+
+
+def scraper_for(*weeks: str) -> NFLFinesScraper:
+    scraper = NFLFinesScraper(season=2025, parser='html.parser', url="https://example.com/fines")
+    scraper.fetch = lambda _state=None: ("".join(weeks), {'etag': '"v1"'})
+    return scraper
+
+
+def test_scrape_changes_only_returns_new_or_changed_weeks():
+    changed, state = scraper_for(week(1, 3), week(2, 4)).scrape_changes({})
+    assert sorted(changed) == ["week-1", "week-2"]
+
+    changed, state = scraper_for(week(1, 3), week(2, 5)).scrape_changes(state)
+    assert list(changed) == ["week-2"]
+    assert state['etag'] == '"v1"'
+
+
+def test_week_without_data_week_is_stable_across_runs(manifests):
+    writer = StubWriter(manifests)
+    scraper = scraper_for(week(None, 3))
+
+    changed, state = scraper.scrape_changes(scraper.load_state(writer))
+    assert list(changed) == [UNKNOWN_WEEK]
+    scraper.save_state(writer, state)
+
+    # the state round-trips through the manifest JSON
+    changed, _ = scraper.scrape_changes(scraper.load_state(writer))
+    assert changed == {}
+
+
+def test_state_is_kept_in_the_fines_manifest(manifests):
+    writer = StubWriter(manifests)
+    scraper = scraper_for()
+    manifests.update("raw/nfl/fines", partitions={'season=2025/week=01': {}})
+
+    scraper.save_state(writer, {'weeks': {'week-1': "abc"}})
+    manifest = manifests.read("raw/nfl/fines")
+    assert manifest['scraper'] == {'weeks': {'week-1': "abc"}}
+    assert 'season=2025/week=01' in manifest['partitions']
+    assert scraper.load_state(writer) == {'weeks': {'week-1': "abc"}}
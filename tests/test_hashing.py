@@ -0,0 +1,75 @@
+import polars as pl
+
+from ingestion.utils.hashing import frame_hash, group_hashes, row_hashes, schema_hash
+
+
+def games() -> pl.DataFrame:
+    return pl.DataFrame({
+        'game_id': ["g1", "g1", "g2"],
+        'play_id': [1, 2, 1],
+        'yards': [5, -2, 12],
+    })
+
+
+def test_frame_hash_is_stable_for_equal_frames():
+    assert frame_hash(games()) == frame_hash(games())
+
+
+def test_frame_hash_changes_with_values_order_and_schema():
+    df = games()
+    assert frame_hash(df) != frame_hash(df.with_columns(pl.col('yards') + 1))
+    assert frame_hash(df) != frame_hash(df.reverse())
+    assert frame_hash(df) != frame_hash(df.with_columns(pl.col('yards').cast(pl.Float64)))
+
+
+def test_frame_hash_of_empty_frame_depends_on_schema():
+    assert frame_hash(pl.DataFrame(schema={'a': pl.Int64})) != frame_hash(pl.DataFrame(schema={'a': pl.String}))
+
+
+def test_frame_hash_hashes_categoricals_by_value():
+    first = pl.DataFrame({'team': ["KC", "BUF"]}).with_columns(pl.col('team').cast(pl.Categorical))
+    # "BUF" is seen first here, so its physical code differs
+    second = (
+        pl.DataFrame({'team': ["BUF", "KC"]})
+        .with_columns(pl.col('team').cast(pl.Categorical))
+        .reverse()
+    )
+    assert frame_hash(first) == frame_hash(second)
+
+
+def test_group_hashes_are_per_key_and_order_insensitive():
+    df = games()
+    hashes = group_hashes(df, 'game_id')
+    assert set(hashes) == {"g1", "g2"}
+    assert group_hashes(df.reverse(), 'game_id') == hashes
+
+
+def test_group_hashes_only_change_for_the_changed_group():
+    df = games()
+    changed = df.with_columns(
+        pl.when(pl.col('game_id') == "g2").then(pl.col('yards') + 1).otherwise(pl.col('yards')).alias('yards')
+    )
+    before, after = group_hashes(df, 'game_id'), group_hashes(changed, 'game_id')
+    assert before["g1"] == after["g1"]
+    assert before["g2"] != after["g2"]
+
+
+def test_group_hashes_count_duplicate_rows():
+    df = games()
+    assert group_hashes(pl.concat([df, df.head(1)]), 'game_id')["g1"] != group_hashes(df, 'game_id')["g1"]
+
+
+def test_group_hashes_of_empty_frame():
+    assert group_hashes(games().clear(), 'game_id') == {}
+
+
+def test_row_hashes_match_for_equal_rows():
+    hashes = row_hashes(pl.DataFrame({'a': [1, 2, 1], 'b': ["x", "y", "x"]}))
+    assert hashes[0] == hashes[2]
+    assert hashes[0] != hashes[1]
+
+
+def test_schema_hash_ignores_values():
+    df = games()
+    assert schema_hash(df) == schema_hash(df.with_columns(pl.col('yards') * 2))
+    assert schema_hash(df) != schema_hash(df.rename({'yards': 'yds'}))
@@ -0,0 +1,63 @@
+import polars as pl
+
+from ingestion.nfl.in_season import CHANGE_TYPE_COLUMN, current_week, diff_rows, week_rows
+
+
+def injuries() -> pl.DataFrame:
+    return pl.DataFrame({
+        'gsis_id': ["p1", "p2", "p3"],
+        'week': [5, 5, 5],
+        'status': ["Out", "Questionable", "Doubtful"],
+    })
+
+
+def changes_by_type(changes: pl.DataFrame) -> dict[str, list[str]]:
+    return {
+        change_type: sorted(changes.filter(pl.col(CHANGE_TYPE_COLUMN) == change_type).get_column('gsis_id'))
+        for change_type in ('added', 'removed')
+    }
+
+
+def test_diff_rows_without_previous_marks_everything_added():
+    changes = diff_rows(None, injuries())
+    assert changes_by_type(changes) == {'added': ["p1", "p2", "p3"], 'removed': []}
+
+
+def test_diff_rows_of_identical_frames_is_empty():
+    assert diff_rows(injuries(), injuries()).is_empty()
+
+
+def test_diff_rows_shows_a_changed_row_as_removed_and_added():
+    current = injuries().with_columns(
+        pl.when(pl.col('gsis_id') == "p2").then(pl.lit("Out")).otherwise(pl.col('status')).alias('status')
+    )
+    changes = diff_rows(injuries(), current)
+    assert changes_by_type(changes) == {'added': ["p2"], 'removed': ["p2"]}
+    assert changes.filter(pl.col(CHANGE_TYPE_COLUMN) == 'added')['status'].to_list() == ["Out"]
+
+
+def test_diff_rows_added_and_dropped_rows():
+    current = pl.concat([
+        injuries().filter(pl.col('gsis_id') != "p3"),
+        pl.DataFrame({'gsis_id': ["p4"], 'week': [5], 'status': ["Out"]}),
+    ])
+    assert changes_by_type(diff_rows(injuries(), current)) == {'added': ["p4"], 'removed': ["p3"]}
+
+
+def test_diff_rows_ignores_a_column_added_upstream():
+    current = injuries().with_columns(pl.lit("note").alias('report'))
+    assert diff_rows(injuries(), current).is_empty()
+
+
+def test_week_rows_filters_to_the_week():
+    df = pl.DataFrame({'week': [4, 5, 5], 'x': [1, 2, 3]})
+    assert week_rows(df, 5)['x'].to_list() == [2, 3]
+
+
+def test_week_rows_keeps_frames_without_weeks_whole():
+    assert len(week_rows(pl.DataFrame({'x': [1, 2]}), 5)) == 2
+    assert len(week_rows(pl.DataFrame({'week': [None, None], 'x': [1, 2]}), 5)) == 2
+
+
+def test_current_week_is_the_latest_in_the_extract():
+    assert current_week(pl.DataFrame({'week': [3, 7, 5]})) == 7
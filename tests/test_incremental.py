@@ -0,0 +1,45 @@
+import polars as pl
+
+from ingestion.nfl.incremental import PbpWatermark, _remove_batch, completed_games
+
+
+class StubWriter:
+    def __init__(self, bucket):
+        self.bucket = bucket
+
+
+def test_completed_games_drops_games_in_progress():
+    df = pl.DataFrame({
+        'game_id': ["g1", "g1", "g2"],
+        'desc': ["Kickoff", "END GAME", "Kickoff"],
+    })
+    assert completed_games(df)['game_id'].unique().to_list() == ["g1"]
+
+
+def test_completed_games_without_descriptions_keeps_everything():
+    df = pl.DataFrame({'game_id': ["g1", "g2"]})
+    assert completed_games(df).equals(df)
+
+
+def test_watermark_starts_empty(bucket):
+    assert PbpWatermark(StubWriter(bucket), path="wm.json").load() == {'games': {}, 'pending': []}
+
+
+def test_watermark_modify_keeps_a_concurrent_writers_batch(bucket):
+    watermark = PbpWatermark(StubWriter(bucket), path="wm.json")
+    loaded = {'uri': "a", 'game_ids': ["g1"]}
+    queued = {'uri': "b", 'game_ids': ["g2"]}
+    watermark.modify(lambda state: state['pending'].append(loaded))
+
+    calls = []
+
+    def _remove_loaded(state):
+        if not calls:
+            # the extract queues another batch between this read and its write
+            watermark.modify(lambda other: other['pending'].append(queued))
+        calls.append(1)
+        _remove_batch(loaded, state)
+
+    watermark.modify(_remove_loaded)
+    assert len(calls) == 2
+    assert watermark.load()['pending'] == [queued]
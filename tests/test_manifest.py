@@ -0,0 +1,80 @@
+import pytest
+
+from ingestion.storage.manifest import MAX_UPDATE_ATTEMPTS, path_from_uri, split_partition_path
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("raw/nfl/pbp", ("raw/nfl/pbp", "")),
+    ("raw/nfl/pbp/season=2025", ("raw/nfl/pbp", "season=2025")),
+    ("raw/nfl/fines/season=2025/week=07", ("raw/nfl/fines", "season=2025/week=07")),
+])
+def test_split_partition_path(path, expected):
+    assert split_partition_path(path) == expected
+
+
+@pytest.mark.parametrize("uri, expected", [
+    ("gs://bucket/raw/nfl/teams/2025-01-01_00-00-00_ab12cd34.parquet", "raw/nfl/teams"),
+    ("gs://bucket/raw/nfl/pbp/season=2024/2025-01-01_00-00-00_ab12cd34.parquet", "raw/nfl/pbp/season=2024"),
+    # raw files go in a <timestamp>/ folder under their prefix
+    ("gs://bucket/raw/nfl/fines/2025-01-01_00-00-00/fines.json", "raw/nfl/fines"),
+])
+def test_path_from_uri(uri, expected):
+    assert path_from_uri(uri) == expected
+
+
+def test_modify_creates_and_updates(manifests):
+    manifests.modify("raw/nfl/teams", lambda manifest: manifest.update(uri="a"))
+    manifests.modify("raw/nfl/teams", lambda manifest: manifest.update(row_count=3))
+    assert manifests.read("raw/nfl/teams") == {'uri': "a", 'row_count': 3}
+
+
+def test_modify_retries_on_a_concurrent_write(manifests):
+    path = "raw/nfl/teams"
+    manifests.update(path, writers=["first"])
+
+    calls = []
+
+    def _append(manifest):
+        if not calls:
+            # another writer gets in between this read and its write
+            manifests.update(path, writers=[*manifest['writers'], "concurrent"])
+        calls.append(1)
+        manifest['writers'].append("second")
+
+    manifests.modify(path, _append)
+    assert len(calls) == 2
+    assert manifests.read(path)['writers'] == ["first", "concurrent", "second"]
+
+
+def test_modify_gives_up_after_max_attempts(manifests):
+    path = "raw/nfl/teams"
+    manifests.update(path, n=0)
+
+    def _always_conflict(manifest):
+        manifests.update(path, n=manifest['n'] + 1)
+
+    with pytest.raises(RuntimeError):
+        manifests.modify(path, _always_conflict)
+    assert manifests.read(path)['n'] == MAX_UPDATE_ATTEMPTS
+
+
+def test_record_write_registers_partition_in_dataset_manifest(manifests):
+    uri = "gs://bucket/raw/nfl/pbp/season=2024/file.parquet"
+    manifests.record_write("raw/nfl/pbp/season=2024", uri, content_hash="h", row_count=2, columns=['season'])
+
+    assert manifests.latest_uri("raw/nfl/pbp/season=2024") == uri
+    partitions = manifests.partitions("raw/nfl/pbp")
+    assert list(partitions) == ["season=2024"]
+    assert partitions["season=2024"]['keys_in_data'] == ['season']
+
+
+def test_is_loaded_follows_mark_loaded(manifests):
+    path, uri = "raw/nfl/teams", "gs://bucket/raw/nfl/teams/file.parquet"
+    manifests.record_write(path, uri, content_hash="h")
+    assert not manifests.is_loaded(path, uri)
+
+    manifests.mark_loaded(path, uri)
+    assert manifests.is_loaded(path, uri)
+
+    manifests.record_write(path, "gs://bucket/raw/nfl/teams/newer.parquet", content_hash="h2")
+    assert not manifests.is_loaded(path, "gs://bucket/raw/nfl/teams/newer.parquet")
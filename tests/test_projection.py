@@ -0,0 +1,57 @@
+import polars as pl
+
+from ingestion.nfl.projection import ColumnProjector, _referenced_columns
+
+EXPLICIT = """
+with source as (
+    select * from {{ source('nfl_raw', 'teams') }}
+),
+
+renamed as (
+    select
+          team_abbr
+        , team_name as name  -- team_color is not used
+    from source
+)
+
+select * from renamed
+"""
+
+PASSTHROUGH = """
+with source as (
+    select * from {{ source('nfl_raw', 'teams') }}
+),
+
+staged as (
+    select * from source
+)
+
+select * from staged
+"""
+
+
+def test_referenced_columns_of_an_explicit_model():
+    columns = _referenced_columns(EXPLICIT)
+    assert {'team_abbr', 'team_name'} <= columns
+    assert 'team_color' not in columns
+    assert 'nfl_raw' not in columns
+
+
+def test_star_over_the_source_passes_every_column_through():
+    assert _referenced_columns(PASSTHROUGH) is None
+
+
+def test_project_drops_unreferenced_columns_but_keeps_keys(tmp_path):
+    (tmp_path / "stg_teams.sql").write_text(EXPLICIT)
+    df = pl.DataFrame({'team_abbr': ["KC"], 'team_name': ["Chiefs"], 'team_color': ["red"], 'season': [2025]})
+
+    projected, report = ColumnProjector(str(tmp_path)).project('teams', df)
+    assert projected.columns == ['team_abbr', 'team_name', 'season']
+    assert report.dropped == ['team_color']
+
+
+def test_project_passes_through_data_types_without_a_model(tmp_path):
+    df = pl.DataFrame({'a': [1]})
+    projected, report = ColumnProjector(str(tmp_path)).project('teams', df)
+    assert projected.equals(df)
+    assert report.dropped == []
@@ -0,0 +1,93 @@
+import polars as pl
+import pytest
+
+from ingestion.schema_registry import SchemaRegistry, bigquery_field, drop_untyped
+
+PATH = "raw/nfl/pbp"
+
+
+@pytest.fixture
+def registry(manifests) -> SchemaRegistry:
+    return SchemaRegistry(manifests)
+
+
+def types(registry: SchemaRegistry) -> dict[str, str]:
+    return {f['name']: f['type'] for f in registry.fields(PATH)}
+
+
+@pytest.mark.parametrize("dtype, expected", [
+    (pl.Int32, "INT64"),
+    (pl.Float32, "FLOAT64"),
+    (pl.Categorical, "STRING"),
+    (pl.Datetime("us", "UTC"), "TIMESTAMP"),
+    (pl.Datetime("us"), "DATETIME"),
+    (pl.Date, "DATE"),
+])
+def test_bigquery_field_types(dtype, expected):
+    assert bigquery_field("x", dtype) == {'name': "x", 'type': expected, 'mode': "NULLABLE"}
+
+
+def test_bigquery_field_lists_and_nulls():
+    assert bigquery_field("x", pl.List(pl.String))['mode'] == "REPEATED"
+    assert bigquery_field("x", pl.Null) is None
+    assert bigquery_field("x", pl.List(pl.Null)) is None
+
+
+def test_register_appends_new_columns(registry):
+    registry.register(PATH, {'game_id': pl.String, 'yds': pl.Int64})
+    registry.register(PATH, {'game_id': pl.String, 'epa': pl.Float64})
+    assert types(registry) == {'game_id': "STRING", 'yds': "INT64", 'epa': "FLOAT64"}
+
+
+def test_register_widens_int_to_float(registry):
+    registry.register(PATH, {'yds': pl.Int64})
+    registry.register(PATH, {'yds': pl.Float64})
+    assert types(registry) == {'yds': "FLOAT64"}
+
+    # never narrowed back
+    registry.register(PATH, {'yds': pl.Int64})
+    assert types(registry) == {'yds': "FLOAT64"}
+
+
+def test_register_leaves_all_null_columns_untyped_until_they_have_values(registry):
+    registry.register(PATH, {'game_id': pl.String, 'cpoe': pl.Null})
+    assert types(registry) == {'game_id': "STRING"}
+    assert registry.null_columns(PATH) == ['cpoe']
+
+    registry.register(PATH, {'game_id': pl.String, 'cpoe': pl.Float64})
+    assert types(registry) == {'game_id': "STRING", 'cpoe': "FLOAT64"}
+    assert registry.null_columns(PATH) == []
+
+
+def test_register_persists_to_the_manifest(registry, manifests):
+    registry.register(PATH, {'game_id': pl.String})
+    assert [f['name'] for f in SchemaRegistry(manifests).fields(PATH)] == ['game_id']
+
+
+def test_conform_casts_losslessly_to_registered_types(registry):
+    registry.register(PATH, {'yds': pl.Float64, 'label': pl.String, 'cpoe': pl.Float64})
+    df = pl.DataFrame({'yds': [1, 2], 'label': [1, 2], 'cpoe': [None, None]})
+
+    conformed = registry.conform(PATH, df)
+    assert conformed.schema == pl.Schema({'yds': pl.Float64, 'label': pl.String, 'cpoe': pl.Float64})
+
+
+def test_conform_leaves_widening_and_unsafe_mismatches_alone(registry):
+    registry.register(PATH, {'yds': pl.Int64, 'flag': pl.Boolean})
+    df = pl.DataFrame({'yds': [1.5], 'flag': ["yes"]})
+    assert registry.conform(PATH, df).schema == df.schema
+
+
+def test_conform_keeps_unregistered_nulls_for_drop_untyped(registry):
+    df = pl.DataFrame({'game_id': ["g1"], 'cpoe': [None]})
+    conformed = registry.conform(PATH, df)
+    assert conformed.schema['cpoe'] == pl.Null
+    assert drop_untyped(conformed).columns == ['game_id']
+
+
+def test_bigquery_schema_adds_placeholders_for_untyped_columns(registry):
+    assert registry.bigquery_schema(PATH) is None
+
+    registry.register(PATH, {'game_id': pl.String, 'cpoe': pl.Null})
+    schema = registry.bigquery_schema(PATH)
+    assert [(f.name, f.field_type) for f in schema] == [('game_id', "STRING"), ('cpoe', "STRING")]